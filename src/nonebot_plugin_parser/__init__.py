@@ -1,14 +1,15 @@
-import asyncio
-
-from nonebot import logger, require
+from nonebot import logger, require, get_driver
 from nonebot.plugin import PluginMetadata, inherit_supported_adapters
 
 require("nonebot_plugin_alconna")
 require("nonebot_plugin_uninfo")
 
-from .utils import safe_unlink
-from .config import Config, pconfig
-from .matchers import clear_result_cache
+from .cache import DISK_CACHE
+from .config import Config
+from .matchers import purge_result_cache
+from .parsers.base import REDIRECTS
+from .matchers.rule import PREFILTER_STATS
+from .parsers.bilibili.credential import CREDENTIAL
 
 __plugin_meta__ = PluginMetadata(
     name="链接分享解析 Alconna 版",
@@ -29,21 +30,31 @@ require("nonebot_plugin_apscheduler")
 from nonebot_plugin_apscheduler import scheduler
 
 
-@scheduler.scheduled_job("cron", hour=1, minute=0, id="parser-clean-local-cache")
+@scheduler.scheduled_job("interval", minutes=10, id="parser-evict-local-cache")
 async def clean_plugin_cache():
     try:
-        files = [f for f in pconfig.cache_dir.iterdir() if f.is_file()]
-        if not files:
-            logger.info("No cache files to clean")
-            return
+        removed = await DISK_CACHE.evict()
+        purged = await purge_result_cache()
+        await REDIRECTS.save()
+    except Exception:
+        logger.exception("Error while evicting cache files")
+        return
 
-        # 并发删除文件
-        tasks = [safe_unlink(file) for file in files]
-        await asyncio.gather(*tasks)
+    if removed:
+        # 引用了被淘汰文件的解析结果在读取缓存时校验, 无需清空
+        logger.success(f"Successfully evicted {len(removed)} cache files")
+    if purged:
+        logger.success(f"Successfully purged {purged} expired results")
+
+
+# 启动时校验一次, 之后定时校验和刷新, 解析时不再请求
+@get_driver().on_startup
+@scheduler.scheduled_job("interval", hours=1, id="parser-check-bili-credential")
+async def check_bili_credential():
+    await CREDENTIAL.check()
 
-        logger.success(f"Successfully cleaned {len(files)} cache files")
-    except Exception:
-        logger.exception("Error while cleaning cache files")
 
-    # 资源清理完毕后，清理 result 缓存
-    clear_result_cache()
+@scheduler.scheduled_job("interval", hours=1, id="parser-log-prefilter-stats")
+async def log_prefilter_stats():
+    if PREFILTER_STATS.checked:
+        logger.info(PREFILTER_STATS)
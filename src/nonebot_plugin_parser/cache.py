@@ -0,0 +1,129 @@
+import os
+import time
+import asyncio
+import hashlib
+from pathlib import Path
+from contextlib import contextmanager
+from collections import Counter
+from dataclasses import dataclass
+from collections.abc import Iterator
+
+from .config import pconfig
+
+_SHARD_CHARS = frozenset("0123456789abcdef")
+
+
+@dataclass(slots=True)
+class _Entry:
+    path: Path
+    size: int
+    last_used: float
+
+
+class DiskCache:
+    """有容量上限的本地媒体缓存
+
+    - 文件按文件名哈希分布在 256 个子目录中, 避免单目录文件过多, 子目录在初始化时创建
+    - 超出容量时按 `文件大小 * 空闲时长` 从大到小淘汰, 大视频优先于小图片被淘汰
+    - 被引用(pin)的文件和最近使用过的文件不会被淘汰
+    """
+
+    def __init__(self, root: Path, max_bytes: int, min_idle: float = 600):
+        self.root: Path = root
+        """缓存根目录"""
+        self.max_bytes: int = max_bytes
+        """容量上限 单位 bytes"""
+        self.min_idle: float = min_idle
+        """最近使用时间在该秒数内的文件不会被淘汰"""
+        self._pins: Counter[Path] = Counter()
+        # 预先创建分片目录, 获取路径时无需在事件循环中访问文件系统
+        for i in range(256):
+            (root / f"{i:02x}").mkdir(parents=True, exist_ok=True)
+
+    def path(self, file_name: str) -> Path:
+        """获取文件名对应的缓存路径
+
+        Args:
+            file_name (str): 文件名
+
+        Returns:
+            Path: 缓存路径
+        """
+        shard = hashlib.md5(file_name.encode()).hexdigest()[:2]
+        return self.root / shard / file_name
+
+    def touch(self, path: Path) -> None:
+        """更新文件的访问时间, 用于 LRU 淘汰"""
+        try:
+            os.utime(path, (time.time(), path.stat().st_mtime))
+        except OSError:
+            pass
+
+    @contextmanager
+    def pin(self, *paths: Path) -> Iterator[None]:
+        """引用文件, 引用期间不会被淘汰"""
+        self._pins.update(paths)
+        try:
+            yield
+        finally:
+            self._pins.subtract(paths)
+            for path in paths:
+                if self._pins[path] <= 0:
+                    del self._pins[path]
+
+    def _scan(self) -> list[_Entry]:
+        entries: list[_Entry] = []
+        dirs = [self.root]
+        with os.scandir(self.root) as it:
+            dirs.extend(
+                Path(entry.path)
+                for entry in it
+                if entry.is_dir() and len(entry.name) == 2 and set(entry.name) <= _SHARD_CHARS
+            )
+        for directory in dirs:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    last_used = max(stat.st_atime, stat.st_mtime)
+                    entries.append(_Entry(Path(entry.path), stat.st_size, last_used))
+        return entries
+
+    def _evict(self, pinned: frozenset[Path]) -> list[Path]:
+        if not self.root.exists():
+            return []
+        entries = self._scan()
+        total = sum(entry.size for entry in entries)
+        if total <= self.max_bytes:
+            return []
+
+        # 淘汰到容量的 90%, 避免频繁触发
+        target = self.max_bytes * 0.9
+        now = time.time()
+        candidates = [e for e in entries if e.path not in pinned and now - e.last_used >= self.min_idle]
+        candidates.sort(key=lambda e: e.size * (now - e.last_used), reverse=True)
+
+        removed: list[Path] = []
+        for entry in candidates:
+            if total <= target:
+                break
+            try:
+                entry.path.unlink()
+            except OSError:
+                continue
+            total -= entry.size
+            removed.append(entry.path)
+        return removed
+
+    async def evict(self) -> list[Path]:
+        """淘汰文件直到不超过容量上限
+
+        Returns:
+            list[Path]: 被删除的文件
+        """
+        return await asyncio.to_thread(self._evict, frozenset(self._pins))
+
+
+DISK_CACHE = DiskCache(pconfig.cache_dir, pconfig.cache_max_size * 1024 * 1024)
+"""插件媒体缓存"""
@@ -5,7 +5,7 @@ from apilmoji import ELK_SH_CDN, EmojiStyle
 from pydantic import BaseModel
 from bilibili_api.video import VideoCodecs, VideoQuality
 
-from .constants import RenderType, PlatformEnum
+from .constants import RenderType, PlatformEnum, RenderFormat, RenderExecutor, ScreenshotPolicy
 
 require("nonebot_plugin_localstore")
 import nonebot_plugin_localstore as _store
@@ -37,6 +37,26 @@ class Config(BaseModel):
     """是否使用 base64 编码发送图片，音频，视频"""
     parser_max_size: int = 90
     """资源最大大小 默认 100 单位 MB"""
+    parser_http2: bool = False
+    """解析请求是否启用 HTTP/2, 需要安装 h2"""
+    parser_max_links: int = 1
+    """单条消息最多解析的链接数, 1 表示只解析第一个链接"""
+    parser_link_concurrency: int = 3
+    """单条消息中链接的最大并发解析数"""
+    parser_redirect_cache_ttl: int = 6 * 60 * 60
+    """短链重定向缓存时长 单位: 秒, 0 表示不缓存"""
+    parser_redirect_cache_persist: bool = True
+    """是否持久化短链重定向缓存"""
+    parser_cache_max_size: int = 2048
+    """本地媒体缓存容量上限 单位 MB"""
+    parser_download_segments: int = 1
+    """大文件分段并发下载的连接数, 1 表示不分段"""
+    parser_segment_threshold: int = 20
+    """启用分段下载的文件大小阈值 单位 MB"""
+    parser_download_concurrency: int = 8
+    """全局最大并发下载数"""
+    parser_download_host_concurrency: int = 4
+    """单个 host 最大并发下载数"""
     parser_duration_maximum: int = 480
     """视频/音频最大时长"""
     parser_append_url: bool = False
@@ -51,8 +71,26 @@ class Config(BaseModel):
     """B站视频编码"""
     parser_bili_video_quality: VideoQuality = VideoQuality._1080P
     """B站视频分辨率"""
+    parser_bili_ai_summary_timeout: float = 3
+    """B站 AI 总结等待时长 单位: 秒, 超时后先发送卡片, 总结稍后补发"""
+    parser_screenshot_pool_size: int = 2
+    """截图浏览器上下文池大小, 同时也是截图的最大并发数"""
+    parser_bili_screenshot_policy: ScreenshotPolicy = ScreenshotPolicy.prefer
+    """B站动态/图文截图与 API 解析的选择策略"""
+    parser_bili_screenshot_timeout: float = 10
+    """B站动态/图文截图最长等待时间 单位: 秒, 超时后使用 API 解析结果"""
+    parser_bili_screenshot_ttl: int = 10 * 60
+    """B站动态/图文截图缓存时长 单位: 秒, 0 表示不缓存"""
     parser_render_type: RenderType = RenderType.common
     """Renderer 类型"""
+    parser_render_executor: RenderExecutor = RenderExecutor.thread
+    """PIL 渲染的执行方式, 线程池或进程池"""
+    parser_render_workers: int = 2
+    """PIL 渲染线程/进程数"""
+    parser_render_format: RenderFormat = RenderFormat.png
+    """PIL 渲染图片的编码格式"""
+    parser_render_quality: int = 85
+    """PIL 渲染图片的编码质量, 仅 jpeg 和 webp 有效"""
     parser_custom_font: str | None = None
     """自定义字体"""
     parser_need_forward_contents: bool = True
@@ -61,6 +99,8 @@ class Config(BaseModel):
     """Pilmoji 表情 CDN"""
     parser_emoji_style: EmojiStyle = EmojiStyle.FACEBOOK
     """Pilmoji 表情样式"""
+    parser_emoji_cache_size: int = 1024
+    """emoji 位图缓存数量"""
     parser_force_prefix: str = ""
     """解析前缀，用于强制触发解析"""
 
@@ -89,6 +129,56 @@ class Config(BaseModel):
         """资源最大大小"""
         return self.parser_max_size
 
+    @property
+    def http2(self) -> bool:
+        """解析请求是否启用 HTTP/2"""
+        return self.parser_http2
+
+    @property
+    def max_links(self) -> int:
+        """单条消息最多解析的链接数"""
+        return max(1, self.parser_max_links)
+
+    @property
+    def link_concurrency(self) -> int:
+        """单条消息中链接的最大并发解析数"""
+        return max(1, self.parser_link_concurrency)
+
+    @property
+    def redirect_cache_ttl(self) -> int:
+        """短链重定向缓存时长"""
+        return self.parser_redirect_cache_ttl
+
+    @property
+    def redirect_cache_persist(self) -> bool:
+        """是否持久化短链重定向缓存"""
+        return self.parser_redirect_cache_persist
+
+    @property
+    def cache_max_size(self) -> int:
+        """本地媒体缓存容量上限"""
+        return self.parser_cache_max_size
+
+    @property
+    def download_segments(self) -> int:
+        """大文件分段并发下载的连接数"""
+        return self.parser_download_segments
+
+    @property
+    def segment_threshold(self) -> int:
+        """启用分段下载的文件大小阈值"""
+        return self.parser_segment_threshold
+
+    @property
+    def download_concurrency(self) -> int:
+        """全局最大并发下载数"""
+        return self.parser_download_concurrency
+
+    @property
+    def download_host_concurrency(self) -> int:
+        """单个 host 最大并发下载数"""
+        return self.parser_download_host_concurrency
+
     @property
     def duration_maximum(self) -> int:
         """视频/音频最大时长"""
@@ -109,11 +199,56 @@ class Config(BaseModel):
         """B站视频分辨率"""
         return self.parser_bili_video_quality
 
+    @property
+    def bili_ai_summary_timeout(self) -> float:
+        """B站 AI 总结等待时长"""
+        return self.parser_bili_ai_summary_timeout
+
+    @property
+    def screenshot_pool_size(self) -> int:
+        """截图浏览器上下文池大小"""
+        return max(1, self.parser_screenshot_pool_size)
+
+    @property
+    def bili_screenshot_policy(self) -> ScreenshotPolicy:
+        """B站动态/图文截图与 API 解析的选择策略"""
+        return self.parser_bili_screenshot_policy
+
+    @property
+    def bili_screenshot_timeout(self) -> float:
+        """B站动态/图文截图最长等待时间"""
+        return self.parser_bili_screenshot_timeout
+
+    @property
+    def bili_screenshot_ttl(self) -> int:
+        """B站动态/图文截图缓存时长"""
+        return self.parser_bili_screenshot_ttl
+
     @property
     def render_type(self) -> RenderType:
         """Renderer 类型"""
         return self.parser_render_type
 
+    @property
+    def render_executor(self) -> RenderExecutor:
+        """PIL 渲染的执行方式"""
+        return self.parser_render_executor
+
+    @property
+    def render_workers(self) -> int:
+        """PIL 渲染线程/进程数"""
+        return max(1, self.parser_render_workers)
+
+    @property
+    def render_format(self) -> RenderFormat:
+        """PIL 渲染图片的编码格式"""
+        return self.parser_render_format
+
+    @property
+    def render_quality(self) -> int:
+        """PIL 渲染图片的编码质量"""
+        return min(100, max(1, self.parser_render_quality))
+
     @property
     def bili_ck(self) -> str | None:
         """bilibili cookies"""
@@ -169,6 +304,11 @@ class Config(BaseModel):
         """Pilmoji 表情样式"""
         return self.parser_emoji_style
 
+    @property
+    def emoji_cache_size(self) -> int:
+        """emoji 位图缓存数量"""
+        return max(0, self.parser_emoji_cache_size)
+
     @property
     def parse_prefix(self) -> str:
         """解析前缀"""
@@ -50,3 +50,30 @@ class RenderType(str, Enum):
     common = "common"
     htmlkit = "htmlkit"
     htmlrender = "htmlrender"
+
+
+class RenderExecutor(str, Enum):
+    thread = "thread"
+    """线程池, 解码, 缩放和编码时会释放 GIL"""
+    process = "process"
+    """进程池, 每个进程独立加载字体, 可以充分利用多核"""
+
+
+class RenderFormat(str, Enum):
+    png = "png"
+    """无损 PNG, 体积最大"""
+    png8 = "png8"
+    """256 色调色板 PNG, 适合文字为主的卡片, 图片会有色阶"""
+    jpeg = "jpeg"
+    """JPEG, 图片多的卡片体积更小"""
+    webp = "webp"
+    """WebP, 体积最小, 部分协议端可能不支持"""
+
+
+class ScreenshotPolicy(str, Enum):
+    prefer = "prefer"
+    """优先使用截图, 截图失败或超时后使用同时进行的 API 解析结果"""
+    fastest = "fastest"
+    """截图和 API 解析先成功完成的一方胜出"""
+    api = "api"
+    """仅使用 API 解析"""
@@ -2,11 +2,13 @@ import asyncio
 from pathlib import Path
 
 import aiofiles
-from httpx import HTTPError, AsyncClient
+from httpx import Response, HTTPError, AsyncClient, HTTPStatusError
 from nonebot import logger
 from tqdm.asyncio import tqdm
 
-from .task import auto_task
+from .task import SingleFlight, auto_task
+from .scheduler import Priority, DownloadScheduler
+from ..cache import DISK_CACHE
 from ..utils import merge_av, safe_unlink, generate_file_name
 from ..config import pconfig
 from ..constants import COMMON_HEADER, DOWNLOAD_TIMEOUT
@@ -19,6 +21,10 @@ except ImportError:
     CURL_CFFI_AVAILABLE = False
 
 
+class _RangeIgnoredError(Exception):
+    """服务器忽略 Range 请求, 分段下载不可用"""
+
+
 class StreamDownloader:
     """Downloader class for downloading files with stream"""
 
@@ -26,6 +32,13 @@ class StreamDownloader:
         self.headers: dict[str, str] = COMMON_HEADER.copy()
         self.cache_dir: Path = pconfig.cache_dir
         self.client: AsyncClient = AsyncClient(timeout=DOWNLOAD_TIMEOUT, verify=False)
+        self._flights: SingleFlight[Path, Path] = SingleFlight()
+        """进行中的下载, 以目标文件路径为 key, 相同路径的并发下载共享同一个任务"""
+        self.scheduler: DownloadScheduler = DownloadScheduler(
+            pconfig.download_concurrency,
+            pconfig.download_host_concurrency,
+        )
+        """下载调度器"""
 
     @auto_task
     async def streamd(
@@ -34,6 +47,7 @@ class StreamDownloader:
         *,
         file_name: str | None = None,
         ext_headers: dict[str, str] | None = None,
+        priority: Priority = Priority.IMAGE,
     ) -> Path:
         """download file by url with stream
 
@@ -41,6 +55,7 @@ class StreamDownloader:
             url (str): url address
             file_name (str | None): file name. Defaults to generate_file_name.
             ext_headers (dict[str, str] | None): ext headers. Defaults to None.
+            priority (Priority): download priority. Defaults to Priority.IMAGE.
 
         Returns:
             Path: file path
@@ -51,16 +66,51 @@ class StreamDownloader:
 
         if not file_name:
             file_name = generate_file_name(url)
-        file_path = self.cache_dir / file_name
+        file_path = DISK_CACHE.path(file_name)
+
+        return await self._flights.do(file_path, lambda: self._streamd(url, file_path, ext_headers, priority))
+
+    async def _streamd(
+        self,
+        url: str,
+        file_path: Path,
+        ext_headers: dict[str, str] | None,
+        priority: Priority,
+    ) -> Path:
+        """实际执行下载, 由 streamd 保证同一路径同时只有一个下载"""
 
-        # 检查文件是否已存在
-        if file_path.exists():
+        # 检查文件是否已存在, 在线程中访问文件系统, 避免阻塞事件循环
+        try:
+            size = (await asyncio.to_thread(file_path.stat)).st_size
+        except FileNotFoundError:
+            size = None
+        if size is not None:
             # 简单校验一下大小，防止之前留下了0字节空文件
-            if file_path.stat().st_size > 0:
+            if size > 0:
+                await asyncio.to_thread(DISK_CACHE.touch, file_path)
                 return file_path
             else:
                 await safe_unlink(file_path)
 
+        # 由调度器控制并发, 缓存命中时不占用槽位
+        part_path = file_path.with_name(f"{file_path.name}.part")
+        with DISK_CACHE.pin(file_path, part_path):
+            async with self.scheduler.slot(url, priority):
+                return await self._download(url, file_path, ext_headers, priority)
+
+    async def _download(
+        self,
+        url: str,
+        file_path: Path,
+        ext_headers: dict[str, str] | None,
+        priority: Priority,
+    ) -> Path:
+        """下载到 .part 临时文件, 完成后重命名为目标文件, 调用时已持有一个调度器槽位"""
+        file_name = file_path.name
+
+        # 先写入 .part 临时文件, 校验完整后再重命名, 避免中断的下载被当作缓存
+        part_path = file_path.with_name(f"{file_name}.part")
+
         # ================== 针对 NGA 使用 curl_cffi 下载 ==================
         if "nga.178.com" in url and CURL_CFFI_AVAILABLE:
             logger.info(f"检测到 NGA 图片，使用 curl_cffi 下载: {url}")
@@ -72,53 +122,195 @@ class StreamDownloader:
                     None,
                     self._download_with_curl_cffi,
                     url,
-                    file_path,
+                    part_path,
                     file_name,
                 )
 
-                if file_path.exists() and file_path.stat().st_size > 0:
+                if part_path.exists() and part_path.stat().st_size > 0:
+                    await asyncio.to_thread(part_path.replace, file_path)
                     logger.success(f"curl_cffi 下载成功: {file_path}")
                     return file_path
                 else:
-                    await safe_unlink(file_path)
+                    await safe_unlink(part_path)
                     raise DownloadException("NGA 图片下载失败 (curl_cffi)")
 
             except Exception as e:
                 logger.exception(f"curl_cffi 下载异常: {e}")
-                await safe_unlink(file_path)
+                await safe_unlink(part_path)
                 # 回退到普通 httpx 下载
                 logger.info("回退到 httpx 下载")
         # ====================================================================
 
-        # === 以下是原有的 httpx 下载逻辑 ===
+        # === 以下是 httpx 下载逻辑 ===
         headers = {**self.headers, **(ext_headers or {})}
 
+        # 存在未完成的临时文件时，使用 Range 请求续传
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        if offset > 0:
+            headers["Range"] = f"bytes={offset}-"
+            logger.info(f"续传 {file_name}, 已下载 {offset / 1024 / 1024:.2f} MB")
+
         try:
             async with self.client.stream("GET", url, headers=headers, follow_redirects=True) as response:
+                if offset > 0 and response.status_code == 416:
+                    # 续传范围无效（临时文件已损坏或资源已变更），丢弃后重新下载
+                    await response.aclose()
+                    await safe_unlink(part_path)
+                    return await self._download(url, file_path, ext_headers, priority)
+
                 response.raise_for_status()
+
+                # 服务器忽略 Range 返回完整内容时，从头开始写入
+                if response.status_code != 206:
+                    offset = 0
+
                 content_length = response.headers.get("Content-Length")
                 content_length = int(content_length) if content_length else 0
+                total_size = offset + content_length if content_length > 0 else 0
 
-                if content_length == 0:
-                    # 有些服务器不返回 Content-Length，尝试读取流
-                    pass
-
-                if content_length > 0 and (file_size := content_length / 1024 / 1024) > pconfig.max_size:
+                if total_size > 0 and (file_size := total_size / 1024 / 1024) > pconfig.max_size:
                     logger.warning(f"媒体 url: {url} 大小 {file_size:.2f} MB 超过 {pconfig.max_size} MB, 取消下载")
+                    await safe_unlink(part_path)
                     raise SizeLimitException
 
-                with self.get_progress_bar(file_name, content_length) as bar:
-                    async with aiofiles.open(file_path, "wb") as file:
-                        async for chunk in response.aiter_bytes(1024 * 1024):
-                            await file.write(chunk)
-                            bar.update(len(chunk))
-
+                # 大文件且服务器声明支持 Range 时，放弃当前响应，改为分段并发下载
+                segmented = offset == 0 and self._can_segment(response, total_size)
+                if not segmented:
+                    await self._write_response(response, part_path, offset=offset, total_size=total_size)
+
+            if segmented:
+                try:
+                    await self._download_segments(
+                        url, part_path, headers=headers, total_size=total_size, priority=priority
+                    )
+                except _RangeIgnoredError:
+                    logger.warning(f"服务器忽略了 Range 请求, 回退到单连接下载 | url: {url}")
+                    async with self.client.stream("GET", url, headers=headers, follow_redirects=True) as response:
+                        response.raise_for_status()
+                        await self._write_response(response, part_path, offset=0, total_size=total_size)
+
+        except HTTPStatusError:
+            await safe_unlink(part_path)
+            logger.exception(f"下载失败 | url: {url}, file_path: {file_path}")
+            raise DownloadException("媒体下载失败")
         except HTTPError:
-            await safe_unlink(file_path)
+            # 网络中断等传输错误，保留临时文件，下次续传
             logger.exception(f"下载失败 | url: {url}, file_path: {file_path}")
             raise DownloadException("媒体下载失败")
+
+        await asyncio.to_thread(part_path.replace, file_path)
         return file_path
 
+    async def _write_response(
+        self,
+        response: Response,
+        part_path: Path,
+        *,
+        offset: int,
+        total_size: int,
+    ) -> None:
+        """将响应流写入临时文件
+
+        Args:
+            response (Response): 流式响应
+            part_path (Path): 临时文件路径
+            offset (int): 续传起始位置, 0 表示从头写入
+            total_size (int): 文件总大小, 未知时为 0
+        """
+        with self.get_progress_bar(part_path.name, total_size) as bar:
+            bar.update(offset)
+            async with aiofiles.open(part_path, "ab" if offset > 0 else "wb") as file:
+                async for chunk in response.aiter_bytes(1024 * 1024):
+                    await file.write(chunk)
+                    bar.update(len(chunk))
+
+        # 校验长度，不完整的临时文件保留，下次续传
+        content_length = int(response.headers.get("Content-Length") or 0)
+        if content_length > 0 and (downloaded := response.num_bytes_downloaded) != content_length:
+            logger.warning(f"下载不完整 | url: {response.url}, 期望 {content_length} 字节, 实际 {downloaded} 字节")
+            raise DownloadException("媒体下载不完整")
+
+    @staticmethod
+    def _can_segment(response: Response, total_size: int) -> bool:
+        """判断是否使用分段下载"""
+        return (
+            pconfig.download_segments > 1
+            and total_size >= pconfig.segment_threshold * 1024 * 1024
+            and response.headers.get("Accept-Ranges", "").lower() == "bytes"
+            and response.headers.get("Content-Encoding", "identity") == "identity"
+        )
+
+    async def _download_segments(
+        self,
+        url: str,
+        part_path: Path,
+        *,
+        headers: dict[str, str],
+        total_size: int,
+        priority: Priority,
+    ) -> None:
+        """分段并发下载, 每段写入预分配临时文件的对应偏移
+
+        分段数不超过单个 host 的并发上限, 除第一段外的各段另外获取调度器槽位
+
+        Args:
+            url (str): url address
+            part_path (Path): 临时文件路径
+            headers (dict[str, str]): 请求头
+            total_size (int): 文件总大小
+            priority (Priority): 优先级
+
+        Raises:
+            _RangeIgnoredError: 服务器忽略 Range 请求
+        """
+        segments = min(pconfig.download_segments, self.scheduler.max_host_concurrency)
+        segment_size = -(-total_size // segments)
+        ranges = [(start, min(start + segment_size, total_size) - 1) for start in range(0, total_size, segment_size)]
+        logger.debug(f"分段下载 {part_path.name}, 大小 {total_size / 1024 / 1024:.2f} MB, 分为 {len(ranges)} 段")
+
+        # 预分配文件, 各段直接写入对应偏移
+        await asyncio.to_thread(self._preallocate, part_path, total_size)
+
+        async def download_range(start: int, end: int, bar: tqdm) -> None:
+            range_headers = {**headers, "Range": f"bytes={start}-{end}"}
+            async with self.client.stream("GET", url, headers=range_headers, follow_redirects=True) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise _RangeIgnoredError
+
+                async with aiofiles.open(part_path, "r+b") as file:
+                    await file.seek(start)
+                    async for chunk in response.aiter_bytes(1024 * 1024):
+                        await file.write(chunk)
+                        bar.update(len(chunk))
+
+                if response.num_bytes_downloaded != end - start + 1:
+                    raise DownloadException("媒体分段下载不完整")
+
+        async def download_segment(start: int, end: int, bar: tqdm) -> None:
+            # 第一段使用调用者持有的槽位, 其余各段受全局和单个 host 的并发限制
+            if start == 0:
+                return await download_range(start, end, bar)
+            async with self.scheduler.slot(url, priority):
+                return await download_range(start, end, bar)
+
+        with self.get_progress_bar(part_path.name, total_size) as bar:
+            tasks = [asyncio.create_task(download_segment(start, end, bar)) for start, end in ranges]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                # 任一分段失败即取消其余分段, 预分配的文件无法按顺序续传, 直接删除
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                await safe_unlink(part_path)
+                raise
+
+    @staticmethod
+    def _preallocate(path: Path, size: int) -> None:
+        with open(path, "wb") as file:
+            file.truncate(size)
+
     def _download_with_curl_cffi(self, url: str, file_path: Path, file_name: str) -> None:
         """使用 curl_cffi 下载文件（同步方法）
 
@@ -165,6 +357,9 @@ class StreamDownloader:
                         file.write(chunk)
                         bar.update(len(chunk))
 
+        if content_length > 0 and (written := file_path.stat().st_size) != content_length:
+            raise DownloadException(f"媒体下载不完整, 期望 {content_length} 字节, 实际 {written} 字节")
+
     @staticmethod
     def get_progress_bar(desc: str, total: int | None = None) -> tqdm:
         """获取进度条 bar
@@ -193,6 +388,7 @@ class StreamDownloader:
         *,
         video_name: str | None = None,
         ext_headers: dict[str, str] | None = None,
+        priority: Priority = Priority.VIDEO,
     ) -> Path:
         """download video file by url with stream
 
@@ -200,6 +396,7 @@ class StreamDownloader:
             url (str): url address
             video_name (str | None): video name. Defaults to get name by parse url.
             ext_headers (dict[str, str] | None): ext headers. Defaults to None.
+            priority (Priority): download priority. Defaults to Priority.VIDEO.
 
         Returns:
             Path: video file path
@@ -209,7 +406,7 @@ class StreamDownloader:
         """
         if video_name is None:
             video_name = generate_file_name(url, ".mp4")
-        return await self.streamd(url, file_name=video_name, ext_headers=ext_headers)
+        return await self.streamd(url, file_name=video_name, ext_headers=ext_headers, priority=priority)
 
     @auto_task
     async def download_audio(
@@ -218,6 +415,7 @@ class StreamDownloader:
         *,
         audio_name: str | None = None,
         ext_headers: dict[str, str] | None = None,
+        priority: Priority = Priority.VIDEO,
     ) -> Path:
         """download audio file by url with stream
 
@@ -225,6 +423,7 @@ class StreamDownloader:
             url (str): url address
             audio_name (str | None ): audio name. Defaults to generate from url.
             ext_headers (dict[str, str] | None): ext headers. Defaults to None.
+            priority (Priority): download priority. Defaults to Priority.VIDEO.
 
         Returns:
             Path: audio file path
@@ -234,7 +433,7 @@ class StreamDownloader:
         """
         if audio_name is None:
             audio_name = generate_file_name(url, ".mp3")
-        return await self.streamd(url, file_name=audio_name, ext_headers=ext_headers)
+        return await self.streamd(url, file_name=audio_name, ext_headers=ext_headers, priority=priority)
 
     @auto_task
     async def download_img(
@@ -243,6 +442,7 @@ class StreamDownloader:
         *,
         img_name: str | None = None,
         ext_headers: dict[str, str] | None = None,
+        priority: Priority = Priority.IMAGE,
     ) -> Path:
         """download image file by url with stream
 
@@ -250,6 +450,7 @@ class StreamDownloader:
             url (str): url
             img_name (str | None): image name. Defaults to generate from url.
             ext_headers (dict[str, str] | None): ext headers. Defaults to None.
+            priority (Priority): download priority, Priority.CARD for avatar and cover. Defaults to Priority.IMAGE.
 
         Returns:
             Path: image file path
@@ -259,7 +460,7 @@ class StreamDownloader:
         """
         if img_name is None:
             img_name = generate_file_name(url, ".jpg")
-        return await self.streamd(url, file_name=img_name, ext_headers=ext_headers)
+        return await self.streamd(url, file_name=img_name, ext_headers=ext_headers, priority=priority)
 
     async def download_imgs_without_raise(
         self,
@@ -292,12 +493,17 @@ class StreamDownloader:
         ext_headers: dict[str, str] | None = None,
     ) -> Path:
         """download video and audio file by url with stream and merge"""
-        v_path, a_path = await asyncio.gather(
-            self.download_video(v_url, ext_headers=ext_headers),
-            self.download_audio(a_url, ext_headers=ext_headers),
-        )
-        await merge_av(v_path=v_path, a_path=a_path, output_path=output_path)
-        return output_path
+
+        async def download_and_merge() -> Path:
+            v_path, a_path = await asyncio.gather(
+                self.download_video(v_url, ext_headers=ext_headers),
+                self.download_audio(a_url, ext_headers=ext_headers),
+            )
+            with DISK_CACHE.pin(v_path, a_path, output_path):
+                await merge_av(v_path=v_path, a_path=a_path, output_path=output_path)
+            return output_path
+
+        return await self._flights.do(output_path, download_and_merge)
 
 
 DOWNLOADER: StreamDownloader = StreamDownloader()
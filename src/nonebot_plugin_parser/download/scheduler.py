@@ -0,0 +1,129 @@
+import asyncio
+from enum import IntEnum
+from itertools import count
+from contextlib import asynccontextmanager
+from collections import Counter
+from urllib.parse import urlparse
+from collections.abc import AsyncIterator
+
+
+class Priority(IntEnum):
+    """下载优先级, 数值越小越优先"""
+
+    CARD = 0
+    """头像, 封面等渲染卡片所需资源"""
+    IMAGE = 1
+    """图集图片"""
+    VIDEO = 2
+    """视频, 音频等大文件"""
+
+
+class _Waiter:
+    __slots__ = ("future", "host", "priority", "seq")
+
+    def __init__(self, priority: Priority, seq: int, host: str):
+        self.priority: Priority = priority
+        self.seq: int = seq
+        self.host: str = host
+        self.future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class DownloadScheduler:
+    """全局下载调度器
+
+    - 限制全局并发数和单个 host 的并发数
+    - 等待中的下载按优先级出队, 同优先级先到先得
+    - 视频等大文件最多占用一半的全局并发, 保证卡片所需资源始终有空闲连接
+    """
+
+    def __init__(self, max_concurrency: int, max_host_concurrency: int):
+        self.max_concurrency: int = max(1, max_concurrency)
+        """全局最大并发数"""
+        self.max_host_concurrency: int = max(1, max_host_concurrency)
+        """单个 host 最大并发数"""
+        self.max_bulk_concurrency: int = max(1, self.max_concurrency // 2)
+        """大文件最大并发数"""
+        self._active: int = 0
+        self._active_bulk: int = 0
+        self._host_active: Counter[str] = Counter()
+        self._waiters: list[_Waiter] = []
+        self._seq = count()
+
+    @property
+    def active(self) -> int:
+        """正在进行的下载数"""
+        return self._active
+
+    @property
+    def pending(self) -> int:
+        """等待中的下载数"""
+        return len(self._waiters)
+
+    @asynccontextmanager
+    async def slot(self, url: str, priority: Priority = Priority.IMAGE) -> AsyncIterator[None]:
+        """获取下载槽位
+
+        Args:
+            url (str): 下载地址, 用于确定 host
+            priority (Priority): 优先级. Defaults to Priority.IMAGE.
+        """
+        host = urlparse(url).netloc
+        await self._acquire(host, priority)
+        try:
+            yield
+        finally:
+            self._release(host, priority)
+            self._wakeup()
+
+    def _can_run(self, host: str, priority: Priority) -> bool:
+        if self._active >= self.max_concurrency:
+            return False
+        if self._host_active[host] >= self.max_host_concurrency:
+            return False
+        return priority is not Priority.VIDEO or self._active_bulk < self.max_bulk_concurrency
+
+    def _take(self, host: str, priority: Priority) -> None:
+        self._active += 1
+        self._host_active[host] += 1
+        if priority is Priority.VIDEO:
+            self._active_bulk += 1
+
+    def _release(self, host: str, priority: Priority) -> None:
+        self._active -= 1
+        self._host_active[host] -= 1
+        if self._host_active[host] <= 0:
+            del self._host_active[host]
+        if priority is Priority.VIDEO:
+            self._active_bulk -= 1
+
+    async def _acquire(self, host: str, priority: Priority) -> None:
+        waiter = _Waiter(priority, next(self._seq), host)
+        self._waiters.append(waiter)
+        self._wakeup()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # 已分配槽位但调用者被取消, 归还槽位
+                self._release(host, priority)
+                self._wakeup()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def _wakeup(self) -> None:
+        """按优先级唤醒可以运行的等待者, 被 host 限制的等待者不阻塞其他 host"""
+        if not self._waiters:
+            return
+        self._waiters.sort()
+        remaining: list[_Waiter] = []
+        for waiter in self._waiters:
+            if not waiter.future.done() and self._can_run(waiter.host, waiter.priority):
+                self._take(waiter.host, waiter.priority)
+                waiter.future.set_result(None)
+            elif not waiter.future.done():
+                remaining.append(waiter)
+        self._waiters = remaining
@@ -1,10 +1,11 @@
-from typing import Any, TypeVar, ParamSpec
-from asyncio import Task, create_task
+from typing import Any, Generic, TypeVar, ParamSpec
+from asyncio import Task, CancelledError, shield, create_task
 from functools import wraps
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Hashable, Coroutine
 
 P = ParamSpec("P")
 T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
 
 
 def auto_task(func: Callable[P, Coroutine[Any, Any, T]]) -> Callable[P, Task[T]]:
@@ -17,3 +18,62 @@ def auto_task(func: Callable[P, Coroutine[Any, Any, T]]) -> Callable[P, Task[T]]
         return create_task(coro, name=func.__name__ + " | " + name)
 
     return wrapper
+
+
+class _Flight(Generic[T]):
+    """进行中的共享任务"""
+
+    __slots__ = ("refs", "task")
+
+    def __init__(self, task: Task[T]):
+        self.task: Task[T] = task
+        self.refs: int = 0
+
+
+class SingleFlight(Generic[K, T]):
+    """相同 key 的并发调用共享同一个 Task
+
+    每个调用者持有一个引用, 调用者被取消只会释放自己的引用,
+    仅当所有调用者都被取消时, 才会取消共享的 Task
+    """
+
+    def __init__(self):
+        self._flights: dict[K, _Flight[T]] = {}
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._flights
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def do(self, key: K, func: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """执行或加入 key 对应的任务
+
+        Args:
+            key (K): 任务标识, 如目标文件路径
+            func (Callable[[], Coroutine[Any, Any, T]]): 无进行中的任务时, 用于创建任务的协程函数
+
+        Returns:
+            T: 共享任务的结果
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(create_task(func(), name=f"single-flight | {key}"))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._release(key, flight))
+
+        flight.refs += 1
+        try:
+            return await shield(flight.task)
+        except CancelledError:
+            if flight.refs == 1 and not flight.task.done():
+                # 最后一个调用者也被取消, 取消共享任务并立即移除, 避免新调用者加入正在取消的任务
+                self._release(key, flight)
+                flight.task.cancel()
+            raise
+        finally:
+            flight.refs -= 1
+
+    def _release(self, key: K, flight: _Flight[T]) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
@@ -6,6 +6,7 @@ import yt_dlp
 from msgspec import Struct, convert
 
 from .task import auto_task
+from ..cache import DISK_CACHE
 from ..utils import LimitedSizeDict, generate_file_name
 from ..config import pconfig
 from ..exception import ParseException, DurationLimitException
@@ -95,8 +96,9 @@ class YtdlpDownloader:
         if duration > pconfig.duration_maximum:
             raise DurationLimitException
 
-        video_path = pconfig.cache_dir / generate_file_name(url, ".mp4")
+        video_path = DISK_CACHE.path(generate_file_name(url, ".mp4"))
         if video_path.exists():
+            DISK_CACHE.touch(video_path)
             return video_path
 
         ydl_opts = self._download_base_opts.copy()
@@ -124,12 +126,13 @@ class YtdlpDownloader:
             Path: audio file path
         """
         file_name = generate_file_name(url)
-        audio_path = pconfig.cache_dir / f"{file_name}.flac"
+        audio_path = DISK_CACHE.path(f"{file_name}.flac")
         if audio_path.exists():
+            DISK_CACHE.touch(audio_path)
             return audio_path
 
         ydl_opts = self._download_base_opts.copy()
-        ydl_opts["outtmpl"] = f"{pconfig.cache_dir / file_name}.%(ext)s"
+        ydl_opts["outtmpl"] = f"{audio_path.parent / file_name}.%(ext)s"
         ydl_opts["format"] = "bestaudio/best"
         ydl_opts["postprocessors"] = [
             {
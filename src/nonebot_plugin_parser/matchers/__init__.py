@@ -1,4 +1,5 @@
 import re
+import asyncio
 from typing import TypeVar
 
 from nonebot import logger, get_driver, on_command
@@ -8,12 +9,12 @@ from nonebot.matcher import current_event
 from nonebot.typing import T_State
 from nonebot_plugin_uninfo import Session, UniSession
 
-from .rule import SUPER_PRIVATE, Searched, SearchResult, on_keyword_regex, PSR_FORCE_PARSE_KEY
+from .rule import SUPER_PRIVATE, SearchedAll, SearchResult, on_keyword_regex, PSR_FORCE_PARSE_KEY
+from .cache import ResultCache
 from .filter import is_platform_enabled
-from ..utils import LimitedSizeDict
 from ..config import pconfig
 from ..helper import UniHelper, UniMessage
-from ..parsers import BaseParser, ParseResult, BilibiliParser
+from ..parsers import BaseParser, BilibiliParser
 from ..renders import get_renderer
 from ..download import DOWNLOADER
 
@@ -58,32 +59,48 @@ def register_parser_matcher():
 
 
 # 缓存结果
-_RESULT_CACHE = LimitedSizeDict[str, ParseResult](max_size=50)
+_RESULT_CACHE = ResultCache(pconfig.cache_dir / "results")
 
 
 def clear_result_cache():
     _RESULT_CACHE.clear()
 
 
+async def purge_result_cache() -> int:
+    """删除过期的解析结果缓存"""
+    return await _RESULT_CACHE.purge()
+
+
 async def parser_handler(
-    sr: SearchResult = Searched(),
+    searched_all: list[SearchResult] = SearchedAll(),
     session: Session = UniSession(),
     state: T_State = None,
 ):
     """统一的解析处理器"""
-    # 1. 获取对应平台 parser
-    parser = get_parser(sr.keyword)
-
-    # 2. 检查是否使用前缀强制触发
+    # 1. 检查是否使用前缀强制触发
     force_parse = state.get(PSR_FORCE_PARSE_KEY, False) if state else False
     logger.debug(f"强制解析标记: {force_parse}, state keys: {list(state.keys()) if state else 'None'}")
 
-    # 3. 检查平台是否在当前群组被禁用（强制解析时跳过此检查）
-    platform_enabled = is_platform_enabled(session, parser.platform.name)
-    logger.debug(f"平台 {parser.platform.name} 启用状态: {platform_enabled}")
-
-    if not force_parse and not platform_enabled:
-        logger.debug(f"平台 {parser.platform.name} 在群组 {session.scene_path} 中已被禁用，跳过解析")
+    # 2. 获取对应平台 parser, 按资源标识去重, 并限制单条消息的链接数
+    targets: dict[str, tuple[BaseParser, SearchResult]] = {}
+    for sr in searched_all:
+        parser = get_parser(sr.keyword)
+
+        # 检查平台是否在当前群组被禁用（强制解析时跳过此检查）
+        platform_enabled = is_platform_enabled(session, parser.platform.name)
+        logger.debug(f"平台 {parser.platform.name} 启用状态: {platform_enabled}")
+        if not force_parse and not platform_enabled:
+            logger.debug(f"平台 {parser.platform.name} 在群组 {session.scene_path} 中已被禁用，跳过解析")
+            continue
+
+        # 优先使用资源标识作为缓存 key, 使同一资源的不同链接形式命中同一缓存
+        resource_id = parser.get_resource_id(sr.keyword, sr.searched)
+        cache_key = str(resource_id) if resource_id else sr.searched.group(0)
+        targets.setdefault(cache_key, (parser, sr))
+        if len(targets) >= pconfig.max_links:
+            break
+
+    if not targets:
         return
 
     # 3. 添加"处理中"表情
@@ -93,39 +110,83 @@ async def parser_handler(
     except Exception:
         pass  # 如果不支持表情，忽略错误
 
-    try:
-        # 4. 获取缓存结果
-        cache_key = sr.searched.group(0)
-        result = _RESULT_CACHE.get(cache_key)
-
-        if result is None:
-            # 5. 执行解析
-            result = await parser.parse(sr.keyword, sr.searched)
-            logger.debug(f"解析结果: {result}")
-        else:
-            logger.debug(f"命中缓存: {cache_key}, 结果: {result}")
-
-        # 6. 渲染内容消息并发送
-        renderer = get_renderer(result.platform.name)
-        async for message in renderer.render_messages(result):
-            await message.send()
-
-        # 7. 缓存解析结果
-        _RESULT_CACHE[cache_key] = result
-
-        # 8. 添加"完成"表情
+    # 4. 并发解析和渲染, 先完成的先发送, 同一链接的消息不会被其他链接打断
+    semaphore = asyncio.Semaphore(pconfig.link_concurrency)
+    send_lock = asyncio.Lock()
+
+    async def send_queued(queue: asyncio.Queue[UniMessage | None]):
+        """获得发送锁后依次发送队列中的消息, 直到遇到 None"""
+        async with send_lock:
+            while (message := await queue.get()) is not None:
+                await message.send()
+
+    async def parse_and_send(cache_key: str, parser: BaseParser, sr: SearchResult):
+        async with semaphore:
+            result = await _RESULT_CACHE.get(cache_key)
+            if result is None:
+                result = await parser.parse(sr.keyword, sr.searched)
+                logger.debug(f"解析结果: {result}")
+            else:
+                logger.debug(f"命中缓存: {cache_key}, 结果: {result}")
+
         try:
-            await UniHelper.message_reaction(event, "done")
-        except Exception:
-            pass
+            # 在锁外渲染消息和下载媒体, 消息生成后立即发送
+            # 同一链接的消息依次发送, 其他链接已生成的消息在各自的队列中等待
+            renderer = get_renderer(result.platform.name)
+            queue: asyncio.Queue[UniMessage | None] = asyncio.Queue()
+            sender: asyncio.Task[None] | None = None
+            try:
+                async for message in renderer.render_messages(result):
+                    if sender is None:
+                        sender = asyncio.create_task(send_queued(queue))
+                    queue.put_nowait(message)
+            finally:
+                # 部分媒体下载失败时, 仍发送已生成的消息
+                queue.put_nowait(None)
+                if sender is not None:
+                    await sender
+
+            # 补发解析时未能及时获取的附加信息, 并重新渲染缓存中的卡片
+            if result.follow_up is not None:
+                info = await result.follow_up
+                result.follow_up = None
+                if info:
+                    async with send_lock:
+                        await UniMessage(info).send()
+                    result.extra["info"] = info
+                    result.render_image = None
+        finally:
+            # 渲染或发送失败时取消未完成的附加信息获取
+            if result.follow_up is not None:
+                result.follow_up.cancel()
+                result.follow_up = None
+
+        # 缓存解析结果, 短链等解析后才能确定资源标识的, 同时以资源标识缓存
+        cache_ttl = result.cache_ttl or parser.cache_ttl
+        await _RESULT_CACHE.set(cache_key, result, cache_ttl)
+        if result.resource_id and str(result.resource_id) != cache_key:
+            await _RESULT_CACHE.set(str(result.resource_id), result, cache_ttl)
+
+    outcomes = await asyncio.gather(
+        *(parse_and_send(cache_key, parser, sr) for cache_key, (parser, sr) in targets.items()),
+        return_exceptions=True,
+    )
+    errors = [e for e in outcomes if isinstance(e, BaseException)]
 
-    except Exception:
-        # 发生错误，添加"失败"表情
+    # 5. 全部失败时添加"失败"表情并抛出异常, 否则添加"完成"表情
+    if len(errors) == len(outcomes):
         try:
             await UniHelper.message_reaction(event, "fail")
         except Exception:
             pass
-        raise
+        raise errors[0]
+
+    for error in errors:
+        logger.opt(exception=error).error("链接解析失败")
+    try:
+        await UniHelper.message_reaction(event, "done")
+    except Exception:
+        pass
 
 
 @on_command("bm", priority=3, block=True).handle()
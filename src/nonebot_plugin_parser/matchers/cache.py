@@ -0,0 +1,309 @@
+import time
+import asyncio
+import hashlib
+from typing import Any
+from asyncio import Task
+from pathlib import Path
+
+import msgspec
+from msgspec import Struct
+from nonebot import logger
+
+from ..utils import LimitedSizeDict
+from ..parsers.data import (
+    Author,
+    Platform,
+    ParseResult,
+    AudioContent,
+    ImageContent,
+    MediaContent,
+    VideoContent,
+    DynamicContent,
+    GraphicsContent,
+)
+
+
+class _AuthorRecord(Struct):
+    name: str
+    avatar: str | None = None
+    description: str | None = None
+
+
+class _AudioRecord(Struct, tag="audio"):
+    path: str
+    duration: float = 0.0
+
+
+class _VideoRecord(Struct, tag="video"):
+    path: str
+    cover: str | None = None
+    duration: float = 0.0
+
+
+class _ImageRecord(Struct, tag="image"):
+    path: str
+
+
+class _DynamicRecord(Struct, tag="dynamic"):
+    path: str
+    gif_path: str | None = None
+
+
+class _GraphicsRecord(Struct, tag="graphics"):
+    path: str
+    text: str | None = None
+    alt: str | None = None
+
+
+_ContentRecord = _AudioRecord | _VideoRecord | _ImageRecord | _DynamicRecord | _GraphicsRecord
+
+
+class _ResultRecord(Struct):
+    platform: str
+    display_name: str
+    author: _AuthorRecord | None = None
+    title: str | None = None
+    text: str | None = None
+    timestamp: int | None = None
+    url: str | None = None
+    contents: list[_ContentRecord] = []
+    extra: dict[str, Any] = {}
+    repost: "_ResultRecord | None" = None
+    render_image: str | None = None
+
+
+class _Expiry(Struct):
+    expires_at: float
+
+
+class _Entry(Struct):
+    expires_at: float
+    result: _ResultRecord
+
+
+class _Unresolved(Exception):
+    """媒体任务未完成或失败, 结果不可持久化"""
+
+
+def _dump_path(path_task: Path | Task[Path] | None) -> str | None:
+    if path_task is None:
+        return None
+    if isinstance(path_task, Task):
+        if not path_task.done() or path_task.cancelled() or path_task.exception() is not None:
+            raise _Unresolved
+        path_task = path_task.result()
+    return str(path_task)
+
+
+def _dump_content(cont: MediaContent) -> _ContentRecord:
+    path = _dump_path(cont.path_task)
+    assert path is not None
+    match cont:
+        case AudioContent():
+            return _AudioRecord(path, cont.duration)
+        case VideoContent():
+            return _VideoRecord(path, _dump_path(cont.cover), cont.duration)
+        case DynamicContent():
+            return _DynamicRecord(path, _dump_path(cont.gif_path))
+        case GraphicsContent():
+            return _GraphicsRecord(path, cont.text, cont.alt)
+        case ImageContent():
+            return _ImageRecord(path)
+    raise _Unresolved
+
+
+def _dump_result(result: ParseResult) -> _ResultRecord:
+    author = None
+    if result.author:
+        author = _AuthorRecord(result.author.name, _dump_path(result.author.avatar), result.author.description)
+    return _ResultRecord(
+        platform=result.platform.name,
+        display_name=result.platform.display_name,
+        author=author,
+        title=result.title,
+        text=result.text,
+        timestamp=result.timestamp,
+        url=result.url,
+        contents=[_dump_content(cont) for cont in result.contents],
+        extra=result.extra,
+        repost=_dump_result(result.repost) if result.repost else None,
+        render_image=str(result.render_image) if result.render_image else None,
+    )
+
+
+def _load_path(path: str | None) -> Path | None:
+    if path is None:
+        return None
+    if not (file := Path(path)).exists():
+        raise FileNotFoundError(path)
+    return file
+
+
+def _load_content(record: _ContentRecord) -> MediaContent:
+    path = _load_path(record.path)
+    assert path is not None
+    match record:
+        case _AudioRecord():
+            return AudioContent(path, duration=record.duration)
+        case _VideoRecord():
+            return VideoContent(path, cover=_load_path(record.cover), duration=record.duration)
+        case _DynamicRecord():
+            return DynamicContent(path, gif_path=_load_path(record.gif_path))
+        case _GraphicsRecord():
+            return GraphicsContent(path, text=record.text, alt=record.alt)
+        case _ImageRecord():
+            return ImageContent(path)
+
+
+def _load_result(record: _ResultRecord) -> ParseResult:
+    author = None
+    if record.author:
+        author = Author(record.author.name, _load_path(record.author.avatar), record.author.description)
+    render_image = Path(record.render_image) if record.render_image else None
+    return ParseResult(
+        platform=Platform(record.platform, record.display_name),
+        author=author,
+        title=record.title,
+        text=record.text,
+        timestamp=record.timestamp,
+        url=record.url,
+        contents=[_load_content(cont) for cont in record.contents],
+        extra=record.extra,
+        repost=_load_result(record.repost) if record.repost else None,
+        # 渲染图片被淘汰时重新渲染即可
+        render_image=render_image if render_image and render_image.exists() else None,
+    )
+
+
+def _resolved_path(path_task: Path | Task[Path] | None) -> Path | None:
+    """已下载完成的媒体路径, 未完成或失败的任务返回 None"""
+    try:
+        return Path(path) if (path := _dump_path(path_task)) else None
+    except _Unresolved:
+        return None
+
+
+def _result_paths(result: ParseResult) -> list[Path]:
+    """结果引用的已下载完成的媒体文件, 用于校验是否已被淘汰"""
+    path_tasks: list[Path | Task[Path] | None] = []
+    if result.author:
+        path_tasks.append(result.author.avatar)
+    for cont in result.contents:
+        path_tasks.append(cont.path_task)
+        if isinstance(cont, VideoContent):
+            path_tasks.append(cont.cover)
+        if isinstance(cont, DynamicContent):
+            path_tasks.append(cont.gif_path)
+    paths = [path for path_task in path_tasks if (path := _resolved_path(path_task))]
+    if result.repost:
+        paths.extend(_result_paths(result.repost))
+    return paths
+
+
+_encoder = msgspec.msgpack.Encoder()
+_entry_decoder = msgspec.msgpack.Decoder(_Entry)
+_expiry_decoder = msgspec.msgpack.Decoder(_Expiry)
+
+
+class ResultCache:
+    """解析结果缓存
+
+    - 内存中保留最近的 ParseResult, 磁盘上以 msgpack 保存已下载完成的结果, 重启后依然有效
+    - 每条结果有独立的过期时间, 由 parser 按平台和内容类型决定
+    - 结果引用的媒体文件被淘汰后, 该结果视为未命中
+    """
+
+    def __init__(self, root: Path, memory_size: int = 50):
+        self.root: Path = root
+        """磁盘缓存目录"""
+        self._memory = LimitedSizeDict[str, tuple[float, ParseResult]](max_size=memory_size)
+
+    def _file(self, key: str) -> Path:
+        return self.root / f"{hashlib.md5(key.encode()).hexdigest()}.msgpack"
+
+    async def get(self, key: str) -> ParseResult | None:
+        """获取未过期且媒体文件完整的结果
+
+        Args:
+            key (str): 缓存 key
+
+        Returns:
+            ParseResult | None: 解析结果
+        """
+        if item := self._memory.get(key):
+            expires_at, result = item
+            if expires_at > time.time() and all(path.exists() for path in _result_paths(result)):
+                return result
+            del self._memory[key]
+
+        return await asyncio.to_thread(self._load, key)
+
+    def _load(self, key: str) -> ParseResult | None:
+        file = self._file(key)
+        try:
+            entry = _entry_decoder.decode(file.read_bytes())
+            if entry.expires_at <= time.time():
+                raise TimeoutError
+            return _load_result(entry.result)
+        except (FileNotFoundError, TimeoutError, msgspec.DecodeError):
+            # 缓存不存在, 已过期, 或者引用的媒体文件已被淘汰
+            file.unlink(missing_ok=True)
+        return None
+
+    async def set(self, key: str, result: ParseResult, ttl: float) -> None:
+        """缓存结果, 媒体未全部下载成功的结果仅保存在内存中
+
+        Args:
+            key (str): 缓存 key
+            result (ParseResult): 解析结果
+            ttl (float): 有效时长 单位: 秒
+        """
+        if ttl <= 0:
+            return
+        expires_at = time.time() + ttl
+        self._memory[key] = (expires_at, result)
+
+        try:
+            data = _encoder.encode(_Entry(expires_at, _dump_result(result)))
+        except _Unresolved:
+            return
+        except (TypeError, msgspec.EncodeError):
+            logger.debug(f"解析结果无法序列化, 跳过持久化: {key}")
+            return
+        await asyncio.to_thread(self._save, key, data)
+
+    def _save(self, key: str, data: bytes) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        file = self._file(key)
+        tmp = file.with_name(f"{file.name}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(file)
+
+    async def purge(self) -> int:
+        """删除过期的磁盘缓存
+
+        Returns:
+            int: 删除的数量
+        """
+        return await asyncio.to_thread(self._purge)
+
+    def _purge(self) -> int:
+        if not self.root.exists():
+            return 0
+        now = time.time()
+        count = 0
+        for file in self.root.glob("*.msgpack"):
+            try:
+                if _expiry_decoder.decode(file.read_bytes()).expires_at > now:
+                    continue
+            except msgspec.DecodeError:
+                pass
+            except OSError:
+                continue
+            file.unlink(missing_ok=True)
+            count += 1
+        return count
+
+    def clear(self) -> None:
+        """清空内存缓存"""
+        self._memory.clear()
@@ -1,4 +1,5 @@
 import re
+import time
 from typing import Literal
 
 import msgspec
@@ -10,13 +11,15 @@ from nonebot.matcher import Matcher
 from nonebot.plugin.on import get_matcher_source
 from nonebot.permission import Permission
 from nonebot_plugin_uninfo import Session, UniSession
-from nonebot_plugin_alconna.uniseg import Hyper, UniMsg
+from nonebot_plugin_alconna.uniseg import Text, Hyper, UniMsg
 
+from ..utils import KeyPatternMatcher
 from .filter import is_enabled, is_platform_enabled
 from ..config import gconfig, pconfig
 
 # 统一的状态键
 PSR_SEARCHED_KEY: Literal["psr-searched"] = "psr-searched"
+PSR_SEARCHED_ALL_KEY: Literal["psr-searched-all"] = "psr-searched-all"
 PSR_FORCE_PARSE_KEY: Literal["psr-force-parse"] = "psr-force-parse"
 
 
@@ -72,6 +75,19 @@ def _searched(state: T_State) -> SearchResult | None:
     return state.get(PSR_SEARCHED_KEY)
 
 
+def SearchedAll() -> list[SearchResult]:
+    """依赖注入，返回消息中的所有 SearchResult, 按出现顺序排列"""
+    return Depends(_searched_all)
+
+
+def _searched_all(state: T_State) -> list[SearchResult]:
+    """从 state 中提取所有匹配结果, 单链接模式下只有一个"""
+    if searched_all := state.get(PSR_SEARCHED_ALL_KEY):
+        return searched_all
+    searched = state.get(PSR_SEARCHED_KEY)
+    return [searched] if searched else []
+
+
 def _extract_url(hyper: Hyper) -> str | None:
     """处理 JSON 类型的消息段，提取 URL
 
@@ -127,9 +143,57 @@ class KeyPatternList(list[tuple[str, re.Pattern[str]]]):
             self.append((key, pattern))
         # 按 key 长 -> 短
         self.sort(key=lambda x: -len(x[0]))
+        self.matcher = KeyPatternMatcher(self)
         logger.debug(f"KeyWords: {[k for k, _ in self]}")
 
 
+class PrefilterStats:
+    """预过滤统计, 用于观察拒绝比例和节省的耗时"""
+
+    __slots__ = ("checked", "passed_ns", "prefilter_ns", "rejected", "rule_ns", "unmatched", "unmatched_ns")
+
+    def __init__(self):
+        self.checked: int = 0
+        """经过预过滤的消息数"""
+        self.rejected: int = 0
+        """被预过滤直接拒绝的消息数"""
+        self.unmatched: int = 0
+        """通过预过滤但未匹配到链接的消息数"""
+        self.prefilter_ns: int = 0
+        """预过滤总耗时"""
+        self.rule_ns: int = 0
+        """完整规则总耗时"""
+        self.unmatched_ns: int = 0
+        """通过预过滤但未匹配到链接的消息在完整规则中的总耗时"""
+
+    @property
+    def reject_ratio(self) -> float:
+        """拒绝比例"""
+        return self.rejected / self.checked if self.checked else 0.0
+
+    @property
+    def saved_ns(self) -> float:
+        """每条被拒绝的消息节省的耗时估计, 以未匹配消息在完整规则中的平均耗时为基准"""
+        passed = self.checked - self.rejected
+        if self.unmatched:
+            baseline = self.unmatched_ns / self.unmatched
+        elif passed:
+            baseline = self.rule_ns / passed
+        else:
+            return 0.0
+        return baseline - self.prefilter_ns / self.checked
+
+    def __str__(self) -> str:
+        return (
+            f"预过滤: {self.rejected}/{self.checked} 条消息被拒绝 ({self.reject_ratio:.1%}), "
+            f"平均每条节省 {self.saved_ns / 1000:.2f}us"
+        )
+
+
+PREFILTER_STATS = PrefilterStats()
+"""全局预过滤统计"""
+
+
 class KeywordRegexRule:
     """检查消息是否含有关键词, 有关键词进行正则匹配"""
 
@@ -148,40 +212,79 @@ class KeywordRegexRule:
         return hash(frozenset(self.key_pattern_list))
 
     async def __call__(self, message: UniMsg, state: T_State) -> bool:
+        stats = PREFILTER_STATS
+        start = time.perf_counter_ns()
+        passed = self._prefilter(message)
+        checked = time.perf_counter_ns()
+        stats.checked += 1
+        stats.prefilter_ns += checked - start
+        if not passed:
+            stats.rejected += 1
+            return False
+
+        matched = self._match(message, state)
+        elapsed = time.perf_counter_ns() - checked
+        stats.rule_ns += elapsed
+        if not matched:
+            stats.unmatched += 1
+            stats.unmatched_ns += elapsed
+        return matched
+
+    def _prefilter(self, message: UniMsg) -> bool:
+        """快速判断消息是否可能含有链接, 不含卡片且纯文本中没有任何关键词的消息直接拒绝"""
+        texts: list[str] = []
+        for seg in message:
+            if isinstance(seg, Hyper):
+                return True
+            if isinstance(seg, Text):
+                texts.append(seg.text)
+        if not texts:
+            return False
+        return self.key_pattern_list.matcher.contains(texts[0] if len(texts) == 1 else "".join(texts))
+
+    def _match(self, message: UniMsg, state: T_State) -> bool:
         text = _extract_text(message)
         if not text:
             return False
 
-        # 检查是否使用了解析前缀强制触发
-        force_parse = False
+        # 检查是否使用了解析前缀强制触发, 前缀模式: prefix+ 或 prefix（空格）
         parse_prefix = pconfig.parse_prefix
+        force_parse = bool(parse_prefix) and text.startswith((f"{parse_prefix}+", f"{parse_prefix} "))
+        state[PSR_FORCE_PARSE_KEY] = force_parse
+        if force_parse:
+            # 去除前缀
+            text = text[len(parse_prefix) + 1 :].lstrip()
+            logger.debug(f"检测到前缀 '{parse_prefix}' 强制解析，去除后: '{text[:50]}...'")
 
-        # 如果没有设置前缀，跳过前缀检查
-        if not parse_prefix:
-            state[PSR_FORCE_PARSE_KEY] = False
-        else:
-            # 检查前缀模式: prefix+ 或 prefix（空格）
-            if text.startswith(f"{parse_prefix}+") or text.startswith(f"{parse_prefix} "):
-                force_parse = True
-                # 去除前缀
-                if text.startswith(f"{parse_prefix}+"):
-                    text = text[len(f"{parse_prefix}+"):].lstrip()
-                else:
-                    text = text[len(f"{parse_prefix} "):].lstrip()
-                logger.debug(f"检测到前缀 '{parse_prefix}' 强制解析，去除后: '{text[:50]}...'")
-                state[PSR_FORCE_PARSE_KEY] = True
-            else:
-                state[PSR_FORCE_PARSE_KEY] = False
-
-        for keyword, pattern in self.key_pattern_list:
-            if keyword not in text:
-                continue
+        if pconfig.max_links > 1:
+            return self._search_all(text, state)
+
+        for keyword, pattern in self.key_pattern_list.matcher.candidates(text):
             if searched := pattern.search(text):
                 state[PSR_SEARCHED_KEY] = SearchResult(text=text, keyword=keyword, searched=searched)
                 return True
             logger.debug(f"keyword '{keyword}' is in '{text}', but not matched")
         return False
 
+    def _search_all(self, text: str, state: T_State) -> bool:
+        """多链接模式, 收集所有不重叠的匹配, 长关键词优先"""
+        results: list[SearchResult] = []
+        spans: list[tuple[int, int]] = []
+        for keyword, pattern in self.key_pattern_list.matcher.candidates(text):
+            for searched in pattern.finditer(text):
+                start, end = searched.span()
+                if any(start < s_end and s_start < end for s_start, s_end in spans):
+                    continue
+                spans.append((start, end))
+                results.append(SearchResult(text=text, keyword=keyword, searched=searched))
+
+        if not results:
+            return False
+        results.sort(key=lambda sr: sr.searched.start())
+        state[PSR_SEARCHED_KEY] = results[0]
+        state[PSR_SEARCHED_ALL_KEY] = results
+        return True
+
 
 def keyword_regex(*args: tuple[str, str | re.Pattern[str]]) -> Rule:
     return Rule(KeywordRegexRule(KeyPatternList(*args)))
@@ -18,6 +18,7 @@ from .base import handle
 from .data import (
     Author,
     Platform,
+    ResourceId,
     ParseResult,
     AudioContent,
     ImageContent,
@@ -35,6 +36,7 @@ __all__ = [
     "ImageContent",
     "ParseResult",
     "Platform",
+    "ResourceId",
     "VideoContent",
     "handle",
 ]
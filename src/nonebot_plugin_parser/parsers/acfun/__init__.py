@@ -5,15 +5,17 @@ from pathlib import Path
 from urllib.parse import urljoin
 
 import aiofiles
-from httpx import HTTPError, AsyncClient
+from httpx import HTTPError
 from nonebot import logger
 
 from ..base import (
+    DISK_CACHE,
     DOWNLOADER,
     COMMON_TIMEOUT,
     DOWNLOAD_TIMEOUT,
     Platform,
     BaseParser,
+    ResourceId,
     PlatformEnum,
     ParseException,
     DownloadException,
@@ -26,11 +28,15 @@ from ..base import (
 class AcfunParser(BaseParser):
     # 平台信息
     platform: ClassVar[Platform] = Platform(name=PlatformEnum.ACFUN, display_name="猴山")
+    cache_ttl: ClassVar[int] = 7 * 24 * 60 * 60
 
     def __init__(self):
         super().__init__()
         self.headers["referer"] = "https://www.acfun.cn/"
 
+    def get_resource_id(self, keyword: str, searched: re.Match[str]) -> ResourceId | None:
+        return self.resource_id("video", int(searched.group("acid")))
+
     @handle("acfun.cn", r"(?:ac=|/ac)(?P<acid>\d+)")
     async def _parse(self, searched: re.Match[str]):
         acid = int(searched.group("acid"))
@@ -71,7 +77,7 @@ class AcfunParser(BaseParser):
         # 拼接查询参数
         url = f"{url}?quickViewId=videoInfo_new&ajaxpipe=1"
 
-        async with AsyncClient(headers=self.headers, timeout=COMMON_TIMEOUT) as client:
+        async with self.client(headers=self.headers, timeout=COMMON_TIMEOUT) as client:
             response = await client.get(url)
             response.raise_for_status()
             raw = response.text
@@ -100,8 +106,9 @@ class AcfunParser(BaseParser):
         if duration >= pconfig.duration_maximum:
             raise DurationLimitException
 
-        video_file = pconfig.cache_dir / file_name
+        video_file = DISK_CACHE.path(file_name)
         if video_file.exists():
+            DISK_CACHE.touch(video_file)
             return video_file
 
         m3u8_slices = await self._get_m3u8_slices(m3u8_url)
@@ -109,7 +116,7 @@ class AcfunParser(BaseParser):
         try:
             async with (
                 aiofiles.open(video_file, "wb") as f,
-                AsyncClient(headers=self.headers, timeout=DOWNLOAD_TIMEOUT) as client,
+                self.client(headers=self.headers, timeout=DOWNLOAD_TIMEOUT) as client,
             ):
                 total_size = 0
                 with DOWNLOADER.get_progress_bar(file_name) as bar:
@@ -135,7 +142,7 @@ class AcfunParser(BaseParser):
         Returns:
             list[str]: 视频链接
         """
-        async with AsyncClient(headers=self.headers, timeout=COMMON_TIMEOUT) as client:
+        async with self.client(headers=self.headers, timeout=COMMON_TIMEOUT) as client:
             response = await client.get(m3u8_url)
             response.raise_for_status()
 
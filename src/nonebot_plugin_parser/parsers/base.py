@@ -1,16 +1,28 @@
 """Parser 基类定义"""
 
+import json
+import time
+import asyncio
+import hashlib
+import ipaddress
 from re import Match, Pattern, compile
 from abc import ABC
 from typing import TYPE_CHECKING, Any, TypeVar, ClassVar, cast
 from asyncio import Task
 from pathlib import Path
+from urllib.request import getproxies
 from collections.abc import Callable, Coroutine
 from typing_extensions import Unpack
 
-from .data import Platform, ParseResult, ParseResultKwargs
+from httpx import Limits, Request, Response, AsyncClient, AsyncBaseTransport, AsyncHTTPTransport
+from nonebot import logger, get_driver
+
+from .data import Platform, ResourceId, ParseResult, ParseResultKwargs
+from ..cache import DISK_CACHE as DISK_CACHE
+from ..utils import LimitedSizeDict, KeyPatternMatcher, is_module_available
 from ..config import pconfig as pconfig
 from ..download import DOWNLOADER as DOWNLOADER
+from ..download import Priority as Priority
 from ..constants import IOS_HEADER, COMMON_HEADER, ANDROID_HEADER, COMMON_TIMEOUT
 from ..constants import DOWNLOAD_TIMEOUT as DOWNLOAD_TIMEOUT
 from ..constants import PlatformEnum as PlatformEnum
@@ -20,24 +32,244 @@ from ..exception import DownloadException as DownloadException
 from ..exception import ZeroSizeException as ZeroSizeException
 from ..exception import SizeLimitException as SizeLimitException
 from ..exception import DurationLimitException as DurationLimitException
+from ..download.task import SingleFlight
 
 T = TypeVar("T", bound="BaseParser")
 HandlerFunc = Callable[[T, Match[str]], Coroutine[Any, Any, ParseResult]]
 KeyPatterns = list[tuple[str, Pattern[str]]]
 
 _KEY_PATTERNS = "_key_patterns"
+_CACHE_TTLS = "_cache_ttls"
+
+
+class _SharedTransport(AsyncBaseTransport):
+    """共享连接池的传输层, 客户端关闭时不关闭连接池"""
+
+    def __init__(self, transport: AsyncHTTPTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: Request) -> Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+def _environment_proxies() -> dict[str, str | None]:
+    """按 httpx 的规则读取环境变量中的代理, 返回 mounts 匹配规则到代理地址的映射, None 表示不使用代理"""
+    proxy_info = getproxies()
+    mounts: dict[str, str | None] = {}
+    for scheme in ("http", "https", "all"):
+        if proxy_url := proxy_info.get(scheme):
+            mounts[f"{scheme}://"] = proxy_url if "://" in proxy_url else f"http://{proxy_url}"
+
+    # 规则同 curl 的 NO_PROXY: https://curl.se/libcurl/c/CURLOPT_NOPROXY.html
+    for host in (host.strip() for host in proxy_info.get("no", "").split(",")):
+        if host == "*":
+            return {}
+        if not host:
+            continue
+        if "://" in host:
+            mounts[host] = None
+            continue
+        try:
+            ip = ipaddress.ip_address(host.split("/")[0])
+        except ValueError:
+            ip = None
+        if ip is not None:
+            mounts[f"all://[{host}]" if ip.version == 6 else f"all://{host}"] = None
+        elif host.lower() == "localhost":
+            mounts[f"all://{host}"] = None
+        else:
+            mounts[f"all://*{host}"] = None
+    return mounts
+
+
+class HttpClientRegistry:
+    """按平台复用连接池的 httpx 客户端注册表
+
+    - 同一平台(及 verify, proxy 组合)共享一个连接池, 保持 keep-alive, 可选 HTTP/2
+    - 客户端本身很轻量, 每次请求仍可独立设置 headers, cookies 和重定向策略
+    - 连接池在 driver 关闭时统一释放
+    """
+
+    def __init__(self, limits: Limits, http2: bool = False):
+        self.limits: Limits = limits
+        """连接池限制"""
+        self.http2: bool = http2
+        """是否启用 HTTP/2"""
+        self._transports: dict[tuple[str, bool, str | None], AsyncHTTPTransport] = {}
+
+    def client(
+        self,
+        key: str,
+        *,
+        verify: bool = True,
+        proxy: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncClient:
+        """获取使用共享连接池的客户端
+
+        Args:
+            key (str): 连接池标识, 通常为平台名称
+            verify (bool): 是否校验证书. Defaults to True.
+            proxy (str | None): 代理地址, 为 None 且 trust_env 时使用环境变量中的代理. Defaults to None.
+            **kwargs: 传递给 AsyncClient 的其他参数, 如 headers, timeout, follow_redirects, cookies
+
+        Returns:
+            AsyncClient: 客户端, 使用完毕后关闭不会影响连接池
+        """
+        # 自定义 transport 时 httpx 不再读取环境变量中的代理, 需要按 httpx 的规则自行挂载
+        mounts: dict[str, AsyncBaseTransport | None] = {}
+        if proxy is None and kwargs.get("trust_env", True):
+            for pattern, env_proxy in _environment_proxies().items():
+                mounts[pattern] = None if env_proxy is None else self._transport(key, verify, env_proxy)
+        return AsyncClient(transport=self._transport(key, verify, proxy), mounts=mounts, **kwargs)
+
+    def _transport(self, key: str, verify: bool, proxy: str | None) -> _SharedTransport:
+        pool_key = (key, verify, proxy)
+        transport = self._transports.get(pool_key)
+        if transport is None:
+            transport = AsyncHTTPTransport(verify=verify, proxy=proxy, http2=self.http2, limits=self.limits)
+            self._transports[pool_key] = transport
+        return _SharedTransport(transport)
+
+    async def aclose(self) -> None:
+        """关闭所有连接池"""
+        transports = list(self._transports.values())
+        self._transports.clear()
+        for transport in transports:
+            await transport.aclose()
+
+
+def _http2_enabled() -> bool:
+    if not pconfig.http2:
+        return False
+    if not is_module_available("h2"):
+        logger.warning("未安装 h2, HTTP/2 不可用, 请使用 `uv add httpx[http2]` 安装")
+        return False
+    return True
+
+
+CLIENTS = HttpClientRegistry(
+    limits=Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30),
+    http2=_http2_enabled(),
+)
+"""全局 HTTP 客户端注册表"""
+get_driver().on_shutdown(CLIENTS.aclose)
+
+
+class RedirectCache:
+    """短链重定向缓存
+
+    - 有过期时间和容量上限, 同一短链的并发解析共享同一次请求
+    - 可选持久化到磁盘, 重启后依然有效
+    """
+
+    def __init__(self, ttl: float, max_size: int = 1024, path: Path | None = None):
+        self.ttl: float = ttl
+        """缓存时长 单位: 秒, 小于等于 0 时不缓存"""
+        self.path: Path | None = path
+        """持久化文件路径, 为 None 时不持久化"""
+        self._entries = LimitedSizeDict[str, tuple[float, str]](max_size=max_size)
+        self._flights: SingleFlight[str, str] = SingleFlight()
+        self._loaded: bool = False
+
+    @staticmethod
+    def key(url: str, headers: dict[str, str], follow: bool) -> str:
+        """缓存 key, 不同 User-Agent 可能重定向到不同地址"""
+        ua = hashlib.md5(headers.get("User-Agent", "").encode()).hexdigest()[:8]
+        return f"{'final' if follow else 'once'}:{ua}:{url}"
+
+    async def resolve(self, key: str, url: str, fetch: Callable[[], Coroutine[Any, Any, str]]) -> str:
+        """获取缓存的重定向地址, 未命中时请求并缓存
+
+        Args:
+            key (str): 缓存 key
+            url (str): 原始 URL
+            fetch (Callable[[], Coroutine[Any, Any, str]]): 请求重定向地址的协程函数
+
+        Returns:
+            str: 重定向后的 URL
+        """
+        if self.ttl <= 0:
+            return await fetch()
+        if not self._loaded:
+            self._loaded = True
+            await asyncio.to_thread(self._load)
+
+        if entry := self._entries.get(key):
+            expires_at, target = entry
+            if expires_at > time.time():
+                self._entries.move_to_end(key)
+                return target
+            del self._entries[key]
+
+        async def fetch_and_cache() -> str:
+            target = await fetch()
+            # 未发生重定向时不缓存, 可能是临时错误
+            if target != url:
+                self._entries[key] = (time.time() + self.ttl, target)
+            return target
+
+        return await self._flights.do(key, fetch_and_cache)
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            entries: dict[str, list] = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            logger.warning(f"读取重定向缓存 {self.path} 失败")
+            return
+        now = time.time()
+        for key, (expires_at, target) in entries.items():
+            if expires_at > now and key not in self._entries:
+                self._entries[key] = (expires_at, target)
+
+    async def save(self) -> None:
+        """持久化未过期的缓存"""
+        if self.path is None or not self._entries:
+            return
+        now = time.time()
+        entries = {key: entry for key, entry in self._entries.items() if entry[0] > now}
+        await asyncio.to_thread(self._save, json.dumps(entries, ensure_ascii=False))
+
+    def _save(self, data: str) -> None:
+        assert self.path is not None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.tmp")
+        tmp.write_text(data)
+        tmp.replace(self.path)
+
+
+REDIRECTS = RedirectCache(
+    ttl=pconfig.redirect_cache_ttl,
+    path=pconfig.cache_dir / "redirects" / "redirects.json" if pconfig.redirect_cache_persist else None,
+)
+"""全局短链重定向缓存"""
+get_driver().on_shutdown(REDIRECTS.save)
 
 
 # 注册处理器装饰器
-def handle(keyword: str, pattern: str):
-    """注册处理器装饰器"""
+def handle(keyword: str, pattern: str, cache_ttl: int | None = None):
+    """注册处理器装饰器
+
+    Args:
+        keyword (str): 关键词
+        pattern (str): 正则表达式
+        cache_ttl (int | None): 解析结果缓存时长 单位: 秒, 默认使用 parser 的 cache_ttl
+    """
 
     def decorator(func: HandlerFunc[T]) -> HandlerFunc[T]:
         if not hasattr(func, _KEY_PATTERNS):
             setattr(func, _KEY_PATTERNS, [])
+            setattr(func, _CACHE_TTLS, {})
 
         key_patterns: KeyPatterns = getattr(func, _KEY_PATTERNS)
         key_patterns.append((keyword, compile(pattern)))
+        if cache_ttl is not None:
+            getattr(func, _CACHE_TTLS)[keyword] = cache_ttl
 
         return func
 
@@ -57,9 +289,14 @@ class BaseParser:
     platform: ClassVar[Platform]
     """ 平台信息（包含名称和显示名称） """
 
+    cache_ttl: ClassVar[int] = 24 * 60 * 60
+    """ 解析结果缓存时长 单位: 秒 """
+
     if TYPE_CHECKING:
         _key_patterns: ClassVar[KeyPatterns]
         _handlers: ClassVar[dict[str, HandlerFunc]]
+        _cache_ttls: ClassVar[dict[str, int]]
+        _matcher: ClassVar[KeyPatternMatcher]
 
     def __init__(self):
         self.headers = COMMON_HEADER.copy()
@@ -75,6 +312,7 @@ class BaseParser:
 
         cls._handlers = {}
         cls._key_patterns = []
+        cls._cache_ttls = {}
 
         # 获取所有被 handle 装饰的方法
         for attr_name in dir(cls):
@@ -85,9 +323,11 @@ class BaseParser:
                 for keyword, pattern in key_patterns:
                     cls._handlers[keyword] = handler
                     cls._key_patterns.append((keyword, pattern))
+                cls._cache_ttls.update(getattr(attr, _CACHE_TTLS))
 
         # 按关键字长度降序排序
         cls._key_patterns.sort(key=lambda x: -len(x[0]))
+        cls._matcher = KeyPatternMatcher(cls._key_patterns)
 
     @classmethod
     def get_all_subclass(cls) -> list[type["BaseParser"]]:
@@ -107,7 +347,35 @@ class BaseParser:
         Raises:
             ParseException: 解析失败时抛出
         """
-        return await self._handlers[keyword](self, searched)
+        result = await self._handlers[keyword](self, searched)
+        # 重定向解析时以最终处理器的缓存时长和资源标识为准
+        if result.cache_ttl is None:
+            result.cache_ttl = self.get_cache_ttl(keyword)
+        if result.resource_id is None:
+            result.resource_id = self.get_resource_id(keyword, searched)
+        return result
+
+    def get_resource_id(self, keyword: str, searched: Match[str]) -> ResourceId | None:
+        """从匹配结果中提取资源标识, 用作缓存 key
+
+        仅做不需要网络请求的规范化, 无法确定时(如短链)返回 None
+
+        Args:
+            keyword: 关键词
+            searched: 正则表达式匹配对象
+
+        Returns:
+            ResourceId | None: 资源标识
+        """
+        return None
+
+    def resource_id(self, type: str, id: str | int, page: int | None = None) -> ResourceId:
+        """构建当前平台的资源标识"""
+        return ResourceId(PlatformEnum(self.platform.name).value, type, str(id), page)
+
+    def get_cache_ttl(self, keyword: str) -> int:
+        """获取关键词对应解析结果的缓存时长 单位: 秒"""
+        return self._cache_ttls.get(keyword, self.cache_ttl)
 
     async def parse_with_redirect(
         self,
@@ -126,11 +394,8 @@ class BaseParser:
     @classmethod
     def search_url(cls, url: str) -> tuple[str, Match[str]]:
         """搜索 URL 匹配模式"""
-        for keyword, pattern in cls._key_patterns:
-            if keyword not in url:
-                continue
-            if searched := pattern.search(url):
-                return keyword, searched
+        if matched := cls._matcher.search(url):
+            return matched
         raise ParseException(f"无法匹配 {url}")
 
     @classmethod
@@ -138,25 +403,32 @@ class BaseParser:
         """构建解析结果"""
         return ParseResult(platform=cls.platform, **kwargs)
 
+    def client(self, *, verify: bool = True, proxy: str | None = None, **kwargs: Any) -> AsyncClient:
+        """获取使用平台共享连接池的客户端, 参数同 `HttpClientRegistry.client`"""
+        return CLIENTS.client(self.platform.name, verify=verify, proxy=proxy, **kwargs)
+
     @staticmethod
     async def get_redirect_url(
         url: str,
         headers: dict[str, str] | None = None,
     ) -> str:
         """获取重定向后的 URL, 单次重定向"""
-        from httpx import AsyncClient
-
         headers = headers or COMMON_HEADER.copy()
-        async with AsyncClient(
-            headers=headers,
-            verify=False,
-            follow_redirects=False,
-            timeout=COMMON_TIMEOUT,
-        ) as client:
-            response = await client.get(url)
-            if response.status_code >= 400:
-                response.raise_for_status()
-            return response.headers.get("Location", url)
+
+        async def fetch() -> str:
+            async with CLIENTS.client(
+                "redirect",
+                headers=headers,
+                verify=False,
+                follow_redirects=False,
+                timeout=COMMON_TIMEOUT,
+            ) as client:
+                response = await client.get(url)
+                if response.status_code >= 400:
+                    response.raise_for_status()
+                return response.headers.get("Location", url)
+
+        return await REDIRECTS.resolve(REDIRECTS.key(url, headers, follow=False), url, fetch)
 
     @staticmethod
     async def get_final_url(
@@ -164,19 +436,22 @@ class BaseParser:
         headers: dict[str, str] | None = None,
     ) -> str:
         """获取重定向后的 URL, 允许多次重定向"""
-        from httpx import AsyncClient
-
         headers = headers or COMMON_HEADER.copy()
-        async with AsyncClient(
-            headers=headers,
-            verify=False,
-            follow_redirects=True,
-            timeout=COMMON_TIMEOUT,
-        ) as client:
-            response = await client.get(url)
-            if response.status_code >= 400:
-                response.raise_for_status()
-            return str(response.url)
+
+        async def fetch() -> str:
+            async with CLIENTS.client(
+                "redirect",
+                headers=headers,
+                verify=False,
+                follow_redirects=True,
+                timeout=COMMON_TIMEOUT,
+            ) as client:
+                response = await client.get(url)
+                if response.status_code >= 400:
+                    response.raise_for_status()
+                return str(response.url)
+
+        return await REDIRECTS.resolve(REDIRECTS.key(url, headers, follow=True), url, fetch)
 
     def create_author(
         self,
@@ -189,7 +464,7 @@ class BaseParser:
 
         avatar_task = None
         if avatar_url:
-            avatar_task = DOWNLOADER.download_img(avatar_url, ext_headers=self.headers)
+            avatar_task = DOWNLOADER.download_img(avatar_url, ext_headers=self.headers, priority=Priority.CARD)
         return Author(name=name, avatar=avatar_task, description=description)
 
     def create_video_content(
@@ -203,7 +478,7 @@ class BaseParser:
 
         cover_task = None
         if cover_url:
-            cover_task = DOWNLOADER.download_img(cover_url, ext_headers=self.headers)
+            cover_task = DOWNLOADER.download_img(cover_url, ext_headers=self.headers, priority=Priority.CARD)
         if isinstance(url_or_task, str):
             url_or_task = DOWNLOADER.download_video(url_or_task, ext_headers=self.headers)
 
@@ -233,9 +508,10 @@ class BaseParser:
             dynamic_urls: 动态图片 URL 列表
             convert_to_gif: 是否转换为 GIF，默认 False（仅推特平台使用）
         """
-        from .data import DynamicContent
         import asyncio
 
+        from .data import DynamicContent
+
         contents: list[DynamicContent] = []
         for url in dynamic_urls:
             task = DOWNLOADER.download_video(url, ext_headers=self.headers)
@@ -256,7 +532,7 @@ class BaseParser:
         Returns:
             GIF 文件路径
         """
-        from ..utils import convert_video_to_gif, has_audio_stream
+        from ..utils import has_audio_stream, convert_video_to_gif
 
         # 等待视频下载完成
         video_path = await video_task
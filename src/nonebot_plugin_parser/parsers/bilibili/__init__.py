@@ -1,13 +1,14 @@
-import json
+import time
 import asyncio
 from re import Match
-from typing import ClassVar, Any
-from collections.abc import AsyncGenerator
+from typing import TYPE_CHECKING, Any, ClassVar
+from asyncio import Task
 from pathlib import Path
+from collections.abc import Callable, Coroutine, AsyncGenerator
 
 from msgspec import convert
-from nonebot import logger
-from bilibili_api import HEADERS, Credential, select_client, request_settings
+from nonebot import logger, get_driver
+from bilibili_api import HEADERS, Credential, aid2bvid, select_client, request_settings
 from bilibili_api.opus import Opus
 from bilibili_api.video import Video
 from bilibili_api.login_v2 import QrCodeLogin, QrCodeLoginEvents
@@ -21,7 +22,9 @@ except ImportError:
     logger.warning("未检测到 nonebot_plugin_htmlrender，B站动态将仅使用文本/图片解析模式")
 
 from ..base import (
+    DISK_CACHE,
     DOWNLOADER,
+    Priority,
     BaseParser,
     PlatformEnum,
     ParseException,
@@ -30,8 +33,14 @@ from ..base import (
     handle,
     pconfig,
 )
-from ..data import Platform, ImageContent, MediaContent
-from ..cookie import ck2dict
+from ..data import Platform, ResourceId, ImageContent, MediaContent
+from .credential import CREDENTIAL
+from .screenshot import MOBILE_CONTEXT_OPTIONS, ContextPool, wait_until_ready
+from ...constants import ScreenshotPolicy
+from ...download.task import SingleFlight
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
 
 # 使用 httpx 客户端（curl_cffi 会被重定向到 t.bilibili.com）
 # select_client("curl_cffi")
@@ -41,80 +50,82 @@ from ..cookie import ck2dict
 HEADERS["Referer"] = "https://www.bilibili.com/"
 HEADERS["Origin"] = "https://www.bilibili.com"
 
+# 截图用的浏览器上下文池
+SCREENSHOT_POOL = (
+    ContextPool(
+        pconfig.screenshot_pool_size,
+        get_browser,
+        CREDENTIAL.playwright_cookies,
+        **MOBILE_CONTEXT_OPTIONS,
+    )
+    if HAS_HTMLRENDER
+    else None
+)
+if SCREENSHOT_POOL is not None:
+    get_driver().on_startup(SCREENSHOT_POOL.warm)
+    get_driver().on_shutdown(SCREENSHOT_POOL.aclose)
+
 
 class BilibiliParser(BaseParser):
     # 平台信息
     platform: ClassVar[Platform] = Platform(name=PlatformEnum.BILIBILI, display_name="哔哩哔哩")
+    cache_ttl: ClassVar[int] = 7 * 24 * 60 * 60
 
     def __init__(self):
         self.headers = HEADERS.copy()
-        self._credential: Credential | None = None
-        self._cookies_file = pconfig.config_dir / "bilibili_cookies.json"
-
-    async def _get_playwright_cookies(self) -> list[dict[str, Any]]:
-        """将 API 的 Cookie 转换为 Playwright 格式"""
-        cred = await self.credential
-        if not cred:
-            return []
-
-        cookies_dict = cred.get_cookies()
-        pw_cookies = []
-        for k, v in cookies_dict.items():
-            pw_cookies.append({
-                "name": k,
-                "value": v,
-                "domain": ".bilibili.com",
-                "path": "/"
-            })
-        return pw_cookies
-
-    async def _save_screenshot(self, img_bytes: bytes, content_type: str, content_id: int) -> Path:
-        """保存截图到缓存目录并返回路径"""
-        cache_dir = pconfig.cache_dir
-        cache_dir.mkdir(parents=True, exist_ok=True)
-
-        filename = f"bili_{content_type}_{content_id}.jpg"
-        output_path = cache_dir / filename
-
-        # 写入文件
-        output_path.write_bytes(img_bytes)
-        return output_path
+        self._screenshot_flights: SingleFlight[Path, Path] = SingleFlight()
+
+    async def _screenshot(
+        self,
+        content_type: str,
+        content_id: int,
+        capture: Callable[[int], Coroutine[Any, Any, bytes]],
+    ) -> Path:
+        """获取截图, 缓存有效期内直接复用已保存的截图, 相同内容的并发请求共享同一次截图
+
+        Args:
+            content_type (str): 内容类型, dynamic 或 opus
+            content_id (int): 动态/图文动态 id
+            capture (Callable[[int], Coroutine[Any, Any, bytes]]): 截图函数
+
+        Returns:
+            Path: 截图路径
+        """
+        output_path = DISK_CACHE.path(f"bili_{content_type}_{content_id}.jpg")
+        ttl = pconfig.bili_screenshot_ttl
+        try:
+            if ttl > 0 and time.time() - output_path.stat().st_mtime < ttl:
+                DISK_CACHE.touch(output_path)
+                return output_path
+        except FileNotFoundError:
+            pass
+
+        async def capture_and_save() -> Path:
+            img_bytes = await capture(content_id)
+            # 先写入临时文件再替换, 避免读取到不完整的截图
+            tmp_path = output_path.with_name(f"{output_path.name}.tmp")
+            await asyncio.to_thread(tmp_path.write_bytes, img_bytes)
+            tmp_path.replace(output_path)
+            return output_path
+
+        return await self._screenshot_flights.do(output_path, capture_and_save)
 
     async def _capture_opus_screenshot(self, opus_id: int) -> bytes:
         """使用 htmlrender 截取图文动态页面 (优化版: 元素级截图，去除留白)"""
-        if not HAS_HTMLRENDER:
+        if SCREENSHOT_POOL is None:
             raise ImportError("htmlrender not installed")
 
         url = f"https://m.bilibili.com/opus/{opus_id}"
 
-        # 获取浏览器实例
-        browser = await get_browser()
-
-        # 优化视口：宽度 414 (iPhone Max) 能容纳更多内容，同时保持移动端布局
-        # device_scale_factor=3 提升文字清晰度
-        context = await browser.new_context(
-            viewport={"width": 414, "height": 800},
-            device_scale_factor=3,
-            is_mobile=True,
-            has_touch=True,
-            user_agent="Mozilla/5.0 (iPhone; CPU iPhone OS 16_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.6 Mobile/15E148 Safari/604.1"
-        )
-
-        try:
-            # 注入 Cookie (避免弹窗)
-            cookies = await self._get_playwright_cookies()
-            if cookies:
-                await context.add_cookies(cookies)
-
-            page = await context.new_page()
-
-            # 访问页面
-            await page.goto(url, wait_until="networkidle", timeout=20000)
+        # 从上下文池中获取已注入 Cookie (避免弹窗) 的页面
+        async with SCREENSHOT_POOL.page() as page:
+            # 访问页面, 不等待 networkidle, 以核心内容出现为准
+            await page.goto(url, wait_until="domcontentloaded", timeout=20000)
 
             # 等待核心内容加载
             try:
                 await page.wait_for_selector(".opus-modules, .opus-detail", timeout=6000)
-            except:
+            except Exception:
                 pass
 
             # === 核心优化：注入 CSS 清理页面 ===
@@ -148,64 +159,31 @@ class BilibiliParser(BaseParser):
                 document.head.appendChild(style);
             }""")
 
-            # 滚动一下确保图片懒加载触发
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(0.5)
-            await page.evaluate("window.scrollTo(0, 0)")
-            await asyncio.sleep(0.5)
+            # 等待图片懒加载完成且内容高度稳定
+            await wait_until_ready(page, ".opus-modules, .opus-detail")
 
             # === 核心优化：智能截图 ===
-            # 1. 尝试 opus-modules 结构 (Opus 页面的主要容器)
-            target = page.locator(".opus-modules")
-            if await target.count() > 0 and await target.is_visible():
-                return await target.screenshot(type="jpeg", quality=85)
-
-            # 2. 尝试 opus-detail (某些 Opus 变体可能使用)
-            target = page.locator(".opus-detail")
-            if await target.count() > 0 and await target.is_visible():
-                return await target.screenshot(type="jpeg", quality=85)
-
+            # 1. opus-modules 结构 (Opus 页面的主要容器)
+            # 2. opus-detail (某些 Opus 变体可能使用)
             # 3. 兜底：全页截图
-            return await page.screenshot(full_page=True, type="jpeg", quality=85)
-
-        finally:
-            await context.close()
+            return await self._screenshot_target(page, ".opus-modules", ".opus-detail")
 
     async def _capture_dynamic_screenshot(self, dynamic_id: int) -> bytes:
         """使用 htmlrender 截取动态页面 (优化版: 元素级截图，去除留白)"""
-        if not HAS_HTMLRENDER:
+        if SCREENSHOT_POOL is None:
             raise ImportError("htmlrender not installed")
 
         url = f"https://m.bilibili.com/dynamic/{dynamic_id}"
 
-        # 获取浏览器实例
-        browser = await get_browser()
-
-        # 优化视口：宽度 414 (iPhone Max) 能容纳更多内容，同时保持移动端布局
-        # device_scale_factor=3 提升文字清晰度
-        context = await browser.new_context(
-            viewport={"width": 414, "height": 800},
-            device_scale_factor=3,
-            is_mobile=True,
-            has_touch=True,
-            user_agent="Mozilla/5.0 (iPhone; CPU iPhone OS 16_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.6 Mobile/15E148 Safari/604.1"
-        )
-
-        try:
-            # 注入 Cookie (避免弹窗)
-            cookies = await self._get_playwright_cookies()
-            if cookies:
-                await context.add_cookies(cookies)
-
-            page = await context.new_page()
-
-            # 访问页面
-            await page.goto(url, wait_until="networkidle", timeout=20000)
+        # 从上下文池中获取已注入 Cookie (避免弹窗) 的页面
+        async with SCREENSHOT_POOL.page() as page:
+            # 访问页面, 不等待 networkidle, 以核心内容出现为准
+            await page.goto(url, wait_until="domcontentloaded", timeout=20000)
 
             # 等待核心内容加载 (支持新版 Opus 和旧版 Dynamic)
             try:
                 await page.wait_for_selector(".opus-modules, .dyn-card, .opus-detail", timeout=6000)
-            except:
+            except Exception:
                 pass
 
             # === 核心优化：注入 CSS 清理页面 ===
@@ -245,39 +223,91 @@ class BilibiliParser(BaseParser):
                 expand_btn = page.locator(".dyn-content__expand")
                 if await expand_btn.count() > 0 and await expand_btn.is_visible():
                     await expand_btn.click()
-            except:
+            except Exception:
                 pass
 
-            # 滚动一下确保图片懒加载触发
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(0.5)
-            await page.evaluate("window.scrollTo(0, 0)")
-            await asyncio.sleep(0.5)
+            # 等待图片懒加载完成且内容高度稳定
+            await wait_until_ready(page, ".opus-modules, .opus-detail, .dyn-card")
 
             # === 核心优化：智能截图 ===
             # 优先尝试截取具体的"动态卡片"元素，而不是全屏
             # 这样可以自动适应高度，并且裁剪掉左右多余的 <body> 边距
-
-            # 1. 尝试 opus-modules (Opus 内容的主要容器)
-            target = page.locator(".opus-modules")
+            # 1. opus-modules (Opus 内容的主要容器)
+            # 2. opus-detail (某些 Opus 变体)
+            # 3. dyn-card (通用动态容器)
+            # 4. 兜底：如果找不到特定容器，截取全页
+            return await self._screenshot_target(page, ".opus-modules", ".opus-detail", ".dyn-card")
+
+    @staticmethod
+    async def _screenshot_target(page: "Page", *selectors: str) -> bytes:
+        """按顺序截取第一个可见的元素, 都不可见时截取全页"""
+        for selector in selectors:
+            target = page.locator(selector)
             if await target.count() > 0 and await target.is_visible():
                 return await target.screenshot(type="jpeg", quality=85)
+        return await page.screenshot(full_page=True, type="jpeg", quality=85)
 
-            # 2. 尝试 opus-detail (某些 Opus 变体)
-            target = page.locator(".opus-detail")
-            if await target.count() > 0 and await target.is_visible():
-                return await target.screenshot(type="jpeg", quality=85)
+    async def _hedge_screenshot(self, capture: Coroutine[Any, Any, Path], api_task: Task[Any]) -> Path | None:
+        """截图与已开始的 API 解析同时进行, 按配置的策略选择结果
 
-            # 3. 尝试 dyn-card (通用动态容器)
-            target = page.locator(".dyn-card")
-            if await target.count() > 0 and await target.is_visible():
-                return await target.screenshot(type="jpeg", quality=85)
+        Args:
+            capture (Coroutine[Any, Any, Path]): 截图协程
+            api_task (Task[Any]): API 解析任务, 结果为 None 时表示无需截图 (如专栏)
 
-            # 4. 兜底：如果找不到特定容器，截取 body 但裁剪掉视口外的留白
-            return await page.screenshot(full_page=True, type="jpeg", quality=85)
+        Returns:
+            Path | None: 截图路径, None 表示使用 API 解析结果
+        """
+        policy = pconfig.bili_screenshot_policy
+        if SCREENSHOT_POOL is None or policy is ScreenshotPolicy.api:
+            capture.close()
+            return None
 
+        shot = asyncio.create_task(capture)
+        pending: set[Task[Any]] = {shot, api_task}
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + pconfig.bili_screenshot_timeout
+        try:
+            while pending and not shot.done():
+                _, pending = await asyncio.wait(
+                    pending, timeout=deadline - loop.time(), return_when=asyncio.FIRST_COMPLETED
+                )
+                if api_task.done() and not api_task.cancelled() and api_task.exception() is None:
+                    # 无需截图, 或 fastest 策略下 API 解析先成功完成, 不再等待截图
+                    if not shot.done() and (api_task.result() is None or policy is ScreenshotPolicy.fastest):
+                        logger.debug("API 解析先完成, 取消截图")
+                        return None
+                if loop.time() >= deadline:
+                    break
+            if not shot.done():
+                logger.warning("截图超时，使用 API 解析结果")
+                return None
+            if exc := shot.exception():
+                logger.error(f"截图失败，将回退到普通解析模式: {exc}")
+                return None
+            return shot.result()
         finally:
-            await context.close()
+            # 取消落后的截图, 释放浏览器上下文
+            if not shot.done():
+                shot.cancel()
+                await asyncio.gather(shot, return_exceptions=True)
+
+    def get_resource_id(self, keyword: str, searched: Match[str]) -> ResourceId | None:
+        groups = searched.groupdict()
+        if bvid := groups.get("bvid"):
+            return self.resource_id("video", bvid, int(groups.get("page_num") or 1))
+        if avid := groups.get("avid"):
+            # av 号与 BV 号可以互相转换, 统一为 BV 号
+            return self.resource_id("video", aid2bvid(int(avid)), int(groups.get("page_num") or 1))
+        for group, type in (
+            ("dynamic_id", "dynamic"),
+            ("room_id", "live"),
+            ("fav_id", "favlist"),
+            ("read_id", "read"),
+            ("opus_id", "opus"),
+        ):
+            if value := groups.get(group):
+                return self.resource_id(type, value)
+        return None
 
     @handle("b23.tv", r"b23\.tv/[A-Za-z\d\._?%&+\-=/#]+")
     @handle("bili2233", r"bili2233\.cn/[A-Za-z\d\._?%&+\-=/#]+")
@@ -311,13 +341,13 @@ class BilibiliParser(BaseParser):
         dynamic_id = int(searched.group("dynamic_id"))
         return await self.parse_dynamic(dynamic_id)
 
-    @handle("live.bili", r"live\.bilibili\.com/(?P<room_id>\d+)")
+    @handle("live.bili", r"live\.bilibili\.com/(?P<room_id>\d+)", cache_ttl=60)
     async def _parse_live(self, searched: Match[str]):
         """解析直播信息"""
         room_id = int(searched.group("room_id"))
         return await self.parse_live(room_id)
 
-    @handle("/favlist", r"favlist\?fid=(?P<fav_id>\d+)")
+    @handle("/favlist", r"favlist\?fid=(?P<fav_id>\d+)", cache_ttl=10 * 60)
     async def _parse_favlist(self, searched: Match[str]):
         """解析收藏夹信息"""
         fav_id = int(searched.group("fav_id"))
@@ -358,10 +388,10 @@ class BilibiliParser(BaseParser):
             page_num (int): 页码
         """
 
-        from .video import VideoInfo, AIConclusion
+        from .video import VideoInfo
 
         video = await self._get_video(bvid=bvid, avid=avid)
-        # 转换为 msgspec struct
+        # 转换为 msgspec struct, 后续请求所需的 cid 和 up 主 mid 均取自视频信息, 不再单独请求
         video_info = convert(await video.get_info(), VideoInfo)
         # 获取简介
         text = f"简介: {video_info.desc}" if video_info.desc else None
@@ -370,32 +400,26 @@ class BilibiliParser(BaseParser):
         # 处理分 p
         page_info = video_info.extract_info_with_page(page_num)
 
-        # 获取 AI 总结
-        if self._credential:
-            cid = await video.get_cid(page_info.index)
-            ai_conclusion = await video.get_ai_conclusion(cid)
-            ai_conclusion = convert(ai_conclusion, AIConclusion)
-            ai_summary = ai_conclusion.summary
-        else:
-            ai_summary: str = "哔哩哔哩 cookie 未配置或失效, 无法使用 AI 总结"
-
         url = f"https://bilibili.com/{video_info.bvid}"
         url += f"?p={page_info.index + 1}" if page_info.index > 0 else ""
 
-        # 视频下载 task
+        # 视频下载 task, 与 AI 总结并发, 提前获取播放地址
         async def download_video():
-            output_path = pconfig.cache_dir / f"{video_info.bvid}-{page_num}.mp4"
+            output_path = DISK_CACHE.path(f"{video_info.bvid}-{page_num}.mp4")
             if output_path.exists():
+                DISK_CACHE.touch(output_path)
                 return output_path
-            v_url, a_url = await self.extract_download_urls(video=video, page_index=page_info.index)
             if page_info.duration > pconfig.duration_maximum:
                 raise DurationLimitException
+            v_url, a_url = await self.extract_download_urls(video=video, page_index=page_info.index, cid=page_info.cid)
             if a_url is not None:
                 return await DOWNLOADER.download_av_and_merge(
                     v_url, a_url, output_path=output_path, ext_headers=self.headers
                 )
             else:
-                return await DOWNLOADER.streamd(v_url, file_name=output_path.name, ext_headers=self.headers)
+                return await DOWNLOADER.streamd(
+                    v_url, file_name=output_path.name, ext_headers=self.headers, priority=Priority.VIDEO
+                )
 
         video_task = asyncio.create_task(download_video())
         video_content = self.create_video_content(
@@ -404,6 +428,19 @@ class BilibiliParser(BaseParser):
             page_info.duration,
         )
 
+        # 获取 AI 总结, 超时则先返回结果, 总结稍后补发
+        follow_up = None
+        if self.credential:
+            summary_task = asyncio.create_task(self._get_ai_summary(video, page_info.cid, video_info.owner.mid))
+            done, _ = await asyncio.wait((summary_task,), timeout=pconfig.bili_ai_summary_timeout)
+            if done:
+                ai_summary = summary_task.result()
+            else:
+                logger.debug(f"AI 总结获取超时, 稍后补发: {video_info.bvid}")
+                ai_summary, follow_up = None, summary_task
+        else:
+            ai_summary = "哔哩哔哩 cookie 未配置或失效, 无法使用 AI 总结"
+
         return self.result(
             url=url,
             title=page_info.title,
@@ -411,13 +448,25 @@ class BilibiliParser(BaseParser):
             text=text,
             author=author,
             contents=[video_content],
-            extra={"info": ai_summary},
+            extra={"info": ai_summary} if ai_summary else {},
+            follow_up=follow_up,
         )
 
+    async def _get_ai_summary(self, video: Video, cid: int, up_mid: int) -> str | None:
+        """获取 AI 总结, 失败时返回 None"""
+        from .video import AIConclusion
+
+        try:
+            ai_conclusion = await video.get_ai_conclusion(cid=cid, up_mid=up_mid)
+        except Exception:
+            logger.exception("获取 AI 总结失败")
+            return None
+        return convert(ai_conclusion, AIConclusion).summary
+
     async def parse_dynamic(self, dynamic_id: int):
         """解析动态信息
 
-        策略: 优先使用浏览器截图 -> 失败则回退到原解析逻辑
+        策略: 浏览器截图与 API 解析同时进行, 按 `parser_bili_screenshot_policy` 选择结果
 
         Args:
             dynamic_id (int): 动态 ID
@@ -426,13 +475,22 @@ class BilibiliParser(BaseParser):
 
         from .dynamic import DynamicData, DynamicInfo
 
-        dynamic = Dynamic(dynamic_id, await self.credential)
+        dynamic = Dynamic(dynamic_id, self.credential)
 
-        # 原项目新增：is_article() 检测
-        if await dynamic.is_article():
-            return await self._parse_bilibili_api_opus(dynamic.turn_to_opus())
+        async def get_info():
+            # 原项目新增：is_article() 检测, 专栏返回 None, 进行中的截图随即取消
+            if await dynamic.is_article():
+                return None
+            return await dynamic.get_info()
 
-        raw_data = await dynamic.get_info()
+        info_task = asyncio.create_task(get_info())
+        img_path = await self._hedge_screenshot(
+            self._screenshot("dynamic", dynamic_id, self._capture_dynamic_screenshot), info_task
+        )
+
+        raw_data = await info_task
+        if raw_data is None:
+            return await self._parse_opus_obj(dynamic.turn_to_opus())
 
         # msgspec 转换主数据
         dynamic_data = convert(raw_data, DynamicData)
@@ -450,28 +508,16 @@ class BilibiliParser(BaseParser):
             desc = current_info.desc_text or current_info.text or ""
             title = desc[:30].replace("\n", " ") + "..." if desc else f"{author.name} 的动态"
 
-        # 尝试截图渲染路径
-        screenshot_success = False
+        # 截图渲染路径
         contents = []
         text = None
 
-        if HAS_HTMLRENDER:
-            try:
-                logger.debug(f"尝试使用浏览器截图渲染动态: {dynamic_id}")
-                img_bytes = await self._capture_dynamic_screenshot(dynamic_id)
-                img_path = await self._save_screenshot(img_bytes, "dynamic", dynamic_id)
-                contents.append(ImageContent(img_path))
-                screenshot_success = True
-                # 截图模式下，文本置空，因为内容都在图里了
-                text = None
-            except Exception as e:
-                logger.error(f"动态截图失败，将回退到普通解析模式: {e}")
-                screenshot_success = False
-        else:
-            logger.debug("未启用 htmlrender，使用普通解析模式")
+        if img_path is not None:
+            # 截图模式下，文本置空，因为内容都在图里了
+            contents.append(ImageContent(img_path))
 
         # 回退路径 (Original Logic)
-        if not screenshot_success:
+        else:
             # --- 以下是原本的解析逻辑 ---
 
             # 手动处理 orig 字段（msgspec 可能无法正确转换嵌套的 orig）
@@ -527,46 +573,36 @@ class BilibiliParser(BaseParser):
     async def parse_opus(self, opus_id: int):
         """解析图文动态信息
 
-        策略: 优先使用浏览器截图 -> 失败则回退到原解析逻辑
+        策略: 浏览器截图与 API 解析同时进行, 按 `parser_bili_screenshot_policy` 选择结果
 
         Args:
             opus_id (int): 图文动态 id
         """
-        opus = Opus(opus_id, await self.credential)
+        from .opus import OpusItem
+
+        opus = Opus(opus_id, self.credential)
+
+        info_task = asyncio.create_task(opus.get_info())
+        img_path = await self._hedge_screenshot(
+            self._screenshot("opus", opus_id, self._capture_opus_screenshot), info_task
+        )
 
-        # 尝试截图渲染路径
-        screenshot_success = False
+        # 回退路径 (Original Logic), 复用已获取的信息
+        opus_info = await info_task
+        if img_path is None:
+            return await self._parse_opus_obj(opus, opus_info)
+
+        # 截图渲染路径, 从 API 获取基础元数据（标题、作者等）
         title = None
         author = None
         timestamp = None
-        contents = []
+        contents = [ImageContent(img_path)]
         text = None
-
-        if HAS_HTMLRENDER:
-            try:
-                logger.debug(f"尝试使用浏览器截图渲染图文动态: {opus_id}")
-                img_bytes = await self._capture_opus_screenshot(opus_id)
-                img_path = await self._save_screenshot(img_bytes, "opus", opus_id)
-                contents.append(ImageContent(img_path))
-                screenshot_success = True
-
-                # 从 API 获取基础元数据（标题、作者等）
-                from .opus import OpusItem
-                opus_info = await opus.get_info()
-                if isinstance(opus_info, dict):
-                    opus_data = convert(opus_info, OpusItem)
-                    title = opus_data.title
-                    author = self.create_author(*opus_data.name_avatar)
-                    timestamp = opus_data.timestamp
-            except Exception as e:
-                logger.error(f"图文动态截图失败，将回退到普通解析模式: {e}")
-                screenshot_success = False
-        else:
-            logger.debug("未启用 htmlrender，使用普通解析模式")
-
-        # 回退路径 (Original Logic)
-        if not screenshot_success:
-            return await self._parse_opus_obj(opus)
+        if isinstance(opus_info, dict):
+            opus_data = convert(opus_info, OpusItem)
+            title = opus_data.title
+            author = self.create_author(*opus_data.name_avatar)
+            timestamp = opus_data.timestamp
 
         return self.result(
             title=title,
@@ -588,11 +624,12 @@ class BilibiliParser(BaseParser):
         article = Article(read_id)
         return await self._parse_opus_obj(await article.turn_to_opus())
 
-    async def _parse_opus_obj(self, bili_opus: Opus):
+    async def _parse_opus_obj(self, bili_opus: Opus, opus_info: dict[str, Any] | None = None):
         """解析图文动态信息
 
         Args:
-            opus_id (int): 图文动态 id
+            bili_opus (Opus): 图文动态
+            opus_info (dict[str, Any] | None): 已获取的图文动态信息, 为 None 时重新获取
 
         Returns:
             ParseResult: 解析结果
@@ -600,7 +637,8 @@ class BilibiliParser(BaseParser):
 
         from .opus import OpusItem, TextNode, ImageNode
 
-        opus_info = await bili_opus.get_info()
+        if opus_info is None:
+            opus_info = await bili_opus.get_info()
         if not isinstance(opus_info, dict):
             raise ParseException("获取图文动态信息失败")
         # 转换为结构体
@@ -640,19 +678,19 @@ class BilibiliParser(BaseParser):
 
         from .live import RoomData
 
-        room = LiveRoom(room_display_id=room_id, credential=await self.credential)
+        room = LiveRoom(room_display_id=room_id, credential=self.credential)
         info_dict = await room.get_room_info()
 
         room_data = convert(info_dict, RoomData)
         contents: list[MediaContent] = []
-        # 下载封面
+        # 下载封面, 封面和关键帧都绘制在卡片上
         if cover := room_data.cover:
-            cover_task = DOWNLOADER.download_img(cover, ext_headers=self.headers)
+            cover_task = DOWNLOADER.download_img(cover, ext_headers=self.headers, priority=Priority.CARD)
             contents.append(ImageContent(cover_task))
 
         # 下载关键帧
         if keyframe := room_data.keyframe:
-            keyframe_task = DOWNLOADER.download_img(keyframe, ext_headers=self.headers)
+            keyframe_task = DOWNLOADER.download_img(keyframe, ext_headers=self.headers, priority=Priority.CARD)
             contents.append(ImageContent(keyframe_task))
 
         author = self.create_author(room_data.name, room_data.avatar)
@@ -702,9 +740,9 @@ class BilibiliParser(BaseParser):
             avid (int | None): avid
         """
         if avid:
-            return Video(aid=avid, credential=await self.credential)
+            return Video(aid=avid, credential=self.credential)
         elif bvid:
-            return Video(bvid=bvid, credential=await self.credential)
+            return Video(bvid=bvid, credential=self.credential)
         else:
             raise ParseException("avid 和 bvid 至少指定一项")
 
@@ -715,6 +753,7 @@ class BilibiliParser(BaseParser):
         bvid: str | None = None,
         avid: int | None = None,
         page_index: int = 0,
+        cid: int | None = None,
     ) -> tuple[str, str | None]:
         """解析视频下载链接
 
@@ -722,6 +761,7 @@ class BilibiliParser(BaseParser):
             bvid (str | None): bvid
             avid (int | None): avid
             page_index (int): 页索引 = 页码 - 1
+            cid (int | None): 分集 cid, 已知时省去按页索引查询 cid 的请求
         """
 
         from bilibili_api.video import (
@@ -734,7 +774,7 @@ class BilibiliParser(BaseParser):
             video = await self._get_video(bvid=bvid, avid=avid)
 
         # 获取下载数据
-        download_url_data = await video.get_download_url(page_index=page_index)
+        download_url_data = await video.get_download_url(page_index=page_index, cid=cid)
         detecter = VideoDownloadURLDataDetecter(download_url_data)
         streams = detecter.detect_best_streams(
             video_max_quality=pconfig.bili_video_quality,
@@ -753,20 +793,6 @@ class BilibiliParser(BaseParser):
         logger.debug(f"音频流质量: {audio_stream.audio_quality.name}")
         return video_stream.url, audio_stream.url
 
-    def _save_credential(self):
-        """存储哔哩哔哩登录凭证"""
-        if self._credential is None:
-            return
-
-        self._cookies_file.write_text(json.dumps(self._credential.get_cookies()))
-
-    def _load_credential(self):
-        """从文件加载哔哩哔哩登录凭证"""
-        if not self._cookies_file.exists():
-            return
-
-        self._credential = Credential.from_cookies(json.loads(self._cookies_file.read_text()))
-
     async def login_with_qrcode(self) -> bytes:
         """通过二维码登录获取哔哩哔哩登录凭证"""
         self._qr_login = QrCodeLogin()
@@ -784,8 +810,7 @@ class BilibiliParser(BaseParser):
             match state:
                 case QrCodeLoginEvents.DONE:
                     yield "登录成功"
-                    self._credential = self._qr_login.get_credential()
-                    self._save_credential()
+                    await CREDENTIAL.update(self._qr_login.get_credential())
                     break
                 case QrCodeLoginEvents.CONF:
                     if scan_tip_pending:
@@ -798,40 +823,7 @@ class BilibiliParser(BaseParser):
         else:
             yield "二维码登录超时, 请重新生成"
 
-    async def _init_credential(self):
-        """初始化哔哩哔哩登录凭证"""
-        if pconfig.bili_ck is None:
-            self._load_credential()
-            return
-
-        credential = Credential.from_cookies(ck2dict(pconfig.bili_ck))
-        if await credential.check_valid():
-            logger.info(f"`parser_bili_ck` 有效, 保存到 {self._cookies_file}")
-            self._credential = credential
-            self._save_credential()
-        else:
-            logger.info(f"`parser_bili_ck` 已过期, 尝试从 {self._cookies_file} 加载")
-            self._load_credential()
-
     @property
-    async def credential(self) -> Credential | None:
-        """哔哩哔哩登录凭证"""
-
-        if self._credential is None:
-            await self._init_credential()
-            return self._credential
-
-        if not await self._credential.check_valid():
-            logger.warning("哔哩哔哩凭证已过期, 请重新配置")
-            return None
-
-        if await self._credential.check_refresh():
-            logger.info("哔哩哔哩凭证需要刷新")
-            if self._credential.has_ac_time_value() and self._credential.has_bili_jct():
-                await self._credential.refresh()
-                logger.info(f"哔哩哔哩凭证刷新成功, 保存到 {self._cookies_file}")
-                self._save_credential()
-            else:
-                logger.warning("哔哩哔哩凭证刷新需要包含 `SESSDATA`, `ac_time_value` 项")
-
-        return self._credential
+    def credential(self) -> Credential | None:
+        """哔哩哔哩登录凭证, 由后台任务定时校验和刷新"""
+        return CREDENTIAL.credential
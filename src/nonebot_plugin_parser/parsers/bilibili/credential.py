@@ -0,0 +1,121 @@
+import json
+import asyncio
+from typing import Any
+from pathlib import Path
+
+from nonebot import logger
+from bilibili_api import Credential
+
+from ..base import pconfig
+from ..cookie import ck2dict
+
+
+class CredentialManager:
+    """哔哩哔哩登录凭证管理
+
+    - 由定时任务在后台校验和刷新凭证, 状态保存在内存中
+    - 解析时直接读取内存中的凭证, 不产生额外的网络请求
+    - 凭证变化时在线程中写入文件, 不阻塞事件循环
+    """
+
+    def __init__(self, cookies_file: Path):
+        self.cookies_file: Path = cookies_file
+        """凭证持久化文件"""
+        self._credential: Credential | None = None
+        self._valid: bool = True
+        self._loaded: bool = False
+        self._from_config: bool = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def credential(self) -> Credential | None:
+        """当前凭证, 未配置或已失效时为 None"""
+        if not self._loaded:
+            self._load()
+        return self._credential if self._valid else None
+
+    def playwright_cookies(self) -> list[dict[str, Any]]:
+        """将当前凭证的 Cookie 转换为 Playwright 格式"""
+        if (credential := self.credential) is None:
+            return []
+        return [
+            {"name": name, "value": value, "domain": ".bilibili.com", "path": "/"}
+            for name, value in credential.get_cookies().items()
+        ]
+
+    def _load(self):
+        """加载凭证, 配置项优先, 不校验有效性"""
+        self._loaded = True
+        if pconfig.bili_ck is not None:
+            self._credential = Credential.from_cookies(ck2dict(pconfig.bili_ck))
+            self._from_config = True
+        else:
+            self._credential = self._read()
+
+    def _read(self) -> Credential | None:
+        if not self.cookies_file.exists():
+            return None
+        return Credential.from_cookies(json.loads(self.cookies_file.read_text()))
+
+    def _write(self, cookies: dict[str, str]):
+        self.cookies_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cookies_file.with_name(f"{self.cookies_file.name}.tmp")
+        tmp.write_text(json.dumps(cookies))
+        tmp.replace(self.cookies_file)
+
+    async def save(self):
+        """存储当前凭证"""
+        if self._credential is None:
+            return
+        await asyncio.to_thread(self._write, self._credential.get_cookies())
+
+    async def update(self, credential: Credential):
+        """更新凭证, 如扫码登录成功后"""
+        async with self._lock:
+            self._credential = credential
+            self._valid, self._loaded, self._from_config = True, True, False
+            await self.save()
+
+    async def check(self):
+        """校验凭证有效性, 并在需要时刷新"""
+        async with self._lock:
+            if not self._loaded:
+                await asyncio.to_thread(self._load)
+            try:
+                await self._check()
+            except Exception:
+                # 网络异常时保持原有状态, 等待下次校验
+                logger.exception("哔哩哔哩凭证校验失败")
+
+    async def _check(self):
+        if (credential := self._credential) is None:
+            return
+
+        if not await credential.check_valid():
+            if self._from_config:
+                logger.info(f"`parser_bili_ck` 已过期, 尝试从 {self.cookies_file} 加载")
+                self._credential, self._from_config = await asyncio.to_thread(self._read), False
+                return await self._check()
+            if self._valid:
+                logger.warning("哔哩哔哩凭证已过期, 请重新配置")
+            self._valid = False
+            return
+
+        self._valid = True
+        if self._from_config:
+            logger.info(f"`parser_bili_ck` 有效, 保存到 {self.cookies_file}")
+            self._from_config = False
+            await self.save()
+
+        if await credential.check_refresh():
+            logger.info("哔哩哔哩凭证需要刷新")
+            if credential.has_ac_time_value() and credential.has_bili_jct():
+                await credential.refresh()
+                logger.info(f"哔哩哔哩凭证刷新成功, 保存到 {self.cookies_file}")
+                await self.save()
+            else:
+                logger.warning("哔哩哔哩凭证刷新需要包含 `SESSDATA`, `ac_time_value` 项")
+
+
+CREDENTIAL = CredentialManager(pconfig.config_dir / "bilibili_cookies.json")
+"""全局哔哩哔哩登录凭证"""
@@ -0,0 +1,143 @@
+import asyncio
+from typing import TYPE_CHECKING, Any
+from contextlib import suppress, asynccontextmanager
+from collections.abc import Callable, Awaitable, AsyncIterator
+
+from nonebot import logger
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page, Browser, BrowserContext
+
+# 宽度 414 (iPhone Max) 能容纳更多内容，同时保持移动端布局
+# device_scale_factor=3 提升文字清晰度
+MOBILE_CONTEXT_OPTIONS: dict[str, Any] = {
+    "viewport": {"width": 414, "height": 800},
+    "device_scale_factor": 3,
+    "is_mobile": True,
+    "has_touch": True,
+    "user_agent": (
+        "Mozilla/5.0 (iPhone; CPU iPhone OS 16_6 like Mac OS X) AppleWebKit/605.1.15 "
+        "(KHTML, like Gecko) Version/16.6 Mobile/15E148 Safari/604.1"
+    ),
+}
+
+# 目标元素内图片全部加载完成, 且高度在两次轮询间保持不变时视为就绪
+_READY_JS = """(selector) => {
+    const target = document.querySelector(selector) || document.body;
+    const images = Array.from(target.querySelectorAll("img"));
+    images.forEach((img) => { if (img.loading === "lazy") img.loading = "eager"; });
+    const loaded = images.every((img) => img.complete);
+    const height = target.getBoundingClientRect().height;
+    const stable = height > 0 && window.__psrLastHeight === height;
+    window.__psrLastHeight = height;
+    return loaded && stable;
+}"""
+
+
+async def wait_until_ready(page: "Page", selector: str, timeout: float = 5000):
+    """等待页面渲染就绪, 替代固定时长的等待
+
+    先滚动到底部触发懒加载, 然后等待目标元素内的图片加载完成且高度稳定, 超时则直接继续
+
+    Args:
+        page (Page): 页面
+        selector (str): 目标元素选择器
+        timeout (float): 最长等待时间 单位: 毫秒
+    """
+    await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+    try:
+        await page.wait_for_function(_READY_JS, arg=selector, polling=100, timeout=timeout)
+    except Exception:
+        logger.debug(f"等待 {selector} 就绪超时, 直接截图")
+    await page.evaluate("window.scrollTo(0, 0)")
+
+
+class ContextPool:
+    """浏览器上下文池
+
+    - 上下文创建后保留复用, 已注入 Cookie, 避免每次截图都创建新的上下文
+    - 池大小同时也是截图的最大并发数, 超出的请求排队等待
+    - Cookie 变化或浏览器重启后自动更新或重建上下文
+    """
+
+    def __init__(
+        self,
+        size: int,
+        get_browser: Callable[[], Awaitable["Browser"]],
+        get_cookies: Callable[[], list[dict[str, Any]]],
+        **context_options: Any,
+    ):
+        self.size: int = size
+        """上下文数量上限"""
+        self._get_browser = get_browser
+        self._get_cookies = get_cookies
+        self._context_options = context_options
+        self._semaphore = asyncio.Semaphore(size)
+        self._idle: list[tuple["BrowserContext", list[dict[str, Any]]]] = []
+
+    async def _new_context(self, browser: "Browser", cookies: list[dict[str, Any]]) -> "BrowserContext":
+        context = await browser.new_context(**self._context_options)
+        if cookies:
+            await context.add_cookies(cookies)  # pyright: ignore[reportArgumentType]
+        return context
+
+    async def _acquire(self) -> tuple["BrowserContext", list[dict[str, Any]]]:
+        browser = await self._get_browser()
+        cookies = self._get_cookies()
+        while self._idle:
+            context, context_cookies = self._idle.pop()
+            try:
+                if context.browser is not browser or not browser.is_connected():
+                    raise RuntimeError("浏览器已重启")
+                if context_cookies != cookies:
+                    await context.clear_cookies()
+                    if cookies:
+                        await context.add_cookies(cookies)  # pyright: ignore[reportArgumentType]
+            except Exception:
+                # 上下文已失效, 丢弃
+                with suppress(Exception):
+                    await context.close()
+                continue
+            return context, cookies
+        return await self._new_context(browser, cookies), cookies
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator["Page"]:
+        """从池中取出上下文并打开新页面, 使用完毕后关闭页面并归还上下文"""
+        async with self._semaphore:
+            context, cookies = await self._acquire()
+            try:
+                page = await context.new_page()
+            except Exception:
+                with suppress(Exception):
+                    await context.close()
+                raise
+            try:
+                yield page
+            finally:
+                try:
+                    await page.close()
+                except Exception:
+                    with suppress(Exception):
+                        await context.close()
+                else:
+                    self._idle.append((context, cookies))
+
+    async def warm(self):
+        """预先创建上下文, 填满整个池"""
+        try:
+            browser = await self._get_browser()
+            cookies = self._get_cookies()
+            while len(self._idle) < self.size:
+                self._idle.append((await self._new_context(browser, cookies), cookies))
+        except Exception:
+            logger.exception("预热浏览器上下文失败")
+            return
+        logger.debug(f"已预热 {len(self._idle)} 个浏览器上下文")
+
+    async def aclose(self):
+        """关闭所有空闲上下文"""
+        idle, self._idle = self._idle, []
+        for context, _ in idle:
+            with suppress(Exception):
+                await context.close()
@@ -23,6 +23,8 @@ class Stats(Struct):
 
 
 class Page(Struct):
+    cid: int
+    """分集 cid"""
     part: str
     """分集标题"""
     ctime: int
@@ -36,6 +38,7 @@ class Page(Struct):
 @dataclass(frozen=True, slots=True)
 class PageInfo:
     index: int
+    cid: int
     title: str
     duration: int
     timestamp: int
@@ -45,6 +48,8 @@ class PageInfo:
 class VideoInfo(Struct):
     bvid: str
     """bvid"""
+    cid: int
+    """首个分集 cid"""
     title: str
     """标题"""
     desc: str
@@ -101,9 +106,10 @@ class VideoInfo(Struct):
             page_num (int): 页索引. Defaults to 1.
 
         Returns:
-            tuple[int, str, int, str | None]: 页索引、标题、时长、封面
+            PageInfo: 页索引、cid、标题、时长、封面
         """
         page_idx = page_num - 1
+        cid = self.cid
         title = self.title
         duration = self.duration
         cover = self.pic
@@ -112,6 +118,7 @@ class VideoInfo(Struct):
         if self.pages and len(self.pages) > 1:
             page_idx = page_idx % len(self.pages)
             page = self.pages[page_idx]
+            cid = page.cid
             title += f" | 分集 - {page.part}"
             duration = page.duration
             cover = page.first_frame
@@ -119,6 +126,7 @@ class VideoInfo(Struct):
 
         return PageInfo(
             index=page_idx,
+            cid=cid,
             title=title,
             duration=duration,
             timestamp=timestamp,
@@ -75,7 +75,16 @@ class ImageContent(MediaContent):
 class DynamicContent(MediaContent):
     """动态内容 视频格式 后续转 gif"""
 
-    gif_path: Path | None = None
+    gif_path: Path | Task[Path] | None = None
+    """转换后的 GIF"""
+
+    async def get_gif_path(self) -> Path | None:
+        if self.gif_path is None:
+            return None
+        if isinstance(self.gif_path, Path):
+            return self.gif_path
+        self.gif_path = await self.gif_path
+        return self.gif_path
 
 
 @dataclass(repr=False, slots=True)
@@ -96,6 +105,24 @@ class GraphicsContent(MediaContent):
         return repr + ")"
 
 
+@dataclass(frozen=True, slots=True)
+class ResourceId:
+    """资源标识, 同一资源的不同链接形式(短链, 移动端, 带参数等)对应同一标识"""
+
+    platform: str
+    """平台名称"""
+    type: str
+    """资源类型, 如 video, dynamic, live"""
+    id: str
+    """平台内的资源 id"""
+    page: int | None = None
+    """分 P 序号"""
+
+    def __str__(self) -> str:
+        key = f"{self.platform}:{self.type}:{self.id}"
+        return key if self.page is None else f"{key}:{self.page}"
+
+
 @dataclass(slots=True)
 class Platform:
     """平台信息"""
@@ -158,6 +185,12 @@ class ParseResult:
     """转发的内容"""
     render_image: Path | None = None
     """渲染图片"""
+    cache_ttl: int | None = None
+    """缓存时长 单位: 秒, 由 parser 根据处理器设置"""
+    resource_id: ResourceId | None = None
+    """资源标识, 由 parser 根据处理器设置"""
+    follow_up: Task[str | None] | None = None
+    """解析时未能及时获取的附加信息, 在结果发送后补发, 完成后写入 extra["info"]"""
 
     @property
     def header(self) -> str | None:
@@ -242,3 +275,4 @@ class ParseResultKwargs(TypedDict, total=False):
     author: Author | None
     extra: dict[str, Any]
     repost: ParseResult | None
+    follow_up: Task[str | None] | None
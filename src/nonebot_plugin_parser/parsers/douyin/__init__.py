@@ -1,13 +1,13 @@
 import re
 from typing import ClassVar
 
-from httpx import AsyncClient
 from nonebot import logger
 
 from ..base import (
     COMMON_TIMEOUT,
     Platform,
     BaseParser,
+    ResourceId,
     PlatformEnum,
     ParseException,
     handle,
@@ -51,6 +51,13 @@ class DouyinParser(BaseParser):
                 continue
         raise ParseException("分享已删除或资源直链提取失败, 请稍后再试")
 
+    def get_resource_id(self, keyword: str, searched: re.Match[str]) -> ResourceId | None:
+        if vid := searched.groupdict().get("vid"):
+            # video 和 note 是同一作品的不同形式, slides 单独解析
+            ty = searched.group("ty")
+            return self.resource_id("slides" if ty == "slides" else "aweme", vid)
+        return None
+
     @staticmethod
     def _build_iesdouyin_url(ty: str, vid: str) -> str:
         return f"https://www.iesdouyin.com/share/{ty}/{vid}"
@@ -62,7 +69,7 @@ class DouyinParser(BaseParser):
     async def parse_video(self, url: str):
         from . import video
 
-        async with AsyncClient(
+        async with self.client(
             headers=self.ios_headers,
             timeout=COMMON_TIMEOUT,
             follow_redirects=False,
@@ -114,7 +121,7 @@ class DouyinParser(BaseParser):
             "aweme_ids": f"[{video_id}]",
             "request_source": "200",
         }
-        async with AsyncClient(headers=self.android_headers, verify=False) as client:
+        async with self.client(headers=self.android_headers, verify=False) as client:
             response = await client.get(url, params=params)
             response.raise_for_status()
 
@@ -1,10 +1,8 @@
 import re
 from typing import ClassVar
 
-from httpx import AsyncClient
-
 from ..base import BaseParser, PlatformEnum, ParseException, handle
-from ..data import Platform
+from ..data import Platform, ResourceId
 
 
 class KuaiShouParser(BaseParser):
@@ -17,6 +15,12 @@ class KuaiShouParser(BaseParser):
         super().__init__()
         self.ios_headers["Referer"] = "https://v.kuaishou.com/"
 
+    def get_resource_id(self, keyword: str, searched: re.Match[str]) -> ResourceId | None:
+        # 短链需要重定向才能确定作品 id
+        if matched := re.search(r"(?:short-video|photo|long-video)/([A-Za-z\d]+)", searched.group(0)):
+            return self.resource_id("photo", matched.group(1))
+        return None
+
     # https://v.kuaishou.com/2yAnzeZ
     @handle("v.kuaishou", r"v\.kuaishou\.com/[A-Za-z\d._?%&+\-=/#]+")
     # https://www.kuaishou.com/short-video/3xhjgcmir24m4nm
@@ -36,7 +40,7 @@ class KuaiShouParser(BaseParser):
         # /fw/long-video/ 返回结果不一样, 统一替换为 /fw/photo/ 请求
         real_url = real_url.replace("/fw/long-video/", "/fw/photo/")
 
-        async with AsyncClient(headers=self.ios_headers, timeout=self.timeout) as client:
+        async with self.client(headers=self.ios_headers, timeout=self.timeout) as client:
             response = await client.get(real_url)
             response.raise_for_status()
             response_text = response.text
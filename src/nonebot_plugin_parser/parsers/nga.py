@@ -6,9 +6,9 @@ import asyncio
 from typing import ClassVar
 
 from bs4 import Tag, BeautifulSoup
-from httpx import HTTPError, AsyncClient
+from httpx import HTTPError
 
-from .base import Platform, BaseParser, PlatformEnum, handle
+from .base import Platform, BaseParser, ResourceId, PlatformEnum, handle
 from ..exception import ParseException
 
 
@@ -33,6 +33,9 @@ class NGAParser(BaseParser):
     def nga_url(tid: str | int) -> str:
         return f"https://nga.178.com/read.php?tid={tid}"
 
+    def get_resource_id(self, keyword: str, searched: re.Match[str]) -> ResourceId | None:
+        return self.resource_id("thread", searched.group("tid"))
+
     # ("ngabbs.com", r"https?://ngabbs\.com/read\.php\?tid=(?P<tid>\d+)(?:[&#A-Za-z\d=_-]+)?"),
     # ("nga.178.com", r"https?://nga\.178\.com/read\.php\?tid=(?P<tid>\d+)(?:[&#A-Za-z\d=_-]+)?"),
     # ("bbs.nga.cn", r"https?://bbs\.nga\.cn/read\.php\?tid=(?P<tid>\d+)(?:[&#A-Za-z\d=_-]+)?"),
@@ -42,7 +45,7 @@ class NGAParser(BaseParser):
         tid = searched.group("tid")
         url = self.nga_url(tid)
 
-        async with AsyncClient(headers=self.headers, timeout=self.timeout, follow_redirects=True) as client:
+        async with self.client(headers=self.headers, timeout=self.timeout, follow_redirects=True) as client:
             try:
                 # 第一次请求可能返回403，但包含设置cookie的JavaScript
                 resp = await client.get(url)
@@ -2,14 +2,19 @@ import re
 from typing import ClassVar
 
 from .base import BaseParser, PlatformEnum, handle
-from .data import Author, Platform, VideoContent
-from ..download import DOWNLOADER, YTDLP_DOWNLOADER
+from .data import Author, Platform, ResourceId, VideoContent
+from ..download import DOWNLOADER, YTDLP_DOWNLOADER, Priority
 
 
 class TikTokParser(BaseParser):
     # 平台信息
     platform: ClassVar[Platform] = Platform(name=PlatformEnum.TIKTOK, display_name="TikTok")
 
+    def get_resource_id(self, keyword: str, searched: re.Match[str]) -> ResourceId | None:
+        if matched := re.search(r"/video/(\d+)", searched.group(0)):
+            return self.resource_id("video", matched.group(1))
+        return None
+
     @handle("tiktok", r"(www|vt|vm)\.tiktok\.com/[A-Za-z0-9._?%&+\-=/#@]*")
     async def _parse(self, searched: re.Match[str]):
         # 从匹配对象中获取原始URL
@@ -22,7 +27,7 @@ class TikTokParser(BaseParser):
         video_info = await YTDLP_DOWNLOADER.extract_video_info(url)
 
         # 下载封面和视频
-        cover = DOWNLOADER.download_img(video_info.thumbnail)
+        cover = DOWNLOADER.download_img(video_info.thumbnail, priority=Priority.CARD)
         video = YTDLP_DOWNLOADER.download_video(url)
 
         return self.result(
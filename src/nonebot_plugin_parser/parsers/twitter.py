@@ -2,10 +2,8 @@ import re
 from typing import Any, ClassVar
 from itertools import chain
 
-from httpx import AsyncClient
-
 from .base import BaseParser, PlatformEnum, handle
-from .data import Platform, ParseResult
+from .data import Platform, ResourceId, ParseResult
 from ..exception import ParseException
 
 
@@ -27,11 +25,14 @@ class TwitterParser(BaseParser):
         from ..config import pconfig
         proxy = pconfig.proxy if pconfig.proxy else None
 
-        async with AsyncClient(headers=headers, timeout=self.timeout, proxy=proxy) as client:
+        async with self.client(headers=headers, timeout=self.timeout, proxy=proxy) as client:
             api_url = "https://xdown.app/api/ajaxSearch"
             response = await client.post(api_url, data=data)
             return response.json()
 
+    def get_resource_id(self, keyword: str, searched: re.Match[str]) -> ResourceId | None:
+        return self.resource_id("status", searched.group(1))
+
     @handle("x.com", r"x.com/[0-9-a-zA-Z_]{1,20}/status/([0-9]+)")
     async def _parse(self, searched: re.Match[str]) -> ParseResult:
         # 从匹配对象中获取原始URL
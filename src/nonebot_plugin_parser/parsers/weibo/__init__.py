@@ -4,10 +4,10 @@ from uuid import uuid4
 from typing import ClassVar
 
 from bs4 import Tag, BeautifulSoup
-from httpx import Cookies, AsyncClient
+from httpx import Cookies
 
 from . import common, article
-from ..base import Platform, BaseParser, PlatformEnum, ParseException, handle
+from ..base import Platform, BaseParser, ResourceId, PlatformEnum, ParseException, handle
 from ..data import MediaContent
 
 
@@ -26,6 +26,19 @@ class WeiBoParser(BaseParser):
         }
         self.headers.update(extra_headers)
 
+    def get_resource_id(self, keyword: str, searched: Match[str]) -> ResourceId | None:
+        groups = searched.groupdict()
+        if mid := groups.get("mid"):
+            return self.resource_id("status", self._mid2id(mid))
+        if wid := groups.get("wid"):
+            # 数字 mid 与 base62 id 指向同一条微博, 统一为 id
+            return self.resource_id("status", self._mid2id(wid) if wid.isdigit() else wid)
+        if fid := groups.get("fid"):
+            return self.resource_id("fid", fid)
+        if _id := groups.get("id"):
+            return self.resource_id("article", _id)
+        return None
+
     # https://weibo.com/tv/show/1034:5007449447661594?mid=5007452630158934
     @handle("weibo.com/tv", r"weibo\.com/tv/show/\d{4}:\d+\?mid=(?P<mid>\d+)")
     async def _parse_weibo_tv(self, searched: Match[str]):
@@ -73,7 +86,7 @@ class WeiBoParser(BaseParser):
             "_t": int(time() * 1000),
         }
 
-        async with AsyncClient(
+        async with self.client(
             headers=self.headers,
             timeout=self.timeout,
         ) as client:
@@ -136,7 +149,7 @@ class WeiBoParser(BaseParser):
         }
         post_content = 'data={"Component_Play_Playinfo":{"oid":"' + fid + '"}}'
 
-        async with AsyncClient(headers=headers, timeout=self.timeout) as client:
+        async with self.client(headers=headers, timeout=self.timeout) as client:
             response = await client.post(req_url, content=post_content)
             response.raise_for_status()
 
@@ -179,7 +192,7 @@ class WeiBoParser(BaseParser):
         url = f"https://m.weibo.cn/statuses/show?id={weibo_id}&_={ts}"
 
         # 关键：不带 cookie、不跟随重定向（避免二跳携 cookie）
-        async with AsyncClient(
+        async with self.client(
             headers=headers,
             timeout=self.timeout,
             follow_redirects=False,
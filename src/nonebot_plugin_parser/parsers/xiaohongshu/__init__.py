@@ -1,10 +1,10 @@
 import re
 from typing import ClassVar
 
-from httpx import Cookies, AsyncClient
+from httpx import Cookies
 from nonebot import logger
 
-from ..base import Platform, BaseParser, PlatformEnum, ParseException, handle, pconfig
+from ..base import Platform, BaseParser, ResourceId, PlatformEnum, ParseException, handle, pconfig
 from ..data import MediaContent
 
 
@@ -35,6 +35,11 @@ class XiaoHongShuParser(BaseParser):
             self.headers["cookie"] = pconfig.xhs_ck
             self.ios_headers["cookie"] = pconfig.xhs_ck
 
+    def get_resource_id(self, keyword: str, searched: re.Match[str]) -> ResourceId | None:
+        if xhs_id := searched.groupdict().get("xhs_id"):
+            return self.resource_id("note", xhs_id)
+        return None
+
     @handle("xhslink.com", r"xhslink\.com/[A-Za-z0-9._?%&+=/#@-]+")
     async def _parse_short_link(self, searched: re.Match[str]):
         url = f"https://{searched.group(0)}"
@@ -56,7 +61,7 @@ class XiaoHongShuParser(BaseParser):
     async def parse_explore(self, url: str, xhs_id: str):
         from . import explore
 
-        async with AsyncClient(headers=self.headers, timeout=self.timeout) as client:
+        async with self.client(headers=self.headers, timeout=self.timeout) as client:
             response = await client.get(url)
             # may be 302
             if response.status_code > 400:
@@ -99,7 +104,7 @@ class XiaoHongShuParser(BaseParser):
     async def parse_discovery(self, url: str):
         from . import discovery
 
-        async with AsyncClient(
+        async with self.client(
             headers=self.ios_headers,
             timeout=self.timeout,
             follow_redirects=True,
@@ -1,9 +1,7 @@
 import re
 from typing import ClassVar
 
-from httpx import AsyncClient
-
-from ..base import Platform, BaseParser, PlatformEnum, handle, pconfig
+from ..base import Platform, BaseParser, ResourceId, PlatformEnum, handle, pconfig
 from ..cookie import save_cookies_with_netscape
 from ...download import YTDLP_DOWNLOADER
 
@@ -11,6 +9,7 @@ from ...download import YTDLP_DOWNLOADER
 class YouTubeParser(BaseParser):
     # 平台信息
     platform: ClassVar[Platform] = Platform(name=PlatformEnum.YOUTUBE, display_name="油管")
+    cache_ttl: ClassVar[int] = 7 * 24 * 60 * 60
 
     def __init__(self):
         super().__init__()
@@ -22,6 +21,11 @@ class YouTubeParser(BaseParser):
                 "youtube.com",
             )
 
+    def get_resource_id(self, keyword: str, searched: re.Match[str]) -> ResourceId | None:
+        if matched := re.search(r"(?:youtu\.be/|shorts/|[?&]v=)([A-Za-z\d_\-]{11})", searched.group(0)):
+            return self.resource_id("video", matched.group(1))
+        return None
+
     @handle("youtu", r"youtu\.be/[A-Za-z\d\._\?%&\+\-=/#]+")
     @handle("youtube", r"youtube\.com/(?:watch|shorts)(?:/[A-Za-z\d_\-]+|\?v=[A-Za-z\d_\-]+)")
     async def _parse_video(self, searched: re.Match[str]):
@@ -105,7 +109,7 @@ class YouTubeParser(BaseParser):
             "browseId": channel_id,
         }
 
-        async with AsyncClient(headers=self.headers, timeout=self.timeout) as client:
+        async with self.client(headers=self.headers, timeout=self.timeout) as client:
             response = await client.post(url, json=payload)
             response.raise_for_status()
 
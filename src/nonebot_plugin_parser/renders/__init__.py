@@ -4,7 +4,7 @@ from nonebot import get_driver
 
 from .. import utils
 from .base import BaseRenderer
-from .common import CommonRenderer
+from .common import CommonRenderer, warm_emoji_atlas, start_render_executor, shutdown_render_executor
 from .default import DefaultRenderer
 
 _HTML_RENDER_AVAILABLE = utils.is_module_available("nonebot_plugin_htmlrender")
@@ -46,3 +46,8 @@ def get_renderer(platform: str) -> BaseRenderer:
 @get_driver().on_startup
 async def load_resources():
     CommonRenderer.load_resources()
+    await start_render_executor()
+    await warm_emoji_atlas()
+
+
+get_driver().on_shutdown(shutdown_render_executor)
@@ -1,4 +1,7 @@
+import json
 import uuid
+import asyncio
+import hashlib
 from abc import ABC, abstractmethod
 from typing import Any, ClassVar
 from pathlib import Path
@@ -6,6 +9,9 @@ from itertools import chain
 from collections.abc import AsyncGenerator
 from typing_extensions import override
 
+from nonebot import logger
+
+from ..cache import DISK_CACHE
 from ..config import pconfig
 from ..helper import UniHelper, UniMessage, ForwardNodeInner
 from ..parsers import (
@@ -17,6 +23,7 @@ from ..parsers import (
     GraphicsContent,
 )
 from ..exception import DownloadException, ZeroSizeException, DownloadLimitException
+from ..download.task import SingleFlight
 
 
 class BaseRenderer(ABC):
@@ -73,8 +80,7 @@ class BaseRenderer(ABC):
                     forwardable_segs.append(UniHelper.img_seg(path))
                 case DynamicContent() as dynamic:
                     # 优先使用 gif_path（如果存在）
-                    if dynamic.gif_path is not None:
-                        gif_path = await dynamic.gif_path
+                    if gif_path := await dynamic.get_gif_path():
                         # GIF 应该作为图片发送，并与缩略图一起合并发送
                         forwardable_segs.append(UniHelper.img_seg(gif_path))
                     else:
@@ -110,9 +116,20 @@ class BaseRenderer(ABC):
         return pconfig.append_url
 
 
+_IMAGE_SUFFIXES = (".png", ".jpg", ".webp")
+
+
 class ImageRenderer(BaseRenderer):
     """图片渲染器"""
 
+    RENDER_VERSION: ClassVar[int] = 1
+    """渲染版本, 卡片样式变化时递增, 使旧的渲染缓存失效"""
+
+    MAX_IMAGES_DISPLAY: ClassVar[int | None] = None
+    """卡片最多绘制的图片数, None 表示全部绘制, 超出的图片不参与指纹计算"""
+
+    _render_flights: ClassVar[SingleFlight[str, tuple[Path, bytes]]] = SingleFlight()
+
     @abstractmethod
     async def render_image(self, result: ParseResult) -> bytes:
         """渲染图片
@@ -121,7 +138,7 @@ class ImageRenderer(BaseRenderer):
             result (ParseResult): 解析结果
 
         Returns:
-            bytes: 图片字节 png 格式
+            bytes: 图片字节
         """
         raise NotImplementedError
 
@@ -154,28 +171,143 @@ class ImageRenderer(BaseRenderer):
             Image: 图片 Segment
         """
         if result.render_image is None:
-            image_raw = await self.render_image(result)
-            image_path = await self.save_img(image_raw)
+            fingerprint = await self.fingerprint(result)
+            if fingerprint is None:
+                image_raw = await self.render_image(result)
+                image_path = await self.save_img(image_raw)
+            elif image_path := await asyncio.to_thread(self._find_rendered, fingerprint):
+                # 相同内容已渲染过, 直接使用磁盘上的卡片
+                image_raw = None
+            else:
+
+                async def render_and_save() -> tuple[Path, bytes]:
+                    image_raw = await self.render_image(result)
+                    return await self.save_img(image_raw, fingerprint), image_raw
+
+                # 相同内容的并发请求共享同一次渲染
+                image_path, image_raw = await self._render_flights.do(fingerprint, render_and_save)
+
             result.render_image = image_path
-            if pconfig.use_base64:
+            if pconfig.use_base64 and image_raw is not None:
                 return UniHelper.img_seg(image_raw)
 
         return UniHelper.img_seg(result.render_image)
 
+    @property
+    def render_settings(self) -> dict[str, Any]:
+        """影响渲染结果的配置, 参与指纹计算"""
+        return {}
+
+    async def fingerprint(self, result: ParseResult) -> str | None:
+        """计算渲染输入的指纹, 指纹相同的解析结果复用同一张卡片
+
+        由渲染器类型, 渲染配置, 以及解析结果的文本, 媒体和作者信息计算
+
+        Args:
+            result (ParseResult): 解析结果
+
+        Returns:
+            str | None: 指纹, 媒体获取失败时返回 None, 不复用卡片
+        """
+        try:
+            inputs = await self._fingerprint_inputs(result)
+        except Exception as e:
+            logger.debug(f"渲染指纹计算失败: {e}")
+            return None
+        renderer = f"{type(self).__module__}.{type(self).__qualname__}"
+        payload = json.dumps(
+            [renderer, self.RENDER_VERSION, self.render_settings, inputs],
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.md5(payload.encode()).hexdigest()
+
+    @classmethod
+    async def _fingerprint_inputs(cls, result: ParseResult) -> dict[str, Any]:
+        """解析结果中参与渲染的字段, 媒体以文件名和大小标识, 只等待卡片绘制的媒体"""
+        author = None
+        if result.author is not None:
+            author = [result.author.name, await cls._file_key(await result.author.get_avatar_path())]
+
+        contents: list[Any] = []
+        image_count = 0
+        for cont in result.contents:
+            match cont:
+                case VideoContent():
+                    # 仅使用封面和时长, 不等待视频下载
+                    contents.append(["video", await cls._file_key(await cont.get_cover_path()), cont.duration])
+                case GraphicsContent():
+                    contents.append(["graphics", await cls._file_key(await cont.get_path()), cont.text, cont.alt])
+                case ImageContent():
+                    image_count += 1
+                    if cls.MAX_IMAGES_DISPLAY is not None and image_count > cls.MAX_IMAGES_DISPLAY:
+                        # 超出的图片不绘制, 只影响剩余数量
+                        contents.append(["image"])
+                    else:
+                        contents.append(["image", await cls._file_key(await cont.get_path())])
+                case _:
+                    # 音频和动图不参与卡片渲染
+                    contents.append([type(cont).__name__])
+
+        return {
+            "platform": [result.platform.name, result.platform.display_name],
+            "title": result.title,
+            "text": result.text,
+            "timestamp": result.timestamp,
+            "extra_info": result.extra_info,
+            "author": author,
+            "contents": contents,
+            "repost": await cls._fingerprint_inputs(result.repost) if result.repost else None,
+        }
+
+    @staticmethod
+    async def _file_key(path: Path | None) -> list[Any] | None:
+        if path is None:
+            return None
+        try:
+            stat = await asyncio.to_thread(path.stat)
+        except OSError:
+            return None
+        return [path.name, stat.st_size]
+
+    @staticmethod
+    def _find_rendered(fingerprint: str) -> Path | None:
+        """查找已保存的指纹对应的卡片, 并更新访问时间, 在线程中执行"""
+        for suffix in _IMAGE_SUFFIXES:
+            image_path = DISK_CACHE.path(f"{fingerprint}{suffix}")
+            if image_path.exists():
+                DISK_CACHE.touch(image_path)
+                return image_path
+        return None
+
+    @staticmethod
+    def _image_suffix(raw: bytes) -> str:
+        """根据文件头判断图片后缀"""
+        if raw.startswith(b"\xff\xd8\xff"):
+            return ".jpg"
+        if raw[:4] == b"RIFF" and raw[8:12] == b"WEBP":
+            return ".webp"
+        return ".png"
+
     @classmethod
-    async def save_img(cls, raw: bytes) -> Path:
+    async def save_img(cls, raw: bytes, name: str | None = None) -> Path:
         """保存图片
 
         Args:
             raw (bytes): 图片字节
+            name (str | None): 文件名(不含后缀), 默认随机生成
 
         Returns:
             Path: 图片路径
         """
         import aiofiles
 
-        file_name = f"{uuid.uuid4().hex}.png"
-        image_path = pconfig.cache_dir / file_name
-        async with aiofiles.open(image_path, "wb+") as f:
+        file_name = f"{name or uuid.uuid4().hex}{cls._image_suffix(raw)}"
+        image_path = DISK_CACHE.path(file_name)
+        # 先写入临时文件再替换, 避免读取到不完整的图片
+        tmp_path = image_path.with_name(f"{file_name}.tmp")
+        async with aiofiles.open(tmp_path, "wb+") as f:
             await f.write(raw)
+        await asyncio.to_thread(tmp_path.replace, image_path)
         return image_path
@@ -1,25 +1,40 @@
+import asyncio
+import hashlib
+import threading
+import multiprocessing
 from io import BytesIO
-from typing import TypeVar, ClassVar, ParamSpec
+from array import array
+from bisect import bisect_right
+from typing import Any, TypeVar, ClassVar, ParamSpec
 from pathlib import Path
 from functools import wraps, lru_cache
-from dataclasses import dataclass
-from collections.abc import Callable, Awaitable
+from dataclasses import field, dataclass
+from collections.abc import Callable
 from typing_extensions import override
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
 
 import emoji
 from PIL import Image, ImageDraw, ImageFont
 from nonebot import logger
-from apilmoji import Apilmoji, EmojiCDNSource
+from apilmoji import EmojiCDNSource
 from apilmoji.core import get_font_height
+from apilmoji.helper import NodeType, parse_lines, contains_emoji
 
 from .base import ParseResult, ImageRenderer
+from ..utils import LimitedSizeDict
 from ..config import pconfig
-from ..parsers import GraphicsContent
+from ..constants import RenderFormat, RenderExecutor
 
 # 定义类型变量
 P = ParamSpec("P")
 T = TypeVar("T")
 
+# 字体加载时预先计算宽度的区段: ASCII 及拉丁字母, 通用标点, CJK 标点, 全角字符
+_PREFILL_RANGES = ((0x20, 0x250), (0x2000, 0x2070), (0x3000, 0x3040), (0xFF00, 0xFFF0))
+
+# 不能为行首的标点符号
+_LINE_START_FORBIDDEN = frozenset("，。！？；：、）】》〉」』〕〗〙〛…—·,.;:!?)]}")
+
 Color = tuple[int, int, int]
 PILImage = Image.Image
 PILImageDraw = ImageDraw.ImageDraw
@@ -46,22 +61,6 @@ def suppress_exception(
     return wrapper
 
 
-def suppress_exception_async(
-    func: Callable[P, Awaitable[T]],
-) -> Callable[P, Awaitable[T | None]]:
-    """装饰器：捕获所有异常并返回 None"""
-
-    @wraps(func)
-    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T | None:
-        try:
-            return await func(*args, **kwargs)
-        except Exception as e:
-            logger.debug(f"函数 {func.__name__} 执行失败: {e}")
-            return None
-
-    return wrapper
-
-
 @dataclass(eq=False, frozen=True, slots=True)
 class FontInfo:
     """字体信息数据类"""
@@ -70,18 +69,35 @@ class FontInfo:
     fill: Color
     line_height: int
     cjk_width: int
-
-    def __hash__(self) -> int:
-        """实现哈希方法以支持 @lru_cache"""
-        return hash((id(self.font), self.line_height, self.cjk_width, self.fill))
-
-    @lru_cache(maxsize=500)
-    def get_char_width(self, char: str) -> int:
-        """获取字符宽度，使用缓存优化"""
+    _widths: array = field(default_factory=lambda: array("h", [-1]) * 0x10000, init=False, repr=False)
+    """BMP 字符宽度表, 以码位为下标, -1 表示尚未计算"""
+    _astral_widths: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    """BMP 以外字符的宽度"""
+
+    def __post_init__(self):
+        # 预先计算常用区段的字符宽度
+        for start, end in _PREFILL_RANGES:
+            for code in range(start, end):
+                self._widths[code] = self._measure(chr(code))
+
+    def _measure(self, char: str) -> int:
         # return int(self.font.getlength(char, direction="ltr"))
         bbox = self.font.getbbox(char)
         return int(bbox[2] - bbox[0])
 
+    def get_char_width(self, char: str) -> int:
+        """获取字符宽度，查宽度表，未计算过的字符计算后写入表中"""
+        code = ord(char)
+        if code < 0x10000:
+            width = self._widths[code]
+            if width < 0:
+                width = self._widths[code] = self._measure(char)
+            return width
+        width = self._astral_widths.get(char)
+        if width is None:
+            width = self._astral_widths[char] = self._measure(char)
+        return width
+
     def get_char_width_fast(self, char: str) -> int:
         """快速获取单个字符宽度"""
         if "\u4e00" <= char <= "\u9fff":
@@ -98,13 +114,7 @@ class FontInfo:
         Returns:
             文本宽度（像素）
         """
-        if not text:
-            return 0
-
-        total_width = 0
-        for char in text:
-            total_width += self.get_char_width_fast(char)
-        return total_width
+        return sum(map(self.get_char_width_fast, text))
 
 
 @dataclass(eq=False, frozen=True, slots=True)
@@ -141,6 +151,90 @@ class FontSet:
         return FontSet(**font_infos)
 
 
+class EmojiAtlas:
+    """emoji 位图缓存
+
+    - 按 (emoji, 样式, 字号) 缓存缩放后的 RGBA 图片, 超出容量时淘汰最久未使用的
+    - 启动时从本地 emoji 目录预加载, 绘制时直接贴图, 不再读取和缩放 emoji 文件
+    """
+
+    def __init__(self, emoji_dir: Path | None, style: str, max_size: int):
+        self.emoji_dir: Path | None = emoji_dir
+        """本地 emoji 目录, 文件名为 `<emoji>.png`"""
+        self.style: str = style
+        """emoji 样式"""
+        self._images = LimitedSizeDict[tuple[str, str, int], PILImage](max_size=max_size)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def get(self, emoji: str, size: int, path: Path | None = None) -> PILImage | None:
+        """获取缩放到字号大小的 emoji, 未缓存时加载
+
+        Args:
+            emoji: emoji 字符
+            size: 字号
+            path: emoji 图片路径, 默认为本地 emoji 目录中的文件
+
+        Returns:
+            emoji 图片, 文件不存在或损坏时返回 None
+        """
+        key = (emoji, self.style, size)
+        with self._lock:
+            if (image := self._images.get(key)) is not None:
+                self._images.move_to_end(key)
+                return image
+
+        image = self._load(emoji, size, path)
+        if image is not None and self._images.max_size > 0:
+            with self._lock:
+                self._images[key] = image
+        return image
+
+    def _load(self, emoji: str, size: int, path: Path | None) -> PILImage | None:
+        if path is None:
+            if self.emoji_dir is None:
+                return None
+            path = self.emoji_dir / f"{emoji}.png"
+        return _load_emoji(path, size)
+
+    def warm(self, sizes: tuple[int, ...]) -> int:
+        """从本地 emoji 目录预加载, 最近下载的优先
+
+        Args:
+            sizes: 需要预加载的字号
+
+        Returns:
+            预加载的 emoji 数量
+        """
+        if not sizes or self.emoji_dir is None or not self.emoji_dir.is_dir():
+            return 0
+        paths = sorted(self.emoji_dir.glob("*.png"), key=lambda path: path.stat().st_mtime, reverse=True)
+        paths = paths[: self._images.max_size // len(sizes)]
+        # 先加载较旧的, 使最近下载的在淘汰顺序中靠后
+        for path in reversed(paths):
+            for size in sizes:
+                self.get(path.stem, size, path)
+        return len(paths)
+
+
+class SvgEmojiAtlas(EmojiAtlas):
+    """emosvg 的 emoji 位图缓存, 缓存 SVG 光栅化后的图片, 不再每次绘制都重新光栅化"""
+
+    SCALE = 1.1
+    """emoji 相对字号的缩放比例, 与 emosvg.text 的默认值一致"""
+
+    def __init__(self, max_size: int):
+        super().__init__(None, "openmoji", max_size)
+
+    @override
+    def _load(self, emoji: str, size: int, path: Path | None) -> PILImage | None:
+        assert emosvg is not None
+        emoji_size = size * self.SCALE
+        return emosvg.get_emoji_image(emoji, emoji_size, emoji_size)
+
+
 @dataclass(eq=False, frozen=True, slots=True)
 class SectionData:
     """基础部分数据类"""
@@ -213,12 +307,59 @@ class GraphicsSectionData(SectionData):
     alt_text: str | None = None
 
 
+@dataclass(slots=True)
+class GraphicsData:
+    """图文内容渲染数据"""
+
+    path: Path
+    """图片路径"""
+    text: str | None = None
+    """图片前的文本内容"""
+    alt: str | None = None
+    """图片描述"""
+
+
+@dataclass(slots=True)
+class CardData:
+    """卡片渲染数据
+
+    媒体资源和 emoji 均已下载到本地, 只包含可序列化的数据, 可以在渲染线程或进程中绘制
+    """
+
+    platform: str
+    """平台名称"""
+    title: str | None = None
+    """标题"""
+    text: str | None = None
+    """文本内容"""
+    extra_info: str | None = None
+    """额外信息"""
+    author: str | None = None
+    """作者名称, 为 None 时不绘制 header"""
+    avatar: Path | None = None
+    """头像路径"""
+    time: str | None = None
+    """格式化后的发布时间"""
+    cover: Path | None = None
+    """视频封面路径"""
+    images: list[Path] = field(default_factory=list)
+    """图集路径, 最多 MAX_IMAGES_DISPLAY 张"""
+    image_total: int = 0
+    """图集图片总数"""
+    graphics: list[GraphicsData] = field(default_factory=list)
+    """图文内容"""
+    repost: "CardData | None" = None
+    """转发的内容"""
+    emojis: dict[str, Path] = field(default_factory=dict)
+    """文本中 emoji 对应的图片路径"""
+
+
 @dataclass
 class RenderContext:
     """渲染上下文，存储渲染过程中的状态信息"""
 
-    result: ParseResult
-    """解析结果"""
+    card: CardData
+    """卡片渲染数据"""
     card_width: int
     """卡片宽度"""
     content_width: int
@@ -257,6 +398,8 @@ class CommonRenderer(ImageRenderer):
     """名称和时间之间的间距"""
     AVATAR_UPSCALE_FACTOR = 2
     """头像圆形框超采样倍数"""
+    AVATAR_CACHE_SIZE = 256
+    """处理后的圆形头像缓存数量"""
 
     # 图片处理配置
     MIN_COVER_WIDTH = 300
@@ -275,6 +418,8 @@ class CommonRenderer(ImageRenderer):
     """最大显示图片数量"""
     IMAGE_GRID_COLS = 3
     """图片网格列数"""
+    REDUCING_GAP = 2
+    """缩小解码倍数, 解码尺寸不小于目标尺寸的该倍数, 再以 LANCZOS 缩放到目标尺寸"""
 
     # 转发内容配置
     REPOST_PADDING = 12
@@ -311,12 +456,19 @@ class CommonRenderer(ImageRenderer):
     )
     """Emoji Source"""
 
+    # 头像缓存, 以头像文件内容的哈希和尺寸为键, 渲染线程间共享
+    _avatar_cache: ClassVar[LimitedSizeDict[tuple[str, int, int], PILImage]] = LimitedSizeDict(
+        max_size=AVATAR_CACHE_SIZE
+    )
+    _avatar_lock: ClassVar[threading.Lock] = threading.Lock()
+
     @classmethod
     def load_resources(cls):
         """加载资源"""
         cls._load_fonts()
         cls._load_video_button()
         cls._load_platform_logos()
+        cls._load_emoji_atlas()
 
     @classmethod
     def _load_fonts(cls):
@@ -327,6 +479,22 @@ class CommonRenderer(ImageRenderer):
         cls.fontset = FontSet.new(font_path)
         logger.success(f"加载字体「{font_path.name}」成功")
 
+    @classmethod
+    def _load_emoji_atlas(cls):
+        """创建 emoji 位图缓存, 预加载由 warm_emoji_atlas 在渲染线程或进程中进行"""
+        if emosvg is not None:
+            cls.emoji_atlas: EmojiAtlas = SvgEmojiAtlas(pconfig.emoji_cache_size)
+            return
+        style = cls.EMOJI_SOURCE.style
+        emoji_dir = pconfig.cache_dir / cls._EMOJIS / style
+        cls.emoji_atlas = EmojiAtlas(emoji_dir, style, pconfig.emoji_cache_size)
+
+    @classmethod
+    def warm_emoji_atlas(cls) -> int:
+        """从本地 emoji 目录预加载带 emoji 绘制的文本字号的 emoji 位图"""
+        sizes = {int(font.font.size) for font in (cls.fontset.title, cls.fontset.text, cls.fontset.extra)}
+        return cls.emoji_atlas.warm(tuple(sorted(sizes)))
+
     @classmethod
     def _load_video_button(cls):
         """预加载视频按钮"""
@@ -351,7 +519,7 @@ class CommonRenderer(ImageRenderer):
                     cls.platform_logos[str(platform_name)] = img.convert("RGBA")
 
     @classmethod
-    async def text(
+    def text(
         cls,
         ctx: RenderContext,
         xy: tuple[int, int],
@@ -360,13 +528,95 @@ class CommonRenderer(ImageRenderer):
     ) -> int:
         """绘制文本"""
         if emosvg is not None:
-            emosvg.text(ctx.image, xy, lines, font.font, fill=font.fill, line_height=font.line_height)
+            cls._text_with_svg_emojis(ctx, xy, lines, font)
         else:
-            await Apilmoji.text(
-                ctx.image, xy, lines, font.font, fill=font.fill, line_height=font.line_height, source=cls.EMOJI_SOURCE
-            )
+            cls._text_with_emojis(ctx, xy, lines, font)
         return font.line_height * len(lines)
 
+    @classmethod
+    def _text_with_svg_emojis(
+        cls,
+        ctx: RenderContext,
+        xy: tuple[int, int],
+        lines: list[str],
+        font: FontInfo,
+    ) -> None:
+        """绘制带 emoji 的文本, 排版与 emosvg.text 一致, emoji 图片取自位图缓存"""
+        assert emosvg is not None
+        x, y = xy
+        if not emosvg.helper.contains_emoji(lines):
+            for line in lines:
+                ctx.draw.text((x, y), line, font=font.font, fill=font.fill)
+                y += font.line_height
+            return
+
+        font_size = font.font.size
+        emoji_size = font_size * SvgEmojiAtlas.SCALE
+        x_diff = int((emoji_size - font_size) / 2)
+        y_diff = int((emoji_size - font.line_height) / 2)
+
+        for nodes in emosvg.helper.parse_lines(lines):
+            cur_x = x
+            for node in nodes:
+                content = node.content
+                if node.type is emosvg.NodeType.EMOJI:
+                    if emj_img := cls.emoji_atlas.get(content, int(font_size)):
+                        ctx.image.paste(emj_img, (cur_x - x_diff, y - y_diff), emj_img)
+                    else:
+                        ctx.draw.text((cur_x, y), content[0], font=font.font, fill=font.fill)
+                    cur_x += int(font_size)
+                else:
+                    ctx.draw.text((cur_x, y), content, font=font.font, fill=font.fill)
+                    cur_x += int(font.font.getlength(content))
+            y += font.line_height
+
+    @classmethod
+    def _text_with_emojis(
+        cls,
+        ctx: RenderContext,
+        xy: tuple[int, int],
+        lines: list[str],
+        font: FontInfo,
+    ) -> None:
+        """绘制带 emoji 的文本, 排版与 Apilmoji.text 一致, emoji 图片取自位图缓存"""
+        x, y = xy
+        if not contains_emoji(lines):
+            for line in lines:
+                ctx.draw.text((x, y), line, font=font.font, fill=font.fill)
+                y += font.line_height
+            return
+
+        font_size = int(font.font.size)
+        y_diff = int((font.line_height - font_size) / 2)
+
+        for nodes in parse_lines(lines):
+            cur_x = x
+            for node in nodes:
+                content = node.content
+                if node.type is NodeType.EMOJI:
+                    if emj_img := cls.emoji_atlas.get(content, font_size, ctx.card.emojis.get(content)):
+                        ctx.image.paste(emj_img, (cur_x + 1, y + y_diff), emj_img)
+                    else:
+                        # 忽略组合表情的修饰符，只渲染第一个字符
+                        ctx.draw.text((cur_x, y), content[0], font=font.font, fill=font.fill)
+                    cur_x += font_size
+                else:
+                    ctx.draw.text((cur_x, y), content, font=font.font, fill=font.fill)
+                    cur_x += int(font.font.getlength(content))
+            y += font.line_height
+
+    @classmethod
+    async def _fetch_emojis(cls, *texts: str | None) -> dict[str, Path]:
+        """下载文本中 emoji 对应的图片"""
+        if emosvg is not None:
+            return {}
+        lines = [line for text in texts if text for line in text.splitlines()]
+        if not contains_emoji(lines):
+            return {}
+        emojis = {node.content for nodes in parse_lines(lines) for node in nodes if node.type is NodeType.EMOJI}
+        emoji_paths = await cls.EMOJI_SOURCE.fetch_emojis(emojis, set())
+        return {emj: path for emj, path in emoji_paths.items() if path is not None}
+
     @staticmethod
     def text_single_line(
         ctx: RenderContext,
@@ -378,6 +628,16 @@ class CommonRenderer(ImageRenderer):
         ctx.draw.text(xy, line, font=font.font, fill=font.fill)
         return font.line_height
 
+    @property
+    @override
+    def render_settings(self) -> dict[str, Any]:
+        return {
+            "font": pconfig.custom_font,
+            "emoji_style": self.EMOJI_SOURCE.style,
+            "format": pconfig.render_format,
+            "quality": pconfig.render_quality,
+        }
+
     @override
     async def render_image(self, result: ParseResult) -> bytes:
         """使用 PIL 绘制通用社交媒体帖子卡片
@@ -386,25 +646,77 @@ class CommonRenderer(ImageRenderer):
             result: 解析结果
 
         Returns:
-            PNG 图片的字节数据，如果没有足够的内容则返回 None
+            图片的字节数据
+        """
+        # 在事件循环中下载所需资源, 解码, 缩放, 绘制和编码在渲染线程或进程中执行
+        card = await self._prepare_card(result)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_render_executor(), _render_card, type(self), card)
+
+    async def _prepare_card(self, result: ParseResult) -> CardData:
+        """等待渲染所需的媒体资源下载完成, 生成卡片渲染数据
+
+        Args:
+            result: 解析结果
+
+        Returns:
+            卡片渲染数据
         """
-        # 调用内部方法生成图片
-        image = await self._create_card_image(result)
+        card = CardData(
+            platform=str(result.platform.name),
+            title=result.title,
+            text=result.text,
+            extra_info=result.extra_info,
+            time=result.formartted_datetime,
+        )
+        if result.author is not None:
+            card.author = result.author.name
+            card.avatar = await result.author.get_avatar_path()
+
+        # 封面可用时不再使用图集和图文内容
+        card.cover = await result.cover_path
+        if card.cover is None or not card.cover.exists():
+            if img_contents := result.img_contents:
+                card.image_total = len(img_contents)
+                card.images = [await cont.get_path() for cont in img_contents[: self.MAX_IMAGES_DISPLAY]]
+            elif result.graphics_contents:
+                for graphics_content in result.graphics_contents:
+                    try:
+                        img_path = await graphics_content.get_path()
+                    except Exception as e:
+                        logger.debug(f"图文内容图片获取失败: {e}")
+                        continue
+                    card.graphics.append(GraphicsData(img_path, graphics_content.text, graphics_content.alt))
+
+        if result.repost:
+            card.repost = await self._prepare_card(result.repost)
+
+        card.emojis = await self._fetch_emojis(
+            card.title, card.text, card.extra_info, *(graphics.text for graphics in card.graphics)
+        )
+        return card
+
+    def render_card(self, card: CardData) -> bytes:
+        """绘制卡片并编码, CPU 密集, 在渲染线程或进程中执行
+
+        Args:
+            card: 卡片渲染数据
 
-        # 将图片转换为字节
-        output = BytesIO()
-        image.save(output, format="PNG")
-        return output.getvalue()
+        Returns:
+            图片的字节数据, 格式由 parser_render_format 决定
+        """
+        image = self._create_card_image(card)
+        return encode_image(image, pconfig.render_format, pconfig.render_quality)
 
-    async def _create_card_image(
+    def _create_card_image(
         self,
-        result: ParseResult,
+        card: CardData,
         not_repost: bool = True,
     ) -> PILImage:
         """创建卡片图片（内部方法，用于递归调用）
 
         Args:
-            result: 解析结果
+            card: 卡片渲染数据
             not_repost: 是否为非转发内容，转发内容为 False
 
         Returns:
@@ -415,7 +727,7 @@ class CommonRenderer(ImageRenderer):
         content_width = card_width - 2 * self.PADDING
 
         # 计算各部分内容的高度
-        sections = await self._calculate_sections(result, content_width)
+        sections = self._calculate_sections(card, content_width)
 
         # 计算总高度
         card_height = sum(section.height for section in sections)
@@ -431,7 +743,7 @@ class CommonRenderer(ImageRenderer):
 
         # 创建完整的渲染上下文
         ctx = RenderContext(
-            result=result,
+            card=card,
             card_width=card_width,
             content_width=content_width,
             image=image,
@@ -440,9 +752,18 @@ class CommonRenderer(ImageRenderer):
             y_pos=self.PADDING,  # 以 padding 作为起始
         )
         # 绘制各部分内容
-        await self._draw_sections(ctx, sections)
+        self._draw_sections(ctx, sections)
         return image
 
+    def _draft(self, img: PILImage, size: tuple[int, int]) -> None:
+        """JPEG 按 1/2, 1/4, 1/8 缩小解码, 避免为生成缩略图解码完整的大图, 须在图片加载前调用
+
+        Args:
+            img: 未加载的图片
+            size: 缩放后的目标尺寸
+        """
+        img.draft(None, (size[0] * self.REDUCING_GAP, size[1] * self.REDUCING_GAP))
+
     @suppress_exception
     def _load_and_resize_cover(
         self,
@@ -459,6 +780,14 @@ class CommonRenderer(ImageRenderer):
             return None
 
         with Image.open(cover_path) as original_img:
+            # 按目标尺寸缩小解码
+            scale_ratio = min(content_width / original_img.width, self.MAX_COVER_HEIGHT / original_img.height)
+            if scale_ratio < 1:
+                self._draft(
+                    original_img,
+                    (int(original_img.width * scale_ratio), int(original_img.height * scale_ratio)),
+                )
+
             # 转换为 RGB 模式以确保兼容性
             if original_img.mode not in ("RGB", "RGBA"):
                 cover_img = original_img.convert("RGB")
@@ -484,6 +813,7 @@ class CommonRenderer(ImageRenderer):
                 cover_img = cover_img.resize(
                     (new_width, new_height),
                     Image.Resampling.LANCZOS,
+                    reducing_gap=self.REDUCING_GAP,
                 )
             elif cover_img is original_img:
                 # 如果没有做任何转换，需要 copy 一份，因为原图会在 with 结束时关闭
@@ -493,38 +823,50 @@ class CommonRenderer(ImageRenderer):
 
     @suppress_exception
     def _load_and_process_avatar(self, avatar: Path | None) -> PILImage | None:
-        """加载并处理头像（圆形裁剪，带抗锯齿）"""
+        """加载并处理头像, 相同内容的头像复用缓存的圆形头像"""
         if not avatar or not avatar.exists():
             return None
 
+        data = avatar.read_bytes()
+        key = (hashlib.md5(data).hexdigest(), self.AVATAR_SIZE, self.AVATAR_UPSCALE_FACTOR)
+        with self._avatar_lock:
+            if (avatar_img := self._avatar_cache.get(key)) is not None:
+                self._avatar_cache.move_to_end(key)
+                return avatar_img
+
+        avatar_img = self._process_avatar(BytesIO(data))
+        with self._avatar_lock:
+            self._avatar_cache[key] = avatar_img
+        return avatar_img
+
+    def _process_avatar(self, avatar: BytesIO) -> PILImage:
+        """处理头像（圆形裁剪，带抗锯齿）"""
         with Image.open(avatar) as original_img:
+            # 使用超采样技术提高质量：先放大到指定倍数
+            scale = self.AVATAR_UPSCALE_FACTOR
+            temp_size = self.AVATAR_SIZE * scale
+            self._draft(original_img, (temp_size, temp_size))
+
             # 转换为 RGBA 模式（用于更好的抗锯齿效果）
             if original_img.mode != "RGBA":
                 avatar_img = original_img.convert("RGBA")
             else:
                 avatar_img = original_img
 
-            # 使用超采样技术提高质量：先放大到指定倍数
-            scale = self.AVATAR_UPSCALE_FACTOR
-            temp_size = self.AVATAR_SIZE * scale
             avatar_img = avatar_img.resize(
                 (temp_size, temp_size),
                 Image.Resampling.LANCZOS,
+                reducing_gap=self.REDUCING_GAP,
             )
 
-            # 创建高分辨率圆形遮罩（带抗锯齿）
-            mask = Image.new("L", (temp_size, temp_size), 0)
-            mask_draw = ImageDraw.Draw(mask)
-            mask_draw.ellipse((0, 0, temp_size - 1, temp_size - 1), fill=255)
-
-            # 应用遮罩
+            # 应用高分辨率圆形遮罩（带抗锯齿）
             output_avatar = Image.new(
                 "RGBA",
                 (temp_size, temp_size),
                 (0, 0, 0, 0),
             )
             output_avatar.paste(avatar_img, (0, 0))
-            output_avatar.putalpha(mask)
+            output_avatar.putalpha(_circle_mask(temp_size))
 
             # 缩小到目标尺寸（抗锯齿缩放）
             output_avatar = output_avatar.resize(
@@ -534,19 +876,19 @@ class CommonRenderer(ImageRenderer):
 
             return output_avatar
 
-    async def _calculate_sections(self, result: ParseResult, content_width: int) -> list[SectionData]:
+    def _calculate_sections(self, card: CardData, content_width: int) -> list[SectionData]:
         """计算各部分内容的高度和数据"""
         sections: list[SectionData] = []
 
         # 1. Header 部分
-        header_section = await self._calculate_header_section(result)
+        header_section = self._calculate_header_section(card)
         if header_section is not None:
             sections.append(header_section)
 
         # 2. 标题部分
-        if result.title:
+        if card.title:
             title_lines = self._wrap_text(
-                result.title,
+                card.title,
                 content_width,
                 self.fontset.title,
             )
@@ -555,31 +897,31 @@ class CommonRenderer(ImageRenderer):
 
         # 3. 封面，图集，图文内容
         if cover_img := self._load_and_resize_cover(
-            await result.cover_path,
+            card.cover,
             content_width=content_width,
         ):
             sections.append(CoverSectionData(height=cover_img.height, cover_img=cover_img))
-        elif result.img_contents:
+        elif card.images:
             # 如果没有封面但有图片，处理图片列表
-            img_grid_section = await self._calculate_image_grid_section(
-                result,
+            img_grid_section = self._calculate_image_grid_section(
+                card,
                 content_width,
             )
             if img_grid_section:
                 sections.append(img_grid_section)
-        elif result.graphics_contents:
-            for graphics_content in result.graphics_contents:
-                graphics_section = await self._calculate_graphics_section(
-                    graphics_content,
+        elif card.graphics:
+            for graphics in card.graphics:
+                graphics_section = self._calculate_graphics_section(
+                    graphics,
                     content_width,
                 )
                 if graphics_section:
                     sections.append(graphics_section)
 
         # 5. 文本内容
-        if result.text:
+        if card.text:
             text_lines = self._wrap_text(
-                result.text,
+                card.text,
                 content_width,
                 self.fontset.text,
             )
@@ -587,9 +929,9 @@ class CommonRenderer(ImageRenderer):
             sections.append(TextSectionData(height=text_height, lines=text_lines))
 
         # 6. 额外信息
-        if result.extra_info:
+        if card.extra_info:
             extra_lines = self._wrap_text(
-                result.extra_info,
+                card.extra_info,
                 content_width,
                 self.fontset.extra,
             )
@@ -597,27 +939,27 @@ class CommonRenderer(ImageRenderer):
             sections.append(ExtraSectionData(height=extra_height, lines=extra_lines))
 
         # 7. 转发内容
-        if result.repost:
-            repost_section = await self._calculate_repost_section(result.repost)
+        if card.repost:
+            repost_section = self._calculate_repost_section(card.repost)
             sections.append(repost_section)
 
         return sections
 
-    @suppress_exception_async
-    async def _calculate_graphics_section(
-        self, graphics_content: GraphicsContent, content_width: int
-    ) -> GraphicsSectionData | None:
+    @suppress_exception
+    def _calculate_graphics_section(self, graphics: GraphicsData, content_width: int) -> GraphicsSectionData | None:
         """计算图文内容部分的高度和内容"""
         # 加载图片
-        img_path = await graphics_content.get_path()
-        with Image.open(img_path) as original_img:
+        with Image.open(graphics.path) as original_img:
             # 调整图片尺寸以适应内容宽度
             if original_img.width > content_width:
+                # 按目标尺寸缩小解码
+                self._draft(original_img, (content_width, original_img.height * content_width // original_img.width))
                 ratio = content_width / original_img.width
                 new_height = int(original_img.height * ratio)
                 image = original_img.resize(
                     (content_width, new_height),
                     Image.Resampling.LANCZOS,
+                    reducing_gap=self.REDUCING_GAP,
                 )
             else:
                 # 如果不需要缩放，copy 一份
@@ -625,43 +967,42 @@ class CommonRenderer(ImageRenderer):
 
             # 处理文本内容
             text_lines = []
-            if graphics_content.text:
+            if graphics.text:
                 text_lines = self._wrap_text(
-                    graphics_content.text,
+                    graphics.text,
                     content_width,
                     self.fontset.text,
                 )
 
             # 计算总高度：文本高度 + 图片高度 + alt文本高度 + 间距
             text_height = len(text_lines) * self.fontset.text.line_height if text_lines else 0
-            alt_height = self.fontset.extra.line_height if graphics_content.alt else 0
+            alt_height = self.fontset.extra.line_height if graphics.alt else 0
             total_height = text_height + image.height + alt_height
             if text_lines:
                 total_height += self.SECTION_SPACING  # 文本和图片之间的间距
-            if graphics_content.alt:
+            if graphics.alt:
                 total_height += self.SECTION_SPACING  # 图片和alt文本之间的间距
 
             return GraphicsSectionData(
                 height=total_height,
                 text_lines=text_lines,
                 image=image,
-                alt_text=graphics_content.alt,
+                alt_text=graphics.alt,
             )
 
-    async def _calculate_header_section(
+    def _calculate_header_section(
         self,
-        result: ParseResult,
+        card: CardData,
     ) -> HeaderSectionData | None:
         """计算 header 部分的高度和内容"""
-        if result.author is None:
+        if card.author is None:
             return None
 
         # 加载头像
-        avatar_img = self._load_and_process_avatar(await result.author.get_avatar_path())
+        avatar_img = self._load_and_process_avatar(card.avatar)
 
         text_height = self.fontset.name.line_height
-        time = result.formartted_datetime
-        if time:
+        if card.time:
             text_height += self.NAME_TIME_GAP + self.fontset.extra.line_height
 
         header_height = max(self.AVATAR_SIZE, text_height)
@@ -669,14 +1010,14 @@ class CommonRenderer(ImageRenderer):
         return HeaderSectionData(
             height=header_height,
             avatar=avatar_img,
-            name=result.author.name,
-            time=result.formartted_datetime,
+            name=card.author,
+            time=card.time,
             text_height=text_height,
         )
 
-    async def _calculate_repost_section(self, repost: ParseResult) -> RepostSectionData:
+    def _calculate_repost_section(self, repost: CardData) -> RepostSectionData:
         """计算转发内容的高度和内容（递归调用绘制方法）"""
-        repost_image = await self._create_card_image(repost, False)
+        repost_image = self._create_card_image(repost, False)
         # 缩放图片
         scaled_width = int(repost_image.width * self.REPOST_SCALE)
         scaled_height = int(repost_image.height * self.REPOST_SCALE)
@@ -690,32 +1031,25 @@ class CommonRenderer(ImageRenderer):
             scaled_image=repost_image_scaled,
         )
 
-    async def _calculate_image_grid_section(
-        self, result: ParseResult, content_width: int
-    ) -> ImageGridSectionData | None:
+    def _calculate_image_grid_section(self, card: CardData, content_width: int) -> ImageGridSectionData | None:
         """计算图片网格部分的高度和内容"""
-        if not result.img_contents:
+        if not card.images:
             return None
 
         # 检查是否有超过最大显示数量的图片
-        total_images = len(result.img_contents)
+        total_images = card.image_total
         has_more = total_images > self.MAX_IMAGES_DISPLAY
 
         # 如果超过最大显示数量，处理前N张，最后一张显示+N效果
-        if has_more:
-            img_contents = result.img_contents[: self.MAX_IMAGES_DISPLAY]
-            remaining_count = total_images - self.MAX_IMAGES_DISPLAY
-        else:
-            img_contents = result.img_contents[: self.MAX_IMAGES_DISPLAY]
-            remaining_count = 0
+        img_paths = card.images[: self.MAX_IMAGES_DISPLAY]
+        remaining_count = total_images - self.MAX_IMAGES_DISPLAY if has_more else 0
 
         processed_images = []
-        img_count = len(img_contents)
+        img_count = len(img_paths)
 
-        for img_content in img_contents:
-            img_path = await img_content.get_path()
+        for img_path in img_paths:
             # 使用装饰器保护的方法，失败会返回 None
-            img = await self._load_and_process_grid_image(img_path, content_width, img_count)
+            img = self._load_and_process_grid_image(img_path, content_width, img_count)
             if img is not None:
                 processed_images.append(img)
 
@@ -754,8 +1088,8 @@ class CommonRenderer(ImageRenderer):
             remaining_count=remaining_count,
         )
 
-    @suppress_exception_async
-    async def _load_and_process_grid_image(
+    @suppress_exception
+    def _load_and_process_grid_image(
         self,
         img_path: Path,
         content_width: int,
@@ -777,20 +1111,19 @@ class CommonRenderer(ImageRenderer):
         with Image.open(img_path) as original_img:
             img = original_img
 
-            # 根据图片数量决定处理方式
-            if img_count >= 2:
-                # 2张及以上图片，统一为方形
-                img = self._crop_to_square(img)
-
             # 计算图片尺寸
             if img_count == 1:
                 # 单张图片，根据卡片宽度调整，与视频封面保持一致
                 max_width = content_width
                 max_height = min(self.MAX_IMAGE_HEIGHT, content_width)  # 限制最大高度
+                ratio = min(max_width / img.width, max_height / img.height)
+                if ratio < 1:
+                    # 按目标尺寸缩小解码
+                    self._draft(img, (int(img.width * ratio), int(img.height * ratio)))
                 if img.width > max_width or img.height > max_height:
                     ratio = min(max_width / img.width, max_height / img.height)
                     new_size = (int(img.width * ratio), int(img.height * ratio))
-                    img = img.resize(new_size, Image.Resampling.LANCZOS)
+                    img = img.resize(new_size, Image.Resampling.LANCZOS, reducing_gap=self.REDUCING_GAP)
                 elif img is original_img:
                     # 如果没有做任何转换，需要 copy 一份
                     img = img.copy()
@@ -807,11 +1140,17 @@ class CommonRenderer(ImageRenderer):
                     max_size = (content_width - self.IMAGE_GRID_SPACING * num_gaps) // self.IMAGE_GRID_COLS
                     max_size = min(max_size, self.IMAGE_3_GRID_SIZE)
 
+                # 按目标尺寸缩小解码, 裁剪为方形后短边不小于目标尺寸
+                self._draft(img, (max_size, max_size))
+
+                # 2张及以上图片，统一为方形
+                img = self._crop_to_square(img)
+
                 # 调整多张图片的尺寸
                 if img.width > max_size or img.height > max_size:
                     ratio = min(max_size / img.width, max_size / img.height)
                     new_size = (int(img.width * ratio), int(img.height * ratio))
-                    img = img.resize(new_size, Image.Resampling.LANCZOS)
+                    img = img.resize(new_size, Image.Resampling.LANCZOS, reducing_gap=self.REDUCING_GAP)
                 elif img is original_img:
                     # 如果没有做任何转换，需要 copy 一份
                     img = img.copy()
@@ -836,22 +1175,22 @@ class CommonRenderer(ImageRenderer):
             bottom = top + width
             return img.crop((0, top, width, bottom))
 
-    async def _draw_sections(self, ctx: RenderContext, sections: list[SectionData]) -> None:
+    def _draw_sections(self, ctx: RenderContext, sections: list[SectionData]) -> None:
         """绘制所有内容到画布上"""
         for section in sections:
             match section:
                 case HeaderSectionData() as header:
-                    await self._draw_header(ctx, header)
+                    self._draw_header(ctx, header)
                 case TitleSectionData() as title:
-                    await self._draw_title(ctx, title.lines)
+                    self._draw_title(ctx, title.lines)
                 case CoverSectionData() as cover:
                     self._draw_cover(ctx, cover.cover_img)
                 case TextSectionData() as text:
-                    await self._draw_text(ctx, text.lines)
+                    self._draw_text(ctx, text.lines)
                 case GraphicsSectionData() as graphics:
-                    await self._draw_graphics(ctx, graphics)
+                    self._draw_graphics(ctx, graphics)
                 case ExtraSectionData() as extra:
-                    await self._draw_extra(ctx, extra.lines)
+                    self._draw_extra(ctx, extra.lines)
                 case RepostSectionData() as repost:
                     self._draw_repost(ctx, repost)
                 case ImageGridSectionData() as image_grid:
@@ -911,16 +1250,11 @@ class CommonRenderer(ImageRenderer):
             fill=placeholder_fg_color,
         )
 
-        # 创建圆形遮罩确保不超出边界
-        mask = Image.new("L", (self.AVATAR_SIZE, self.AVATAR_SIZE), 0)
-        mask_draw = ImageDraw.Draw(mask)
-        mask_draw.ellipse((0, 0, self.AVATAR_SIZE - 1, self.AVATAR_SIZE - 1), fill=255)
-
-        # 应用遮罩
-        placeholder.putalpha(mask)
+        # 应用圆形遮罩确保不超出边界
+        placeholder.putalpha(_circle_mask(self.AVATAR_SIZE))
         return placeholder
 
-    async def _draw_header(self, ctx: RenderContext, section: HeaderSectionData) -> None:
+    def _draw_header(self, ctx: RenderContext, section: HeaderSectionData) -> None:
         """绘制 header 部分"""
         x_pos = self.PADDING
 
@@ -956,7 +1290,7 @@ class CommonRenderer(ImageRenderer):
 
         # 在右侧绘制平台 logo（仅在非转发内容时绘制）
         if ctx.not_repost:
-            platform_name = ctx.result.platform.name
+            platform_name = ctx.card.platform
             if platform_name in self.platform_logos:
                 logo_img = self.platform_logos[platform_name]
                 # 计算 logo 位置（右侧对齐）
@@ -967,9 +1301,9 @@ class CommonRenderer(ImageRenderer):
 
         ctx.y_pos += section.height + self.SECTION_SPACING
 
-    async def _draw_title(self, ctx: RenderContext, lines: list[str]) -> None:
+    def _draw_title(self, ctx: RenderContext, lines: list[str]) -> None:
         """绘制标题"""
-        ctx.y_pos += await self.text(
+        ctx.y_pos += self.text(
             ctx,
             (self.PADDING, ctx.y_pos),
             lines,
@@ -996,9 +1330,9 @@ class CommonRenderer(ImageRenderer):
 
         ctx.y_pos += cover_img.height + self.SECTION_SPACING
 
-    async def _draw_text(self, ctx: RenderContext, lines: list[str]) -> None:
+    def _draw_text(self, ctx: RenderContext, lines: list[str]) -> None:
         """绘制文本内容"""
-        ctx.y_pos += await self.text(
+        ctx.y_pos += self.text(
             ctx,
             (self.PADDING, ctx.y_pos),
             lines,
@@ -1006,11 +1340,11 @@ class CommonRenderer(ImageRenderer):
         )
         ctx.y_pos += self.SECTION_SPACING
 
-    async def _draw_graphics(self, ctx: RenderContext, section: GraphicsSectionData) -> None:
+    def _draw_graphics(self, ctx: RenderContext, section: GraphicsSectionData) -> None:
         """绘制图文内容"""
         # 绘制文本内容（如果有）
         if section.text_lines:
-            ctx.y_pos += await self.text(
+            ctx.y_pos += self.text(
                 ctx,
                 (self.PADDING, ctx.y_pos),
                 section.text_lines,
@@ -1039,9 +1373,9 @@ class CommonRenderer(ImageRenderer):
 
         ctx.y_pos += self.SECTION_SPACING
 
-    async def _draw_extra(self, ctx: RenderContext, lines: list[str]) -> None:
+    def _draw_extra(self, ctx: RenderContext, lines: list[str]) -> None:
         """绘制额外信息"""
-        ctx.y_pos += await self.text(
+        ctx.y_pos += self.text(
             ctx,
             (self.PADDING, ctx.y_pos),
             lines,
@@ -1223,7 +1557,10 @@ class CommonRenderer(ImageRenderer):
         draw.arc((x2 - 2 * radius, y2 - 2 * radius, x2, y2), 0, 90, fill=border_color, width=width)
 
     def _wrap_text(self, text: str, max_width: int, font_info: FontInfo) -> list[str]:
-        """使用 emoji.emoji_list 优化的文本自动换行算法，正确处理组合 emoji
+        """文本自动换行算法，正确处理组合 emoji，耗时与文本长度成线性
+
+        每个段落只遍历一次 emoji 位置，切分为字符和 emoji 单元并计算累计宽度，
+        再二分查找每行能容纳的最后一个单元作为断点，不能为行首的标点符号跟随在上一行末尾
 
         Args:
             text: 要处理的文本
@@ -1236,67 +1573,45 @@ class CommonRenderer(ImageRenderer):
         if not text:
             return []
 
-        def is_punctuation(char: str) -> bool:
-            """判断是否为不能为行首的标点符号"""
-            return char in "，。！？；：、）】》〉」』〕〗〙〛…—·,.;:!?)]}"
-
         lines: list[str] = []
-        paragraphs = text.splitlines()
+        emoji_width = font_info.font.size
 
-        for paragraph in paragraphs:
+        for paragraph in text.splitlines():
             if not paragraph:
                 lines.append("")
                 continue
 
-            # 使用 emoji.emoji_list 识别所有 emoji 组合
-            emoji_list = emoji.emoji_list(paragraph)
-
-            current_line = ""
-            current_line_width = 0
-            idx = 0  # 当前处理的字符索引
-
+            # 切分为字符和 emoji 单元, offsets[i] 为第 i 个单元的起始位置, widths[i] 为前 i 个单元的累计宽度
+            offsets: list[int] = []
+            widths: list[int] = [0]
+            emoji_spans = iter(emoji.emoji_list(paragraph))
+            next_emoji = next(emoji_spans, None)
+            idx = 0
             while idx < len(paragraph):
-                # 检查当前位置是否有 emoji, 包含组合 emoji
-                for emoji_data in emoji_list:
-                    if emoji_data["match_start"] == idx:
-                        char = emoji_data["emoji"]
-                        idx = emoji_data["match_end"]
-                        char_width = font_info.font.size
-                        break
+                offsets.append(idx)
+                if next_emoji is not None and next_emoji["match_start"] == idx:
+                    idx = next_emoji["match_end"]
+                    char_width = emoji_width
+                    next_emoji = next(emoji_spans, None)
                 else:
-                    # 处理普通字符
-                    char = paragraph[idx]
+                    char_width = font_info.get_char_width_fast(paragraph[idx])
                     idx += 1
-                    char_width = font_info.get_char_width_fast(char)
-
-                # 如果当前行为空，直接添加字符
-                if not current_line:
-                    current_line = char
-                    current_line_width = char_width
-                    continue
-
-                # 如果是标点符号，直接添加到当前行（标点符号不应该单独成行）
-                if len(char) == 1 and is_punctuation(char):
-                    current_line += char
-                    current_line_width += char_width
-                    continue
-
-                # 测试添加下一个字符后的宽度
-                test_width = current_line_width + char_width
-
-                if test_width <= max_width:
-                    # 宽度合适，继续添加
-                    current_line += char
-                    current_line_width = test_width
-                else:
-                    # 宽度超限，需要断行
-                    lines.append(current_line)
-                    current_line = char
-                    current_line_width = char_width
-
-            # 保存最后一行
-            if current_line:
-                lines.append(current_line)
+                widths.append(widths[-1] + char_width)
+            offsets.append(len(paragraph))
+
+            unit_count = len(offsets) - 1
+            line_start = 0
+            while line_start < unit_count:
+                # 宽度不超过 max_width 的最后一个断点, 行首单元总是放入当前行
+                line_end = bisect_right(widths, widths[line_start] + max_width, line_start + 1) - 1
+                line_end = max(line_end, line_start + 1)
+                # 标点符号不能为行首, 直接添加到当前行
+                while line_end < unit_count and offsets[line_end + 1] - offsets[line_end] == 1:
+                    if paragraph[offsets[line_end]] not in _LINE_START_FORBIDDEN:
+                        break
+                    line_end += 1
+                lines.append(paragraph[offsets[line_start] : offsets[line_end]])
+                line_start = line_end
 
         return lines
 
@@ -1367,3 +1682,119 @@ class CommonRenderer(ImageRenderer):
                 lines.append(current_line)
 
         return lines
+
+
+def _load_emoji(path: Path, size: int) -> PILImage | None:
+    """加载 emoji 图片并缩放到字号大小, 与 Apilmoji 的处理一致"""
+    if not path.exists():
+        return None
+    try:
+        with Image.open(path) as original_img:
+            emoji_img = original_img.convert("RGBA")
+    except Exception:
+        # 文件损坏, 删除后下次重新下载
+        path.unlink(True)
+        return None
+    emoji_size = size - 2
+    aspect_ratio = emoji_img.height / emoji_img.width
+    return emoji_img.resize((emoji_size, int(emoji_size * aspect_ratio)), Image.Resampling.LANCZOS)
+
+
+@lru_cache(maxsize=8)
+def _circle_mask(size: int) -> PILImage:
+    """圆形遮罩, 只读, 按尺寸缓存"""
+    mask = Image.new("L", (size, size), 0)
+    ImageDraw.Draw(mask).ellipse((0, 0, size - 1, size - 1), fill=255)
+    return mask
+
+
+def encode_image(image: PILImage, fmt: RenderFormat, quality: int) -> bytes:
+    """将卡片编码为指定格式
+
+    Args:
+        image: RGB 卡片图片
+        fmt: 编码格式
+        quality: jpeg 和 webp 的编码质量
+
+    Returns:
+        图片的字节数据
+    """
+    output = BytesIO()
+    match fmt:
+        case RenderFormat.png8:
+            # 卡片以文字和纯色为主, 256 色足够, 图片部分使用抖动
+            image = image.quantize(256, method=Image.Quantize.FASTOCTREE)
+            image.save(output, format="PNG", optimize=True)
+        case RenderFormat.jpeg:
+            # 不做色度抽样, 避免彩色文字边缘模糊
+            image.save(output, format="JPEG", quality=quality, optimize=True, subsampling=0)
+        case RenderFormat.webp:
+            image.save(output, format="WEBP", quality=quality, method=4)
+        case _:
+            image.save(output, format="PNG")
+    return output.getvalue()
+
+
+def _render_card(renderer_cls: type[CommonRenderer], card: CardData) -> bytes:
+    """在渲染线程或进程中绘制卡片"""
+    return renderer_cls().render_card(card)
+
+
+def _ping_render_process() -> None:
+    """空任务, 用于在启动时创建全部渲染进程"""
+
+
+_RENDER_EXECUTOR: Executor | None = None
+
+
+def get_render_executor() -> Executor:
+    """获取渲染线程池或进程池, 首次使用时创建"""
+    global _RENDER_EXECUTOR
+    if _RENDER_EXECUTOR is not None:
+        return _RENDER_EXECUTOR
+
+    workers = pconfig.render_workers
+    if pconfig.render_executor is RenderExecutor.process:
+        # 子进程需要继承已加载的插件配置和字体等资源, 仅支持 fork 启动方式
+        if "fork" in multiprocessing.get_all_start_methods():
+            _RENDER_EXECUTOR = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork"))
+            return _RENDER_EXECUTOR
+        logger.warning("当前平台不支持 fork 启动子进程, 使用线程池渲染")
+    _RENDER_EXECUTOR = ThreadPoolExecutor(workers, thread_name_prefix="parser-render")
+    return _RENDER_EXECUTOR
+
+
+async def start_render_executor():
+    """在 driver 启动时创建渲染池, 须在加载资源之后调用
+
+    fork 启动方式下, 进程池在首次提交任务时一次性创建全部子进程,
+    此时尚未开始解析和渲染, 主进程中没有持有锁的工作线程, 子进程直接继承已加载的资源
+    """
+    executor = get_render_executor()
+    if isinstance(executor, ProcessPoolExecutor):
+        await asyncio.wrap_future(executor.submit(_ping_render_process))
+
+
+def _warm_emoji_atlas(renderer_cls: type[CommonRenderer]) -> int:
+    """在渲染线程或进程中预加载 emoji 位图"""
+    return renderer_cls.warm_emoji_atlas()
+
+
+async def warm_emoji_atlas():
+    """预加载 emoji 位图, 在渲染池中进行, 不阻塞事件循环"""
+    executor = get_render_executor()
+    loop = asyncio.get_running_loop()
+    # 进程池中每个进程有独立的缓存, 提交与进程数相同的任务, 使各进程尽量都完成预加载
+    count = pconfig.render_workers if isinstance(executor, ProcessPoolExecutor) else 1
+    warmed = await asyncio.gather(
+        *(loop.run_in_executor(executor, _warm_emoji_atlas, CommonRenderer) for _ in range(count))
+    )
+    logger.debug(f"预加载 {max(warmed)} 个 emoji")
+
+
+def shutdown_render_executor():
+    """关闭渲染线程池或进程池"""
+    global _RENDER_EXECUTOR
+    if _RENDER_EXECUTOR is not None:
+        _RENDER_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        _RENDER_EXECUTOR = None
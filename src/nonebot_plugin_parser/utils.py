@@ -6,6 +6,7 @@ from typing import Any, TypeVar
 from pathlib import Path
 from collections import OrderedDict
 from urllib.parse import urlparse
+from collections.abc import Iterable, Iterator
 
 from nonebot import logger
 
@@ -28,6 +29,75 @@ class LimitedSizeDict(OrderedDict[K, V]):
             self.popitem(last=False)  # 移除最早添加的项
 
 
+def _trie_pattern(words: Iterable[str]) -> str:
+    """将关键词构建为前缀树形式的正则, 避免逐个尝试所有分支, 同一位置优先匹配最长的关键词"""
+    trie: dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie) or "(?!)"
+
+
+class KeyPatternMatcher:
+    """关键词 + 正则匹配器
+
+    所有关键词编译为一个前缀树正则, 一次扫描即可找出文本中出现的关键词,
+    再按关键词长 -> 短的顺序执行对应的正则
+    """
+
+    __slots__ = ("_patterns", "_prefixes", "_rank", "_regex")
+
+    def __init__(self, key_patterns: Iterable[tuple[str, re.Pattern[str]]]):
+        # 按关键词长 -> 短排序, 同一关键词可对应多个正则
+        self._patterns: dict[str, list[re.Pattern[str]]] = {}
+        for keyword, pattern in sorted(key_patterns, key=lambda x: -len(x[0])):
+            self._patterns.setdefault(keyword, []).append(pattern)
+        keywords = list(self._patterns)
+        self._rank = {keyword: rank for rank, keyword in enumerate(keywords)}
+        self._regex = re.compile(_trie_pattern(keywords))
+        # 记录每个关键词开头的更短关键词, 它们在同一位置同样出现
+        self._prefixes = {kw: [k for k in keywords if kw.startswith(k)] for kw in keywords}
+
+    def contains(self, text: str) -> bool:
+        """文本中是否含有任意关键词"""
+        return self._regex.search(text) is not None
+
+    def keywords(self, text: str) -> set[str]:
+        """找出文本中出现的所有关键词, 结果与逐个 `keyword in text` 相同"""
+        found: set[str] = set()
+        search = self._regex.search
+        matched = search(text)
+        while matched is not None:
+            found.update(self._prefixes[matched.group()])
+            # 从下一个字符继续搜索, 相互重叠的关键词也能被找到
+            matched = search(text, matched.start() + 1)
+        return found
+
+    def candidates(self, text: str) -> Iterator[tuple[str, re.Pattern[str]]]:
+        """按优先级返回文本中出现的关键词及其正则"""
+        if not (found := self.keywords(text)):
+            return iter(())
+        ordered = sorted(found, key=self._rank.__getitem__) if len(found) > 1 else found
+        return ((keyword, pattern) for keyword in ordered for pattern in self._patterns[keyword])
+
+    def search(self, text: str) -> tuple[str, re.Match[str]] | None:
+        """返回第一个匹配成功的关键词和匹配结果"""
+        for keyword, pattern in self.candidates(text):
+            if searched := pattern.search(text):
+                return keyword, searched
+        return None
+
+
 def keep_zh_en_num(text: str) -> str:
     """
     保留字符串中的中英文和数字
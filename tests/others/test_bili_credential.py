@@ -0,0 +1,57 @@
+import json
+from pathlib import Path
+
+
+async def test_credential_manager(tmp_path: Path, monkeypatch):
+    from bilibili_api import Credential
+
+    from nonebot_plugin_parser.config import pconfig
+    from nonebot_plugin_parser.parsers.bilibili.credential import CredentialManager
+
+    calls: list[str] = []
+    valid = True
+
+    async def check_valid(self) -> bool:
+        calls.append("check_valid")
+        return valid
+
+    async def check_refresh(self) -> bool:
+        calls.append("check_refresh")
+        return True
+
+    async def refresh(self):
+        calls.append("refresh")
+        self.sessdata = "refreshed"
+
+    monkeypatch.setattr(Credential, "check_valid", check_valid)
+    monkeypatch.setattr(Credential, "check_refresh", check_refresh)
+    monkeypatch.setattr(Credential, "refresh", refresh)
+    monkeypatch.setattr(pconfig, "parser_bili_ck", "SESSDATA=a; bili_jct=b; ac_time_value=c")
+
+    cookies_file = tmp_path / "bilibili_cookies.json"
+    manager = CredentialManager(cookies_file)
+
+    # 读取凭证不产生网络请求
+    credential = manager.credential
+    assert credential is not None
+    assert credential.sessdata == "a"
+    assert calls == []
+
+    # 后台校验, 刷新后写入文件
+    await manager.check()
+    assert calls == ["check_valid", "check_refresh", "refresh"]
+    assert json.loads(cookies_file.read_text())["SESSDATA"] == "refreshed"
+    assert manager.credential is credential
+
+    # 失效后解析时不再使用凭证
+    valid = False
+    monkeypatch.setattr(pconfig, "parser_bili_ck", None)
+    manager = CredentialManager(cookies_file)
+    assert manager.credential is not None
+    await manager.check()
+    assert manager.credential is None
+
+    # 扫码登录后更新
+    await manager.update(Credential(sessdata="new"))
+    assert manager.credential is not None
+    assert json.loads(cookies_file.read_text())["SESSDATA"] == "new"
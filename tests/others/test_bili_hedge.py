@@ -0,0 +1,121 @@
+import asyncio
+from pathlib import Path
+
+
+class FakeCapture:
+    def __init__(self, delay: float, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.started = False
+        self.cancelled = False
+
+    async def __call__(self) -> Path:
+        self.started = True
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.fail:
+            raise RuntimeError("screenshot failed")
+        return Path("screenshot.jpg")
+
+
+async def fake_api(delay: float, fail: bool = False, article: bool = False) -> dict | None:
+    await asyncio.sleep(delay)
+    if fail:
+        raise RuntimeError("api failed")
+    return None if article else {}
+
+
+async def test_hedge_screenshot(monkeypatch):
+    from nonebot_plugin_parser.config import pconfig
+    from nonebot_plugin_parser.parsers import BilibiliParser, bilibili
+    from nonebot_plugin_parser.constants import ScreenshotPolicy
+
+    parser = BilibiliParser()
+    monkeypatch.setattr(bilibili, "SCREENSHOT_POOL", object())
+    monkeypatch.setattr(pconfig, "parser_bili_screenshot_timeout", 0.1)
+
+    async def hedge(
+        policy: ScreenshotPolicy,
+        capture: FakeCapture,
+        api_delay: float,
+        api_fail: bool = False,
+        article: bool = False,
+    ):
+        monkeypatch.setattr(pconfig, "parser_bili_screenshot_policy", policy)
+        api_task = asyncio.create_task(fake_api(api_delay, api_fail, article))
+        img_path = await parser._hedge_screenshot(capture(), api_task)
+        await asyncio.gather(api_task, return_exceptions=True)
+        return img_path
+
+    # prefer: API 先完成也等待截图
+    capture = FakeCapture(0.02)
+    assert await hedge(ScreenshotPolicy.prefer, capture, 0) == Path("screenshot.jpg")
+
+    # prefer: 截图超时或失败时使用 API 结果, 超时的截图被取消
+    capture = FakeCapture(1)
+    assert await hedge(ScreenshotPolicy.prefer, capture, 0) is None
+    assert capture.cancelled
+    assert await hedge(ScreenshotPolicy.prefer, FakeCapture(0, fail=True), 0) is None
+
+    # prefer: API 返回 None (专栏) 时不再等待截图
+    capture = FakeCapture(1)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    assert await hedge(ScreenshotPolicy.prefer, capture, 0, article=True) is None
+    assert loop.time() - start < 0.05
+    assert capture.cancelled
+
+    # fastest: API 先完成时取消截图
+    capture = FakeCapture(0.05)
+    assert await hedge(ScreenshotPolicy.fastest, capture, 0) is None
+    assert capture.cancelled
+
+    # fastest: 截图先完成, 或 API 失败时继续等待截图
+    assert await hedge(ScreenshotPolicy.fastest, FakeCapture(0), 0.05) == Path("screenshot.jpg")
+    assert await hedge(ScreenshotPolicy.fastest, FakeCapture(0.05), 0, api_fail=True) == Path("screenshot.jpg")
+
+    # api: 不启动截图
+    capture = FakeCapture(0)
+    assert await hedge(ScreenshotPolicy.api, capture, 0) is None
+    assert not capture.started
+
+    # 未安装 htmlrender 时不启动截图
+    monkeypatch.setattr(bilibili, "SCREENSHOT_POOL", None)
+    capture = FakeCapture(0)
+    assert await hedge(ScreenshotPolicy.prefer, capture, 0) is None
+    assert not capture.started
+
+
+async def test_screenshot_cache(monkeypatch):
+    from nonebot_plugin_parser.config import pconfig
+    from nonebot_plugin_parser.parsers import BilibiliParser
+
+    parser = BilibiliParser()
+    calls: list[int] = []
+
+    async def capture(content_id: int) -> bytes:
+        calls.append(content_id)
+        await asyncio.sleep(0.05)
+        return f"jpeg-{len(calls)}".encode()
+
+    monkeypatch.setattr(pconfig, "parser_bili_screenshot_ttl", 60)
+    paths = await asyncio.gather(*(parser._screenshot("test", 114514, capture) for _ in range(5)))
+    try:
+        # 并发请求共享同一次截图
+        assert calls == [114514]
+        assert len(set(paths)) == 1
+        assert paths[0].read_bytes() == b"jpeg-1"
+
+        # 有效期内直接复用
+        assert await parser._screenshot("test", 114514, capture) == paths[0]
+        assert calls == [114514]
+
+        # 过期后重新截图
+        monkeypatch.setattr(pconfig, "parser_bili_screenshot_ttl", 0)
+        await parser._screenshot("test", 114514, capture)
+        assert paths[0].read_bytes() == b"jpeg-2"
+    finally:
+        paths[0].unlink(missing_ok=True)
@@ -0,0 +1,60 @@
+import asyncio
+from typing import Any
+
+
+class FakeVideo:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.calls: list[tuple[str, Any]] = []
+
+    async def get_info(self) -> dict[str, Any]:
+        self.calls.append(("get_info", None))
+        return {
+            "bvid": "BV17x411w7KC",
+            "cid": 1001,
+            "title": "title",
+            "desc": "desc",
+            "duration": 99999,
+            "owner": {"mid": 1, "name": "up", "face": "https://example.com/face.jpg"},
+            "stat": dict.fromkeys(("view", "danmaku", "reply", "favorite", "coin", "share", "like"), 0),
+            "pubdate": 1700000000,
+            "ctime": 1700000000,
+            "pages": [
+                {"cid": 1001, "part": "p1", "ctime": 1700000000, "duration": 99999},
+                {"cid": 1002, "part": "p2", "ctime": 1700000000, "duration": 99999},
+            ],
+        }
+
+    async def get_ai_conclusion(self, cid: int, up_mid: int) -> dict[str, Any]:
+        self.calls.append(("get_ai_conclusion", (cid, up_mid)))
+        await asyncio.sleep(self.delay)
+        return {"model_result": {"summary": "summary"}}
+
+
+async def test_parse_video_ai_summary_deadline(monkeypatch):
+    from nonebot_plugin_parser.config import pconfig
+    from nonebot_plugin_parser.parsers import Author, BilibiliParser
+
+    parser = BilibiliParser()
+    monkeypatch.setattr(BilibiliParser, "credential", property(lambda self: object()))
+    monkeypatch.setattr(parser, "create_author", lambda name, avatar_url=None, description=None: Author(name))
+    monkeypatch.setattr(pconfig, "parser_bili_ai_summary_timeout", 0.05)
+
+    # 超时后先返回结果, 总结作为补发信息
+    video = FakeVideo(delay=0.2)
+    monkeypatch.setattr(parser, "_get_video", lambda **_: asyncio.sleep(0, video))
+    result = await parser.parse_video(bvid="BV17x411w7KC", page_num=2)
+    assert result.extra_info is None
+    assert result.follow_up is not None
+    assert await result.follow_up == "AI总结: summary"
+    # cid 和 up 主 mid 取自视频信息, 不再单独请求
+    assert video.calls == [("get_info", None), ("get_ai_conclusion", (1002, 1))]
+    await asyncio.gather(result.contents[0].path_task, return_exceptions=True)
+
+    # 未超时则直接附带总结
+    video = FakeVideo(delay=0)
+    monkeypatch.setattr(parser, "_get_video", lambda **_: asyncio.sleep(0, video))
+    result = await parser.parse_video(bvid="BV17x411w7KC")
+    assert result.extra_info == "AI总结: summary"
+    assert result.follow_up is None
+    await asyncio.gather(result.contents[0].path_task, return_exceptions=True)
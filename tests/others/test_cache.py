@@ -0,0 +1,70 @@
+import os
+import time
+from pathlib import Path
+
+
+def test_disk_cache_path(tmp_path: Path):
+    from nonebot_plugin_parser.cache import DiskCache
+
+    cache = DiskCache(tmp_path, max_bytes=1024)
+    path = cache.path("video.mp4")
+    assert path.name == "video.mp4"
+    assert path.parent.parent == tmp_path
+    assert len(path.parent.name) == 2
+    # 分片目录在初始化时已创建
+    assert path.parent.is_dir()
+    # 相同文件名总是落在同一分片
+    assert cache.path("video.mp4") == path
+
+
+async def test_disk_cache_evict(tmp_path: Path):
+    from nonebot_plugin_parser.cache import DiskCache
+
+    cache = DiskCache(tmp_path, max_bytes=10_000, min_idle=60)
+    now = time.time()
+
+    def create(name: str, size: int, idle: float) -> Path:
+        path = cache.path(name)
+        path.write_bytes(b"\0" * size)
+        os.utime(path, (now - idle, now - idle))
+        return path
+
+    video = create("video.mp4", 6000, idle=3600)
+    image = create("image.jpg", 1000, idle=7200)
+    pinned = create("pinned.mp4", 4000, idle=7200)
+    recent = create("recent.mp4", 3000, idle=10)
+    # 旧版本遗留在根目录的文件也参与淘汰
+    legacy = tmp_path / "legacy.jpg"
+    legacy.write_bytes(b"\0" * 500)
+    os.utime(legacy, (now - 60, now - 60))
+
+    with cache.pin(pinned):
+        removed = await cache.evict()
+
+    # 大视频优先淘汰, 被引用和最近使用的文件保留
+    assert removed == [video]
+    assert image.exists()
+    assert pinned.exists()
+    assert recent.exists()
+    assert legacy.exists()
+
+    # 未超出容量时不淘汰
+    assert await cache.evict() == []
+
+
+async def test_disk_cache_touch(tmp_path: Path):
+    from nonebot_plugin_parser.cache import DiskCache
+
+    cache = DiskCache(tmp_path, max_bytes=1000, min_idle=60)
+    old = time.time() - 3600
+
+    first = cache.path("first.jpg")
+    second = cache.path("second.jpg")
+    for path in (first, second):
+        path.write_bytes(b"\0" * 600)
+        os.utime(path, (old, old))
+
+    # 访问过的文件不会被淘汰
+    cache.touch(first)
+    assert await cache.evict() == [second]
+    assert first.exists()
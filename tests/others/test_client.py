@@ -0,0 +1,118 @@
+async def test_http_client_registry():
+    import respx
+    from httpx import Limits, Cookies, Response
+
+    from nonebot_plugin_parser.parsers.base import HttpClientRegistry
+
+    registry = HttpClientRegistry(limits=Limits(max_connections=10))
+
+    with respx.mock:
+        route = respx.get("https://example.com/").mock(return_value=Response(200, text="ok"))
+
+        # 客户端关闭后连接池仍可复用, headers 和 cookies 互不影响
+        async with registry.client("test", headers={"User-Agent": "a"}, cookies=Cookies({"k": "v"})) as client:
+            assert (await client.get("https://example.com/")).text == "ok"
+        async with registry.client("test", headers={"User-Agent": "b"}) as client:
+            assert (await client.get("https://example.com/")).text == "ok"
+
+        first, second = route.calls
+        assert first.request.headers["User-Agent"] == "a"
+        assert first.request.headers["Cookie"] == "k=v"
+        assert second.request.headers["User-Agent"] == "b"
+        assert "Cookie" not in second.request.headers
+
+    # 相同平台和证书策略共享连接池
+    registry.client("test", verify=False)
+    assert len(registry._transports) == 2
+    registry.client("other")
+    assert len(registry._transports) == 3
+
+    await registry.aclose()
+    assert len(registry._transports) == 0
+
+
+async def test_http_client_env_proxy(monkeypatch):
+    import asyncio
+
+    import pytest
+    from httpx import Limits, ProxyError
+
+    from nonebot_plugin_parser.parsers.base import HttpClientRegistry
+
+    requests: list[bytes] = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        # 记录请求行, 拒绝 CONNECT, 普通 HTTP 请求直接响应
+        request_line = await reader.readline()
+        requests.append(request_line)
+        while (await reader.readline()) not in (b"\r\n", b""):
+            pass
+        status = b"403 Forbidden" if request_line.startswith(b"CONNECT") else b"200 OK"
+        writer.write(b"HTTP/1.1 " + status + b"\r\nContent-Length: 7\r\nConnection: close\r\n\r\nproxied")
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    proxy = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+    monkeypatch.setenv("HTTPS_PROXY", proxy)
+    monkeypatch.setenv("HTTP_PROXY", proxy)
+    monkeypatch.setenv("NO_PROXY", "localhost")
+    registry = HttpClientRegistry(limits=Limits(max_connections=10))
+
+    try:
+        # 未设置代理时使用环境变量中的代理
+        async with registry.client("test") as client:
+            with pytest.raises(ProxyError):
+                await client.get("https://example.com/")
+            assert (await client.get("http://example.com/")).text == "proxied"
+        assert requests == [b"CONNECT example.com:443 HTTP/1.1\r\n", b"GET http://example.com/ HTTP/1.1\r\n"]
+        assert ("test", True, proxy) in registry._transports
+
+        # 不信任环境变量时不使用代理
+        async with registry.client("test", trust_env=False) as client:
+            assert client._transport_for_url(client.base_url.join("https://example.com/")) is client._transport
+    finally:
+        await registry.aclose()
+        server.close()
+        await server.wait_closed()
+
+
+async def test_redirect_cache(tmp_path):
+    import asyncio
+
+    from nonebot_plugin_parser.parsers.base import RedirectCache
+
+    path = tmp_path / "redirects.json"
+    cache = RedirectCache(ttl=60, path=path)
+    calls = 0
+
+    async def fetch() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "https://www.bilibili.com/video/BV17x411w7KC"
+
+    key = cache.key("https://b23.tv/abc", {"User-Agent": "ua"}, follow=False)
+    # 并发请求同一短链只请求一次
+    targets = await asyncio.gather(*(cache.resolve(key, "https://b23.tv/abc", fetch) for _ in range(3)))
+    assert set(targets) == {"https://www.bilibili.com/video/BV17x411w7KC"}
+    assert calls == 1
+    assert await cache.resolve(key, "https://b23.tv/abc", fetch) == targets[0]
+    assert calls == 1
+
+    # 持久化后重新加载
+    await cache.save()
+    reloaded = RedirectCache(ttl=60, path=path)
+    assert await reloaded.resolve(key, "https://b23.tv/abc", fetch) == targets[0]
+    assert calls == 1
+
+    # 未发生重定向时不缓存
+    async def no_redirect() -> str:
+        nonlocal calls
+        calls += 1
+        return "https://b23.tv/none"
+
+    other = cache.key("https://b23.tv/none", {}, follow=False)
+    await cache.resolve(other, "https://b23.tv/none", no_redirect)
+    await cache.resolve(other, "https://b23.tv/none", no_redirect)
+    assert calls == 3
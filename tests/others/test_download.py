@@ -1,3 +1,4 @@
+import pytest
 from nonebot import logger
 
 
@@ -40,3 +41,232 @@ def test_limited_size_dict():
     for i in range(20, 30):
         limited_size_dict[f"test{i}"] = f"test{i}"
     assert len(limited_size_dict) == 20
+
+
+async def test_single_flight():
+    import asyncio
+
+    from nonebot_plugin_parser.download.task import SingleFlight
+
+    flights = SingleFlight[str, int]()
+    calls = 0
+    release = asyncio.Event()
+
+    async def work() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 42
+
+    # 相同 key 的并发调用只执行一次
+    tasks = [asyncio.create_task(flights.do("key", work)) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert "key" in flights
+
+    # 取消其中一个调用者, 不影响其他调用者
+    tasks[0].cancel()
+    await asyncio.sleep(0)
+    release.set()
+    assert await asyncio.gather(*tasks[1:]) == [42, 42]
+    assert tasks[0].cancelled()
+    assert calls == 1
+    assert "key" not in flights
+
+
+async def test_single_flight_cancel_all():
+    import asyncio
+
+    from nonebot_plugin_parser.download.task import SingleFlight
+
+    flights = SingleFlight[str, None]()
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def work() -> None:
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    tasks = [asyncio.create_task(flights.do("key", work)) for _ in range(2)]
+    await started.wait()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    # 所有调用者都被取消, 共享任务也被取消
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert len(flights) == 0
+
+
+async def test_streamd_resume_part():
+    import respx
+    from httpx import Response
+
+    from nonebot_plugin_parser.cache import DISK_CACHE
+    from nonebot_plugin_parser.download import DOWNLOADER
+
+    url = "https://example.com/resume/video.mp4"
+    content = bytes(range(256)) * 64
+    file_path = DISK_CACHE.path("test_resume.mp4")
+    part_path = file_path.with_name(f"{file_path.name}.part")
+    file_path.unlink(missing_ok=True)
+    part_path.write_bytes(content[:1000])
+
+    def handler(request):
+        assert request.headers["Range"] == "bytes=1000-"
+        return Response(206, content=content[1000:], headers={"Content-Range": f"bytes 1000-/{len(content)}"})
+
+    with respx.mock:
+        respx.get(url).mock(side_effect=handler)
+        path = await DOWNLOADER.streamd(url, file_name=file_path.name)
+
+    assert path == file_path
+    assert path.read_bytes() == content
+    assert not part_path.exists()
+    path.unlink()
+
+
+@pytest.mark.parametrize("support_range", [True, False])
+async def test_streamd_segments(monkeypatch: pytest.MonkeyPatch, support_range: bool):
+    import re
+
+    import respx
+    from httpx import Response
+
+    from nonebot_plugin_parser.cache import DISK_CACHE
+    from nonebot_plugin_parser.config import pconfig
+    from nonebot_plugin_parser.download import DOWNLOADER
+
+    monkeypatch.setattr(pconfig, "parser_download_segments", 4)
+    monkeypatch.setattr(pconfig, "parser_segment_threshold", 0)
+
+    url = "https://example.com/segments/video.mp4"
+    content = bytes(range(256)) * 41
+    file_path = DISK_CACHE.path(f"test_segments_{support_range}.mp4")
+    file_path.unlink(missing_ok=True)
+    range_requests: list[str] = []
+
+    def handler(request):
+        headers = {"Accept-Ranges": "bytes"}
+        if support_range and (matched := re.match(r"bytes=(\d+)-(\d+)", request.headers.get("Range", ""))):
+            range_requests.append(matched.group(0))
+            start, end = int(matched.group(1)), int(matched.group(2))
+            return Response(206, content=content[start : end + 1], headers=headers)
+        return Response(200, content=content, headers=headers)
+
+    with respx.mock:
+        respx.get(url).mock(side_effect=handler)
+        path = await DOWNLOADER.streamd(url, file_name=file_path.name)
+
+    assert path.read_bytes() == content
+    assert len(range_requests) == (4 if support_range else 0)
+    path.unlink()
+
+
+async def test_streamd_segments_host_limit(monkeypatch: pytest.MonkeyPatch):
+    import re
+
+    import respx
+    from httpx import Response
+
+    from nonebot_plugin_parser.cache import DISK_CACHE
+    from nonebot_plugin_parser.config import pconfig
+    from nonebot_plugin_parser.download import DOWNLOADER
+    from nonebot_plugin_parser.download.scheduler import DownloadScheduler
+
+    monkeypatch.setattr(pconfig, "parser_download_segments", 4)
+    monkeypatch.setattr(pconfig, "parser_segment_threshold", 0)
+    scheduler = DownloadScheduler(max_concurrency=8, max_host_concurrency=2)
+    monkeypatch.setattr(DOWNLOADER, "scheduler", scheduler)
+
+    url = "https://example.com/segments/limited.mp4"
+    content = bytes(range(256)) * 41
+    file_path = DISK_CACHE.path("test_segments_limited.mp4")
+    file_path.unlink(missing_ok=True)
+    range_requests: list[str] = []
+    host_active: list[int] = []
+
+    def handler(request):
+        if matched := re.match(r"bytes=(\d+)-(\d+)", request.headers.get("Range", "")):
+            range_requests.append(matched.group(0))
+            host_active.append(scheduler.active)
+            start, end = int(matched.group(1)), int(matched.group(2))
+            return Response(206, content=content[start : end + 1], headers={"Accept-Ranges": "bytes"})
+        return Response(200, content=content, headers={"Accept-Ranges": "bytes"})
+
+    with respx.mock:
+        respx.get(url).mock(side_effect=handler)
+        path = await DOWNLOADER.streamd(url, file_name=file_path.name)
+
+    # 分段数不超过单个 host 的并发上限, 各段都占用调度器槽位
+    assert path.read_bytes() == content
+    assert len(range_requests) == 2
+    assert max(host_active) <= 2
+    assert scheduler.active == 0
+    path.unlink()
+
+
+async def test_download_scheduler():
+    import asyncio
+
+    from nonebot_plugin_parser.download.scheduler import Priority, DownloadScheduler
+
+    scheduler = DownloadScheduler(max_concurrency=2, max_host_concurrency=1)
+    order: list[str] = []
+    release = asyncio.Event()
+
+    async def download(url: str, priority: Priority):
+        async with scheduler.slot(url, priority):
+            order.append(url)
+            await release.wait()
+
+    # 同一 host 受 host 并发限制, 不同 host 可以并发
+    blockers = [
+        asyncio.create_task(download("https://a.com/0", Priority.IMAGE)),
+        asyncio.create_task(download("https://a.com/1", Priority.IMAGE)),
+        asyncio.create_task(download("https://b.com/0", Priority.IMAGE)),
+    ]
+    await asyncio.sleep(0)
+    assert order == ["https://a.com/0", "https://b.com/0"]
+    assert scheduler.active == 2
+    assert scheduler.pending == 1
+
+    # 等待中的下载按优先级出队
+    waiters = [
+        asyncio.create_task(download("https://c.com/video", Priority.VIDEO)),
+        asyncio.create_task(download("https://d.com/card", Priority.CARD)),
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*blockers, *waiters)
+    assert order[2:] == ["https://d.com/card", "https://a.com/1", "https://c.com/video"]
+    assert scheduler.active == 0
+    assert scheduler.pending == 0
+
+
+async def test_download_scheduler_cancel():
+    import asyncio
+
+    from nonebot_plugin_parser.download.scheduler import Priority, DownloadScheduler
+
+    scheduler = DownloadScheduler(max_concurrency=1, max_host_concurrency=1)
+    release = asyncio.Event()
+
+    async def download(url: str):
+        async with scheduler.slot(url, Priority.IMAGE):
+            await release.wait()
+
+    running = asyncio.create_task(download("https://a.com/0"))
+    waiting = asyncio.create_task(download("https://b.com/0"))
+    await asyncio.sleep(0)
+    assert scheduler.pending == 1
+
+    # 取消等待中的下载, 不占用槽位
+    waiting.cancel()
+    await asyncio.gather(waiting, return_exceptions=True)
+    assert scheduler.pending == 0
+    release.set()
+    await running
+    assert scheduler.active == 0
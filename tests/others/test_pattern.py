@@ -38,3 +38,164 @@ def test_pattern_matching():
         for url in failed_urls:
             logger.error(f"- {url}")
         pytest.fail(f"共有 {len(failed_urls)} 个 URL 未能匹配成功，请检查日志。")
+
+
+@pytest.mark.parametrize(
+    ("parser_name", "urls", "expected"),
+    [
+        (
+            "BilibiliParser",
+            [
+                "BV17x411w7KC",
+                "av170001",
+                "https://www.bilibili.com/video/BV17x411w7KC",
+                "https://m.bilibili.com/video/av170001?p=1",
+            ],
+            "bilibili:video:BV17x411w7KC:1",
+        ),
+        (
+            "DouyinParser",
+            [
+                "https://www.douyin.com/video/7521023890996514083",
+                "https://www.iesdouyin.com/share/video/7521023890996514083/?region=CN",
+                "https://jingxuan.douyin.com/m/note/7521023890996514083?app=yumme",
+            ],
+            "douyin:aweme:7521023890996514083",
+        ),
+        (
+            "WeiBoParser",
+            [
+                "https://m.weibo.cn/detail/5234367615996775",
+                "https://weibo.com/7207262816/Qeq3Dpa2b",
+            ],
+            "weibo:status:Qeq3Dpa2b",
+        ),
+    ],
+)
+def test_resource_id(parser_name: str, urls: list[str], expected: str):
+    from nonebot_plugin_parser import parsers
+
+    parser = getattr(parsers, parser_name)()
+    for url in urls:
+        keyword, searched = parser.search_url(url)
+        assert str(parser.get_resource_id(keyword, searched)) == expected, url
+
+
+def test_resource_id_short_link():
+    from nonebot_plugin_parser.parsers import BilibiliParser
+
+    parser = BilibiliParser()
+    keyword, searched = parser.search_url("https://b23.tv/abcdefg")
+    # 短链需要重定向后才能确定资源
+    assert parser.get_resource_id(keyword, searched) is None
+
+
+def test_search_all(monkeypatch):
+    from nonebot_plugin_parser.config import pconfig
+    from nonebot_plugin_parser.parsers import BaseParser
+    from nonebot_plugin_parser.matchers.rule import (
+        PSR_SEARCHED_KEY,
+        PSR_SEARCHED_ALL_KEY,
+        KeyPatternList,
+        KeywordRegexRule,
+    )
+
+    monkeypatch.setattr(pconfig, "parser_max_links", 3)
+    patterns = [p for _cls in BaseParser.get_all_subclass() for p in _cls._key_patterns]
+    rule = KeywordRegexRule(KeyPatternList(*patterns))
+
+    text = (
+        "看看 https://www.bilibili.com/video/BV17x411w7KC 和 "
+        "https://www.douyin.com/video/7521023890996514083 还有 "
+        "https://www.bilibili.com/video/av170001"
+    )
+    state = {}
+    assert rule._search_all(text, state)
+    searched_all = state[PSR_SEARCHED_ALL_KEY]
+    matched = [sr.searched.group(0) for sr in searched_all]
+    # 按出现顺序排列, 同一链接不会被多个关键词重复匹配
+    assert matched == [
+        "bilibili.com/video/BV17x411w7KC",
+        "douyin.com/video/7521023890996514083",
+        "bilibili.com/video/av170001",
+    ]
+    assert state[PSR_SEARCHED_KEY] is searched_all[0]
+    assert not rule._search_all("没有链接", {})
+
+
+def test_key_pattern_matcher():
+    import random
+    from timeit import timeit
+
+    from nonebot_plugin_parser.utils import KeyPatternMatcher
+    from nonebot_plugin_parser.parsers import BaseParser
+
+    patterns = [p for _cls in BaseParser.get_all_subclass() for p in _cls._key_patterns]
+    patterns.sort(key=lambda x: len(x[0]), reverse=True)
+    keywords = {keyword for keyword, _ in patterns}
+    matcher = KeyPatternMatcher(patterns)
+
+    def linear_search(text: str):
+        for keyword, pattern in patterns:
+            if keyword in text and (searched := pattern.search(text)):
+                return keyword, searched
+        return None
+
+    urls_file = Path(__file__).parent / "test_urls.md"
+    lines = urls_file.read_text("utf-8").splitlines()
+    urls = [line.removeprefix("-").strip() for line in lines if line.startswith("-")]
+    # 随机拼接关键词片段, 覆盖关键词相互重叠的情况
+    random.seed(0)
+    pieces = [*keywords, "https://", "/video/", "BV17x411w7KC", "av170001", "随便聊聊", " "]
+    texts = urls + ["".join(random.choices(pieces, k=random.randint(1, 6))) for _ in range(2000)]
+
+    for text in texts:
+        assert matcher.keywords(text) == {k for k in keywords if k in text}, text
+        expected, actual = linear_search(text), matcher.search(text)
+        assert (expected and (expected[0], expected[1].span())) == (actual and (actual[0], actual[1].span())), text
+
+    # 微基准: 普通聊天消息与含链接消息
+    samples = {
+        "chat": "今天晚上吃什么呢, 我觉得火锅不错, 大家怎么看? hello everyone, lol",
+        "link": "看看这个 https://www.bilibili.com/video/BV17x411w7KC?p=1 很好看",
+    }
+    for name, text in samples.items():
+        before = timeit(lambda: linear_search(text), number=10000) / 10000 * 1e6
+        after = timeit(lambda: matcher.search(text), number=10000) / 10000 * 1e6
+        logger.info(f"[{name}] linear: {before:.2f}us, matcher: {after:.2f}us")
+
+
+async def test_prefilter(monkeypatch):
+    from nonebot_plugin_alconna.uniseg import At, Text, Hyper, UniMessage
+
+    from nonebot_plugin_parser.config import pconfig
+    from nonebot_plugin_parser.parsers import BaseParser
+    from nonebot_plugin_parser.matchers import rule as rule_module
+    from nonebot_plugin_parser.matchers.rule import KeyPatternList, PrefilterStats, KeywordRegexRule
+
+    monkeypatch.setattr(rule_module, "PREFILTER_STATS", stats := PrefilterStats())
+    patterns = [p for _cls in BaseParser.get_all_subclass() for p in _cls._key_patterns]
+    rule = KeywordRegexRule(KeyPatternList(*patterns))
+
+    # 不含关键词的消息被直接拒绝
+    assert not await rule(UniMessage("今天吃什么"), {})
+    assert not await rule(UniMessage([At("user", "1")]), {})
+    assert stats.rejected == 2
+
+    # 关键词被其他消息段分隔时, 依然按拼接后的纯文本判断
+    state = {}
+    assert await rule(UniMessage([Text("BV17x4"), Text("11w7KC")]), state)
+    assert state[rule_module.PSR_SEARCHED_KEY].searched.group("bvid") == "BV17x411w7KC"
+
+    # 含关键词但不是链接的消息由完整规则判断, 卡片消息总是通过预过滤
+    assert not await rule(UniMessage("have a nice day"), {})
+    assert not await rule(UniMessage(Hyper("json", raw="{}")), {})
+    assert (stats.checked, stats.rejected, stats.unmatched) == (5, 2, 2)
+    assert stats.reject_ratio == 0.4
+
+    # 强制解析前缀
+    monkeypatch.setattr(pconfig, "parser_force_prefix", "解析")
+    state = {}
+    assert await rule(UniMessage("解析 https://www.bilibili.com/video/BV17x411w7KC"), state)
+    assert state[rule_module.PSR_FORCE_PARSE_KEY] is True
+    logger.info(stats)
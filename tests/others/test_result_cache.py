@@ -0,0 +1,134 @@
+import time
+import asyncio
+from pathlib import Path
+
+
+def _build_result(tmp_path: Path):
+    from nonebot_plugin_parser.parsers import Author, Platform, ParseResult, ImageContent, VideoContent
+
+    avatar = tmp_path / "avatar.jpg"
+    video = tmp_path / "video.mp4"
+    cover = tmp_path / "cover.jpg"
+    image = tmp_path / "image.jpg"
+    for path in (avatar, video, cover, image):
+        path.write_bytes(b"\0")
+
+    async def resolved(path: Path) -> Path:
+        return path
+
+    return ParseResult(
+        platform=Platform(name="bilibili", display_name="哔哩哔哩"),
+        author=Author(name="author", avatar=asyncio.create_task(resolved(avatar))),
+        title="title",
+        timestamp=1700000000,
+        url="https://www.bilibili.com/video/BV1xx411c7mD",
+        contents=[VideoContent(video, cover=cover, duration=60.0)],
+        extra={"info": "summary"},
+        repost=ParseResult(
+            platform=Platform(name="bilibili", display_name="哔哩哔哩"),
+            text="repost",
+            contents=[ImageContent(asyncio.create_task(resolved(image)))],
+        ),
+    )
+
+
+async def test_result_cache_persist(tmp_path: Path):
+    from nonebot_plugin_parser.parsers import VideoContent
+    from nonebot_plugin_parser.matchers.cache import ResultCache
+
+    result = _build_result(tmp_path)
+    await asyncio.sleep(0)
+    await ResultCache(tmp_path / "results").set("key", result, ttl=60)
+
+    # 模拟重启后从磁盘加载
+    cache = ResultCache(tmp_path / "results")
+    loaded = await cache.get("key")
+    assert loaded is not None
+    assert loaded.title == "title"
+    assert loaded.extra == {"info": "summary"}
+    assert loaded.author
+    assert loaded.author.avatar == tmp_path / "avatar.jpg"
+    video = loaded.contents[0]
+    assert isinstance(video, VideoContent)
+    assert video.path_task == tmp_path / "video.mp4"
+    assert video.cover == tmp_path / "cover.jpg"
+    assert video.duration == 60.0
+    assert loaded.repost
+    assert loaded.repost.contents[0].path_task == tmp_path / "image.jpg"
+
+    # 引用的媒体文件被淘汰后视为未命中
+    (tmp_path / "image.jpg").unlink()
+    assert await ResultCache(tmp_path / "results").get("key") is None
+
+
+async def test_result_cache_gif(tmp_path: Path):
+    from nonebot_plugin_parser.parsers import Platform, ParseResult, DynamicContent
+    from nonebot_plugin_parser.matchers.cache import ResultCache
+
+    video = tmp_path / "dynamic.mp4"
+    gif = tmp_path / "dynamic.gif"
+    for path in (video, gif):
+        path.write_bytes(b"\0")
+
+    async def resolved(path: Path) -> Path:
+        return path
+
+    gif_task = asyncio.create_task(resolved(gif))
+    result = ParseResult(
+        platform=Platform(name="twitter", display_name="小蓝鸟"),
+        contents=[DynamicContent(asyncio.create_task(resolved(video)), gif_path=gif_task)],
+    )
+    await asyncio.sleep(0)
+    await ResultCache(tmp_path / "results").set("key", result, ttl=60)
+
+    # 转换完成的 GIF 在重启后依然可用
+    loaded = await ResultCache(tmp_path / "results").get("key")
+    assert loaded is not None
+    dynamic = loaded.contents[0]
+    assert isinstance(dynamic, DynamicContent)
+    assert dynamic.path_task == video
+    assert await dynamic.get_gif_path() == gif
+
+    # GIF 被淘汰后视为未命中
+    gif.unlink()
+    assert await ResultCache(tmp_path / "results").get("key") is None
+
+
+async def test_result_cache_expire(tmp_path: Path, monkeypatch):
+    from nonebot_plugin_parser.matchers.cache import ResultCache
+
+    cache = ResultCache(tmp_path / "results")
+    result = _build_result(tmp_path)
+    await asyncio.sleep(0)
+    await cache.set("key", result, ttl=10)
+    assert await cache.get("key") is result
+    assert await cache.purge() == 0
+
+    # 内存中的结果引用的媒体文件被淘汰后视为未命中
+    (tmp_path / "avatar.jpg").unlink()
+    assert await cache.get("key") is None
+    (tmp_path / "avatar.jpg").write_bytes(b"\0")
+    await cache.set("key", result, ttl=10)
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 60)
+    assert await cache.get("key") is None
+    await cache.set("other", result, ttl=10)
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    assert await cache.purge() == 1
+
+
+async def test_result_cache_unresolved(tmp_path: Path):
+    from nonebot_plugin_parser.parsers import Platform, ParseResult, ImageContent
+    from nonebot_plugin_parser.matchers.cache import ResultCache
+
+    async def failed() -> Path:
+        raise RuntimeError
+
+    task = asyncio.create_task(failed())
+    await asyncio.gather(task, return_exceptions=True)
+    result = ParseResult(platform=Platform(name="weibo", display_name="微博"), contents=[ImageContent(task)])
+
+    # 媒体下载失败的结果仅缓存在内存中
+    await ResultCache(tmp_path / "results").set("key", result, ttl=60)
+    assert await ResultCache(tmp_path / "results").get("key") is None
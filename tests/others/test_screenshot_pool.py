@@ -0,0 +1,89 @@
+import asyncio
+from typing import Any
+
+
+class FakePage:
+    def __init__(self, context: "FakeContext"):
+        self.context = context
+
+    async def close(self):
+        if self.context.broken:
+            raise RuntimeError("page crashed")
+
+
+class FakeContext:
+    def __init__(self, browser: "FakeBrowser"):
+        self.browser = browser
+        self.cookies: list[dict[str, Any]] = []
+        self.closed = False
+        self.broken = False
+
+    async def add_cookies(self, cookies: list[dict[str, Any]]):
+        self.cookies.extend(cookies)
+
+    async def clear_cookies(self):
+        self.cookies.clear()
+
+    async def new_page(self) -> FakePage:
+        return FakePage(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts: list[FakeContext] = []
+
+    def is_connected(self) -> bool:
+        return True
+
+    async def new_context(self, **_) -> FakeContext:
+        context = FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+
+async def test_context_pool():
+    from nonebot_plugin_parser.parsers.bilibili.screenshot import ContextPool
+
+    browser = FakeBrowser()
+    cookies = [{"name": "SESSDATA", "value": "a", "domain": ".bilibili.com", "path": "/"}]
+
+    async def get_browser() -> FakeBrowser:
+        return browser
+
+    pool = ContextPool(2, get_browser, lambda: cookies)  # pyright: ignore[reportArgumentType]
+    await pool.warm()
+    assert len(browser.contexts) == 2
+    assert all(context.cookies == cookies for context in browser.contexts)
+
+    # 并发数受池大小限制, 上下文被复用
+    running = peak = 0
+
+    async def capture():
+        nonlocal running, peak
+        async with pool.page():
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(capture() for _ in range(6)))
+    assert peak == 2
+    assert len(browser.contexts) == 2
+
+    # Cookie 变化后更新已有上下文
+    cookies = [{"name": "SESSDATA", "value": "b", "domain": ".bilibili.com", "path": "/"}]
+    async with pool.page() as page:
+        assert page.context.cookies == cookies  # pyright: ignore[reportAttributeAccessIssue]
+        # 页面崩溃的上下文被丢弃
+        page.context.broken = True  # pyright: ignore[reportAttributeAccessIssue]
+    assert page.context.closed  # pyright: ignore[reportAttributeAccessIssue]
+
+    # 浏览器重启后重建上下文
+    browser = FakeBrowser()
+    async with pool.page() as page:
+        assert page.context.browser is browser  # pyright: ignore[reportAttributeAccessIssue]
+
+    await pool.aclose()
@@ -0,0 +1,63 @@
+from io import BytesIO
+from timeit import timeit
+from pathlib import Path
+
+from nonebot import logger
+
+
+def _make_avatar(path: Path, seed: int) -> Path:
+    from PIL import Image
+
+    Image.effect_noise((480, 480), 40 + seed).convert("RGB").save(path)
+    return path
+
+
+def test_avatar_cache(tmp_path: Path, monkeypatch):
+    from nonebot_plugin_parser.utils import LimitedSizeDict
+    from nonebot_plugin_parser.renders.common import CommonRenderer, _circle_mask
+
+    monkeypatch.setattr(CommonRenderer, "_avatar_cache", LimitedSizeDict(max_size=2))
+    renderer = CommonRenderer()
+    processed: list[object] = []
+    process_avatar = renderer._process_avatar
+
+    def counting_process(avatar):
+        processed.append(avatar)
+        return process_avatar(avatar)
+
+    monkeypatch.setattr(renderer, "_process_avatar", counting_process)
+
+    first = _make_avatar(tmp_path / "first.jpg", 0)
+    avatar = renderer._load_and_process_avatar(first)
+    assert avatar is not None
+    assert avatar.size == (renderer.AVATAR_SIZE, renderer.AVATAR_SIZE)
+
+    # 内容相同的头像文件复用缓存, 不再解码
+    copy = tmp_path / "copy.jpg"
+    copy.write_bytes(first.read_bytes())
+    assert renderer._load_and_process_avatar(copy) is avatar
+    assert len(processed) == 1
+
+    # 超出容量淘汰最久未使用的
+    for i in range(1, 3):
+        renderer._load_and_process_avatar(_make_avatar(tmp_path / f"{i}.jpg", i))
+    assert len(processed) == 3
+    assert renderer._load_and_process_avatar(first) is not avatar
+    assert len(processed) == 4
+
+    assert renderer._load_and_process_avatar(tmp_path / "missing.jpg") is None
+    assert _circle_mask(renderer.AVATAR_SIZE) is _circle_mask(renderer.AVATAR_SIZE)
+
+
+def test_avatar_cache_benchmark(tmp_path: Path):
+    from nonebot_plugin_parser.renders.common import CommonRenderer
+
+    renderer = CommonRenderer()
+    avatar = _make_avatar(tmp_path / "avatar.jpg", 0)
+    renderer._load_and_process_avatar(avatar)
+
+    number = 20
+    before = timeit(lambda: renderer._process_avatar(BytesIO(avatar.read_bytes())), number=number) / number * 1e3
+    after = timeit(lambda: renderer._load_and_process_avatar(avatar), number=number) / number * 1e3
+    logger.info(f"avatar: process {before:.2f}ms, cached {after:.2f}ms")
+    assert after < before
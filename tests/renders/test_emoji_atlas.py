@@ -0,0 +1,125 @@
+import os
+from pathlib import Path
+
+
+def _make_emojis(emoji_dir: Path, emojis: str) -> None:
+    from PIL import Image
+
+    emoji_dir.mkdir(parents=True, exist_ok=True)
+    for i, emoji in enumerate(emojis):
+        path = emoji_dir / f"{emoji}.png"
+        Image.new("RGBA", (72, 72), (30 * i, 120, 200, 255)).save(path)
+        # 越靠后的 emoji 越新
+        os.utime(path, (1700000000 + i, 1700000000 + i))
+
+
+def test_emoji_atlas(tmp_path: Path):
+    from nonebot_plugin_parser.renders.common import EmojiAtlas
+
+    _make_emojis(tmp_path, "😀😂🤣👍")
+    atlas = EmojiAtlas(tmp_path, "facebook", max_size=4)
+
+    # 预加载 2 个字号, 容量只够最新的 2 个 emoji
+    assert atlas.warm((24, 32)) == 2
+    assert len(atlas) == 4
+
+    image = atlas.get("👍", 24)
+    assert image is not None
+    assert image.width == image.height <= 24
+    # 命中时不再读取文件
+    (tmp_path / "👍.png").unlink()
+    assert atlas.get("👍", 24) is image
+
+    # 超出容量淘汰最久未使用的
+    assert atlas.get("😀", 40) is not None
+    assert len(atlas) == 4
+    assert atlas.get("👍", 24) is image
+    (tmp_path / "🤣.png").unlink()
+    assert atlas.get("🤣", 24) is None
+
+    # 文件不存在或损坏时返回 None, 且不缓存
+    assert atlas.get("🥲", 24) is None
+    (tmp_path / "🥲.png").write_bytes(b"broken")
+    assert atlas.get("🥲", 24) is None
+    assert len(atlas) == 4
+
+
+def test_emoji_atlas_disabled(tmp_path: Path):
+    from nonebot_plugin_parser.renders.common import EmojiAtlas
+
+    _make_emojis(tmp_path, "😀")
+    atlas = EmojiAtlas(tmp_path, "facebook", max_size=0)
+    assert atlas.warm((24,)) == 0
+    assert atlas.get("😀", 24) is not None
+    assert len(atlas) == 0
+
+
+def test_svg_emoji_atlas(monkeypatch):
+    from types import SimpleNamespace
+
+    from PIL import Image
+
+    from nonebot_plugin_parser.renders import common
+
+    rasterized: list[tuple[str, float]] = []
+
+    def get_emoji_image(emoji: str, width: float, height: float):
+        rasterized.append((emoji, width))
+        return Image.new("RGBA", (round(width), round(height)))
+
+    monkeypatch.setattr(common, "emosvg", SimpleNamespace(get_emoji_image=get_emoji_image))
+    atlas = common.SvgEmojiAtlas(max_size=4)
+
+    # SVG 只光栅化一次, 尺寸与 emosvg.text 一致
+    image = atlas.get("😀", 30)
+    assert image is not None
+    assert image.size == (33, 33)
+    assert atlas.get("😀", 30) is image
+    assert rasterized == [("😀", 30 * common.SvgEmojiAtlas.SCALE)]
+    assert atlas.warm((30,)) == 0
+
+
+def test_svg_emoji_text():
+    import pytest
+
+    emosvg = pytest.importorskip("emosvg")
+    from PIL import Image, ImageDraw
+
+    from nonebot_plugin_parser.renders.common import CardData, RenderContext, SvgEmojiAtlas, CommonRenderer
+
+    assert isinstance(CommonRenderer.emoji_atlas, SvgEmojiAtlas)
+    lines = ["hello 😀 world 👍🏻", "中文🇨🇳测试 👨‍👩‍👧", "plain"]
+    for font in (CommonRenderer.fontset.text, CommonRenderer.fontset.title):
+        expected = Image.new("RGB", (800, 200), "white")
+        emosvg.text(expected, (20, 10), lines, font.font, fill=font.fill, line_height=font.line_height)
+
+        # 使用位图缓存绘制, 结果与 emosvg.text 一致
+        image = Image.new("RGB", (800, 200), "white")
+        ctx = RenderContext(CardData("bilibili"), 800, 750, image, ImageDraw.Draw(image))
+        CommonRenderer._text_with_svg_emojis(ctx, (20, 10), lines, font)
+        assert image.tobytes() == expected.tobytes()
+
+
+async def test_warm_emoji_atlas(monkeypatch):
+    import threading
+
+    from nonebot_plugin_parser.config import pconfig
+    from nonebot_plugin_parser.renders import common
+    from nonebot_plugin_parser.constants import RenderExecutor
+
+    threads: list[str] = []
+
+    def warm(cls) -> int:
+        threads.append(threading.current_thread().name)
+        return 0
+
+    monkeypatch.setattr(pconfig, "parser_render_executor", RenderExecutor.thread)
+    monkeypatch.setattr(common, "_RENDER_EXECUTOR", None)
+    monkeypatch.setattr(common.CommonRenderer, "warm_emoji_atlas", classmethod(warm))
+    try:
+        # 预加载在渲染线程中进行, 不阻塞事件循环
+        await common.warm_emoji_atlas()
+        assert len(threads) == 1
+        assert threads[0].startswith("parser-render")
+    finally:
+        common.shutdown_render_executor()
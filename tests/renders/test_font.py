@@ -26,3 +26,24 @@ def test_cjk_width():
             count += 1
     cjk_count = ord("\u9fff") - ord("\u4e00") + 1
     logger.info(f"CJK 字符数: {cjk_count}，不等于 CJK 宽度的字符数: {count}，占比: {count / cjk_count:.2%}")
+
+
+def test_width_table():
+    from timeit import timeit
+
+    from nonebot_plugin_parser.renders import CommonRenderer
+
+    fontset = CommonRenderer.fontset
+    chars = ["A", "中", "，", "。", "…", "Ａ", "한", "あ", "★", "😀", "𠀀"]
+    # 各字体的宽度表互相独立, 查表结果与直接计算一致
+    for font in (fontset.name, fontset.title, fontset.text, fontset.extra, fontset.indicator):
+        for char in chars:
+            bbox = font.font.getbbox(char)
+            assert font.get_char_width(char) == int(bbox[2] - bbox[0])
+        assert font.get_char_width_fast("中") == font.cjk_width
+        assert font.get_text_width("A中😀") == sum(font.get_char_width_fast(char) for char in "A中😀")
+
+    font = fontset.text
+    text = "中文内容, English text！★😀" * 200
+    elapsed = timeit(lambda: font.get_text_width(text), number=100) / 100 * 1e3
+    logger.info(f"get_text_width {len(text)} chars: {elapsed:.3f}ms")
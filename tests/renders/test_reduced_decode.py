@@ -0,0 +1,94 @@
+import os
+import time
+import multiprocessing
+from pathlib import Path
+from collections.abc import Callable
+
+import pytest
+from nonebot import logger
+
+CONTENT_WIDTH = 750
+
+
+def _make_photo(path: Path, size: tuple[int, int]):
+    """生成带噪声的大图, 模拟手机原图"""
+    from PIL import Image
+
+    noise = Image.effect_noise(size, 48)
+    gradient = Image.linear_gradient("L").resize(size)
+    Image.merge("RGB", (noise, gradient, gradient.transpose(Image.Transpose.FLIP_LEFT_RIGHT))).save(path, quality=90)
+
+
+@pytest.fixture(scope="module")
+def photo(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("reduced_decode") / "photo.jpg"
+    _make_photo(path, (4000, 6000))
+    return path
+
+
+def _full_decode(path: Path, max_size: int):
+    """原实现: 完整解码后裁剪并以 LANCZOS 缩放"""
+    from PIL import Image
+
+    from nonebot_plugin_parser.renders.common import CommonRenderer
+
+    with Image.open(path) as img:
+        return CommonRenderer()._crop_to_square(img).resize((max_size, max_size), Image.Resampling.LANCZOS)
+
+
+def _measure(func: Callable[[], object], queue) -> None:
+    import resource
+
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((elapsed, (after - before) / 1024))
+
+
+def _run_forked(func: Callable[[], object]) -> tuple[float, float]:
+    """在子进程中执行, 返回耗时(秒)和峰值内存增量(MB)"""
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    process = ctx.Process(target=_measure, args=(func, queue))
+    process.start()
+    result = queue.get(timeout=120)
+    process.join()
+    return result
+
+
+def test_reduced_decode(photo: Path):
+    from PIL import ImageStat, ImageChops
+
+    from nonebot_plugin_parser.renders.common import CommonRenderer
+
+    renderer = CommonRenderer()
+
+    # 九宫格缩略图尺寸与完整解码一致, 像素差异可忽略
+    reduced = renderer._load_and_process_grid_image(photo, CONTENT_WIDTH, 9)
+    assert reduced is not None
+    full = _full_decode(photo, reduced.width)
+    assert reduced.size == full.size
+    diff = ImageStat.Stat(ImageChops.difference(reduced.convert("RGB"), full.convert("RGB"))).mean
+    assert max(diff) < 8
+
+    cover = renderer._load_and_resize_cover(photo, CONTENT_WIDTH)
+    assert cover is not None
+    assert cover.height == renderer.MAX_COVER_HEIGHT
+
+
+@pytest.mark.skipif(not os.getenv("PARSER_BENCHMARK"), reason="基准测试, 设置 PARSER_BENCHMARK=1 时运行")
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="需要 fork")
+def test_reduced_decode_benchmark(photo: Path):
+    from nonebot_plugin_parser.renders.common import CommonRenderer
+
+    renderer = CommonRenderer()
+    max_size = renderer.IMAGE_3_GRID_SIZE
+
+    # 一张卡片包含 9 张 4000x6000 的图片
+    before = _run_forked(lambda: [_full_decode(photo, max_size) for _ in range(9)])
+    after = _run_forked(lambda: [renderer._load_and_process_grid_image(photo, CONTENT_WIDTH, 9) for _ in range(9)])
+    logger.info(f"full decode: {before[0]:.3f}s, peak +{before[1]:.1f}MB")
+    logger.info(f"reduced decode: {after[0]:.3f}s, peak +{after[1]:.1f}MB")
+    assert after[0] < before[0]
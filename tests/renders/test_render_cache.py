@@ -0,0 +1,113 @@
+import asyncio
+from pathlib import Path
+
+
+def _make_result(tmp_path: Path, text: str = "正文内容"):
+    from PIL import Image
+
+    from nonebot_plugin_parser.parsers import Author, Platform, ParseResult, ImageContent
+    from nonebot_plugin_parser.constants import PlatformEnum
+
+    image_path = tmp_path / "image.png"
+    if not image_path.exists():
+        Image.new("RGB", (64, 64), (40, 80, 160)).save(image_path)
+    return ParseResult(
+        platform=Platform(name=PlatformEnum.BILIBILI, display_name="哔哩哔哩"),
+        author=Author("作者"),
+        title="标题",
+        text=text,
+        timestamp=1700000000,
+        contents=[ImageContent(image_path)],
+    )
+
+
+async def test_render_cache(tmp_path: Path):
+    from nonebot_plugin_parser.renders.base import ImageRenderer
+
+    renders: list[str | None] = []
+
+    class FakeRenderer(ImageRenderer):
+        async def render_image(self, result) -> bytes:
+            renders.append(result.text)
+            await asyncio.sleep(0.05)
+            return b"\x89PNG" + str(len(renders)).encode()
+
+    renderer = FakeRenderer()
+    results = [_make_result(tmp_path) for _ in range(3)]
+    fingerprint = await renderer.fingerprint(results[0])
+    assert fingerprint is not None
+    try:
+        # 不同的解析结果对象, 内容相同时并发请求只渲染一次
+        await asyncio.gather(*(renderer.cache_or_render_image(result) for result in results))
+        assert renders == ["正文内容"]
+        paths = {result.render_image for result in results}
+        assert len(paths) == 1
+        image_path = paths.pop()
+        assert image_path is not None
+        assert image_path.name == f"{fingerprint}.png"
+
+        # 重启或重新解析后直接使用磁盘上的卡片
+        result = _make_result(tmp_path)
+        await renderer.cache_or_render_image(result)
+        assert result.render_image == image_path
+        assert renders == ["正文内容"]
+
+        # 内容变化时重新渲染
+        result = _make_result(tmp_path, "其他内容")
+        await renderer.cache_or_render_image(result)
+        assert result.render_image != image_path
+        assert renders == ["正文内容", "其他内容"]
+        assert result.render_image is not None
+        result.render_image.unlink()
+    finally:
+        image_path.unlink(missing_ok=True)
+
+
+async def test_render_fingerprint(tmp_path: Path, monkeypatch):
+    from nonebot_plugin_parser.config import pconfig
+    from nonebot_plugin_parser.parsers import ImageContent
+    from nonebot_plugin_parser.renders import CommonRenderer
+    from nonebot_plugin_parser.constants import RenderFormat
+
+    renderer = CommonRenderer()
+    result = _make_result(tmp_path)
+    fingerprint = await renderer.fingerprint(result)
+    assert fingerprint == await renderer.fingerprint(_make_result(tmp_path))
+
+    # 附加信息, 媒体和渲染配置都参与指纹计算
+    result.extra["info"] = "附加信息"
+    assert await renderer.fingerprint(result) != fingerprint
+    result.extra.clear()
+
+    result.contents[0] = ImageContent(tmp_path / "missing.png")
+    assert await renderer.fingerprint(result) != fingerprint
+    result.contents[0] = ImageContent(tmp_path / "image.png")
+
+    monkeypatch.setattr(pconfig, "parser_render_format", RenderFormat.jpeg)
+    assert await renderer.fingerprint(result) != fingerprint
+
+    # 媒体获取失败时不复用卡片
+    async def failed() -> Path:
+        raise RuntimeError("download failed")
+
+    result.contents.append(ImageContent(asyncio.create_task(failed())))
+    assert await renderer.fingerprint(result) is None
+
+
+async def test_render_fingerprint_drawn_images(tmp_path: Path):
+    from nonebot_plugin_parser.parsers import ImageContent
+    from nonebot_plugin_parser.renders import CommonRenderer
+
+    renderer = CommonRenderer()
+    result = _make_result(tmp_path)
+    result.contents *= CommonRenderer.MAX_IMAGES_DISPLAY
+    fingerprint = await renderer.fingerprint(result)
+    assert fingerprint is not None
+
+    # 超出绘制数量的图片不等待下载, 只有数量参与指纹计算
+    never = asyncio.get_running_loop().create_future()
+    result.contents.append(ImageContent(asyncio.ensure_future(never)))
+    more = await asyncio.wait_for(renderer.fingerprint(result), 1)
+    assert more is not None
+    assert more != fingerprint
+    never.cancel()
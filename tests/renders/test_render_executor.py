@@ -0,0 +1,76 @@
+from io import BytesIO
+from pathlib import Path
+
+
+def _make_images(tmp_path: Path) -> list[Path]:
+    from PIL import Image
+
+    paths = []
+    for i, size in enumerate(((640, 480), (300, 900), (512, 512), (1200, 300))):
+        path = tmp_path / f"{i}.png"
+        Image.new("RGB", size, (40 * i, 80, 160)).save(path)
+        paths.append(path)
+    return paths
+
+
+def _make_result(tmp_path: Path):
+    from nonebot_plugin_parser.parsers import Author, Platform, ParseResult, ImageContent
+    from nonebot_plugin_parser.constants import PlatformEnum
+
+    avatar, *images = _make_images(tmp_path)
+    platform = Platform(name=PlatformEnum.BILIBILI, display_name="哔哩哔哩")
+    repost = ParseResult(platform=platform, author=Author("原作者"), text="原动态内容 " * 20)
+    return ParseResult(
+        platform=platform,
+        author=Author("作者", avatar=avatar),
+        title="标题",
+        text="正文内容，包含中文和 English words。" * 10,
+        timestamp=1700000000,
+        contents=[ImageContent(path) for path in images],
+        repost=repost,
+    )
+
+
+async def test_render_executor(tmp_path: Path, monkeypatch):
+    from PIL import Image
+
+    from nonebot_plugin_parser.config import pconfig
+    from nonebot_plugin_parser.renders import common
+    from nonebot_plugin_parser.constants import RenderExecutor
+
+    renderer = common.CommonRenderer()
+    result = _make_result(tmp_path)
+
+    rendered: dict[RenderExecutor, bytes] = {}
+    for executor in RenderExecutor:
+        monkeypatch.setattr(pconfig, "parser_render_executor", executor)
+        monkeypatch.setattr(common, "_RENDER_EXECUTOR", None)
+        try:
+            rendered[executor] = await renderer.render_image(result)
+        finally:
+            common.shutdown_render_executor()
+
+    with Image.open(BytesIO(rendered[RenderExecutor.thread])) as image:
+        assert image.format == "PNG"
+        assert image.width == renderer.DEFAULT_CARD_WIDTH
+    # 线程池和进程池的渲染结果一致
+    assert rendered[RenderExecutor.thread] == rendered[RenderExecutor.process]
+
+
+async def test_start_render_executor(monkeypatch):
+    from concurrent.futures import ProcessPoolExecutor
+
+    from nonebot_plugin_parser.config import pconfig
+    from nonebot_plugin_parser.renders import common
+    from nonebot_plugin_parser.constants import RenderExecutor
+
+    monkeypatch.setattr(pconfig, "parser_render_executor", RenderExecutor.process)
+    monkeypatch.setattr(common, "_RENDER_EXECUTOR", None)
+    try:
+        # 启动时即创建全部渲染进程, 不等到首次渲染
+        await common.start_render_executor()
+        executor = common.get_render_executor()
+        assert isinstance(executor, ProcessPoolExecutor)
+        assert len(executor._processes) == pconfig.render_workers
+    finally:
+        common.shutdown_render_executor()
@@ -0,0 +1,75 @@
+import time
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from nonebot import logger
+
+
+def _make_photo(path: Path, size: tuple[int, int]) -> Path:
+    """生成带噪声的照片, 模拟真实封面和配图"""
+    from PIL import Image
+
+    noise = Image.effect_noise(size, 48)
+    gradient = Image.linear_gradient("L").resize(size)
+    Image.merge("RGB", (noise, gradient, gradient.transpose(Image.Transpose.FLIP_LEFT_RIGHT))).save(path, quality=90)
+    return path
+
+
+@pytest.fixture(scope="module")
+def cards(tmp_path_factory: pytest.TempPathFactory) -> dict:
+    from nonebot_plugin_parser.renders.common import CardData
+
+    tmp_path = tmp_path_factory.mktemp("render_format")
+    avatar = _make_photo(tmp_path / "avatar.jpg", (200, 200))
+    cover = _make_photo(tmp_path / "cover.jpg", (1920, 1080))
+    images = [_make_photo(tmp_path / f"{i}.jpg", (1080, 1440)) for i in range(9)]
+    text = "正文内容，包含中文和 English words，用于测试长文本卡片的编码体积。" * 30
+
+    def card(**kwargs) -> CardData:
+        return CardData(platform="bilibili", author="作者", avatar=avatar, time="2024-01-01 00:00", **kwargs)
+
+    return {
+        "text": card(title="纯文本", text=text),
+        "cover": card(title="带封面的视频", text=text, cover=cover),
+        "grid": card(title="九宫格", text=text[:200], images=images, image_total=9),
+    }
+
+
+@pytest.mark.parametrize("fmt", ["png", "png8", "jpeg", "webp"])
+def test_render_format(fmt: str):
+    from PIL import Image
+
+    from nonebot_plugin_parser.constants import RenderFormat
+    from nonebot_plugin_parser.renders.base import ImageRenderer
+    from nonebot_plugin_parser.renders.common import encode_image
+
+    image = Image.new("RGB", (320, 240), (255, 255, 255))
+    raw = encode_image(image, RenderFormat(fmt), 85)
+    with Image.open(BytesIO(raw)) as decoded:
+        assert decoded.size == image.size
+        assert decoded.format == {"png8": "PNG"}.get(fmt, fmt.upper())
+    assert ImageRenderer._image_suffix(raw) == {"jpeg": ".jpg", "webp": ".webp"}.get(fmt, ".png")
+
+
+def test_render_format_benchmark(cards: dict):
+    from PIL import Image
+
+    from nonebot_plugin_parser.constants import RenderFormat
+    from nonebot_plugin_parser.renders.common import CommonRenderer, encode_image
+
+    renderer = CommonRenderer()
+    for name, card in cards.items():
+        image = renderer._create_card_image(card)
+        sizes: dict[RenderFormat, int] = {}
+        for fmt in RenderFormat:
+            start = time.perf_counter()
+            raw = encode_image(image, fmt, 85)
+            elapsed = (time.perf_counter() - start) * 1e3
+            sizes[fmt] = len(raw)
+            with Image.open(BytesIO(raw)) as decoded:
+                assert decoded.size == image.size
+            logger.info(f"{name} {image.size} {fmt.value}: {len(raw) / 1024:.1f}KB, {elapsed:.1f}ms")
+        # 有损格式均小于无损 PNG
+        assert sizes[RenderFormat.jpeg] < sizes[RenderFormat.png]
+        assert sizes[RenderFormat.webp] < sizes[RenderFormat.png]
@@ -0,0 +1,102 @@
+import random
+from timeit import timeit
+
+from nonebot import logger
+
+
+def _wrap_text_reference(text: str, max_width: int, font_info) -> list[str]:
+    """原 CommonRenderer._wrap_text 实现, 用于校验输出一致"""
+    import emoji
+
+    if not text:
+        return []
+
+    def is_punctuation(char: str) -> bool:
+        return char in "，。！？；：、）】》〉」』〕〗〙〛…—·,.;:!?)]}"
+
+    lines: list[str] = []
+    for paragraph in text.splitlines():
+        if not paragraph:
+            lines.append("")
+            continue
+
+        emoji_list = emoji.emoji_list(paragraph)
+        current_line = ""
+        current_line_width = 0
+        idx = 0
+        while idx < len(paragraph):
+            for emoji_data in emoji_list:
+                if emoji_data["match_start"] == idx:
+                    char = emoji_data["emoji"]
+                    idx = emoji_data["match_end"]
+                    char_width = font_info.font.size
+                    break
+            else:
+                char = paragraph[idx]
+                idx += 1
+                char_width = font_info.get_char_width_fast(char)
+
+            if not current_line:
+                current_line = char
+                current_line_width = char_width
+                continue
+            if len(char) == 1 and is_punctuation(char):
+                current_line += char
+                current_line_width += char_width
+                continue
+            test_width = current_line_width + char_width
+            if test_width <= max_width:
+                current_line += char
+                current_line_width = test_width
+            else:
+                lines.append(current_line)
+                current_line = char
+                current_line_width = char_width
+
+        if current_line:
+            lines.append(current_line)
+
+    return lines
+
+
+_ALPHABET = (
+    list("中文测试换行渲染卡片")
+    + list("abcdefgXYZ 0123")
+    + list("，。！？；：、）】》…—·,.;:!?)]}")
+    + ["😀", "👍🏻", "👨‍👩‍👧", "🇨🇳", "❤️", "\n", "\n\n", "​", "\t"]
+)
+
+
+def _random_text(rng: random.Random, length: int) -> str:
+    return "".join(rng.choice(_ALPHABET) for _ in range(length))
+
+
+def test_wrap_text_equivalence():
+    from nonebot_plugin_parser.renders import CommonRenderer
+
+    renderer = CommonRenderer()
+    fontset = CommonRenderer.fontset
+    rng = random.Random(114514)
+
+    cases = ["", "\n", "。。。", "😀" * 50, "a" * 1000, "，" + "中" * 40 + "。" * 5]
+    cases += [_random_text(rng, rng.randint(1, 300)) for _ in range(120)]
+    for text in cases:
+        for font_info in (fontset.text, fontset.title, fontset.extra):
+            for max_width in (1, 24, 100, 750):
+                expected = _wrap_text_reference(text, max_width, font_info)
+                assert renderer._wrap_text(text, max_width, font_info) == expected, (text, max_width)
+
+
+def test_wrap_text_benchmark():
+    from nonebot_plugin_parser.renders import CommonRenderer
+
+    renderer = CommonRenderer()
+    font_info = CommonRenderer.fontset.text
+    rng = random.Random(1919810)
+
+    # 长帖子, 约 1/5 为 emoji
+    text = "".join(rng.choice(("中文内容", "English ", "，", "😀", "👍🏻")) for _ in range(4000))
+    assert renderer._wrap_text(text, 750, font_info) == _wrap_text_reference(text, 750, font_info)
+    before = timeit(lambda: _wrap_text_reference(text, 750, font_info), number=3) / 3 * 1e3
+    after = timeit(lambda: renderer._wrap_text(text, 750, font_info), number=3) / 3 * 1e3
+    logger.info(f"wrap {len(text)} chars: reference {before:.2f}ms, linear {after:.2f}ms")